@@ -1,100 +1,169 @@
+import queue
+import threading
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox, ttk
 import numpy as np
 
-# --- FUNGSI LOGIKA PERHITUNGAN MATRIKS ---
+from eliminasi import eliminasi_gauss, format_klasifikasi, klasifikasi_rref
+import hybrid
+from incremental import IncrementalSolver
 
-def eliminasi_gauss(matrix, make_one=False, jordan=False):
+# Selang waktu (ms) pemeriksaan antrian hasil dari thread pekerja
+POLL_MS = 50
+
+
+class Dibatalkan(Exception):
+    """Raised from the progress callback after the user pressed Batal"""
+
+
+class DaftarLangkah:
     """
-    Fungsi umum untuk semua jenis eliminasi Gauss
-    make_one: True untuk Satu Utama, False untuk OBE biasa
-    jordan: True untuk Gauss-Jordan, False untuk Gauss biasa
+    Steps of a StepTrace followed by extra (title, text) entries. Matrices are
+    rebuilt from the trace only for the range that is asked for.
     """
-    mat = np.copy(matrix).astype(np.float64)
-    num_rows, num_cols = mat.shape
-    pivot_row = 0
-    langkah_langkah = [("Matriks Awal:", mat.copy())]
-
-    # Forward elimination
-    for j in range(num_cols):
-        if pivot_row >= num_rows:
-            break
-
-        # Cari pivot terbesar (partial pivoting)
-        max_row = max(range(pivot_row, num_rows), 
-                     key=lambda i: abs(mat[i, j]))
-        
-        if abs(mat[max_row, j]) < 1e-10:
-            continue
-
-        # Tukar baris jika perlu
-        if max_row != pivot_row:
-            mat[[pivot_row, max_row]] = mat[[max_row, pivot_row]]
-            langkah_langkah.append((f"Tukar baris {pivot_row+1} dan {max_row+1}:", mat.copy()))
-
-        # Buat pivot menjadi 1 jika diminta
-        if make_one:
-            pivot_val = mat[pivot_row, j]
-            if abs(pivot_val - 1.0) > 1e-10:
-                mat[pivot_row] = mat[pivot_row] / pivot_val
-                langkah_langkah.append((f"R{pivot_row+1} = R{pivot_row+1}/{pivot_val:.2f}:", mat.copy()))
-
-        # Eliminasi di bawah pivot
-        rows_to_eliminate = range(num_rows) if jordan else range(pivot_row + 1, num_rows)
-        for i in rows_to_eliminate:
-            if i != pivot_row and abs(mat[i, j]) > 1e-10:
-                faktor = mat[i, j] / mat[pivot_row, j]
-                mat[i] = mat[i] - faktor * mat[pivot_row]
-                langkah_langkah.append((f"R{i+1} = R{i+1} - ({faktor:.2f})*R{pivot_row+1}:", mat.copy()))
-
-        pivot_row += 1
-
-    # Atasi nilai yang sangat kecil mendekati nol
-    mat[np.abs(mat) < 1e-10] = 0
-    
-    # Tentukan judul hasil akhir berdasarkan jenis eliminasi
-    if jordan:
-        hasil = "Hasil Akhir (Eliminasi Gauss-Jordan):"
-    elif make_one:
-        hasil = "Hasil Akhir (Eliminasi Gauss dengan Satu Utama):"
-    else:
-        hasil = "Hasil Akhir (Eliminasi Gauss/OBE):"
-    langkah_langkah.append((hasil, mat.copy()))
-    
-    return mat, langkah_langkah
-
-def analisis_solusi(matrix):
+
+    def __init__(self, trace, tambahan=()):
+        self.trace = trace
+        self.tambahan = list(tambahan)
+
+    def __len__(self):
+        return len(self.trace) + len(self.tambahan)
+
+    def ambil(self, start, stop):
+        """(description, rows or text) for steps start..stop-1"""
+        n = len(self.trace)
+        yield from self.trace.rows_between(start, min(stop, n))
+        for k in range(max(start, n), min(stop, len(self))):
+            yield self.tambahan[k - n]
+
+    def teks(self, index):
+        """Searchable text of one step without building its matrix"""
+        n = len(self.trace)
+        if index < n:
+            return self.trace.description(index)
+        judul, isi = self.tambahan[index - n]
+        return f"{judul}\n{isi}"
+
+
+class StepViewer(ttk.Frame):
     """
-    Menganalisis jenis solusi dari matriks augmented
+    Step list that only formats the steps in the viewport. The scrollbar
+    counts steps, not pixels, so opening a trace with thousands of steps
+    costs the same as opening a short one.
     """
-    # Dapatkan bentuk tereduksi
-    rref_matrix, _ = eliminasi_gauss(matrix, make_one=True, jordan=True)
-    num_rows, num_cols = rref_matrix.shape
-    num_vars = num_cols - 1
-
-    # Cek inkonsistensi
-    for i in range(num_rows):
-        row = rref_matrix[i, :]
-        if np.all(np.abs(row[:num_vars]) < 1e-10) and abs(row[-1]) > 1e-10:
-            return f"Tidak Ada Solusi.\nTerjadi inkonsistensi pada baris {i+1} (0 = {row[-1]:.2f})."
-
-    # Hitung rank efektif
-    rank = sum(1 for i in range(num_rows) 
-              if not np.all(np.abs(rref_matrix[i, :]) < 1e-10))
-
-    # Analisis tipe solusi
-    if rank < num_vars:
-        return f"Solusi Tak Hingga Banyak.\nJumlah variabel ({num_vars}) > Rank matriks ({rank})."
-    
-    # Jika sampai di sini, solusi unik
-    solusi = []
-    for i in range(rank):
-        pivot_col = next((j for j in range(num_vars) 
-                         if abs(rref_matrix[i, j]) > 1e-10), -1)
-        if pivot_col != -1:
-            solusi.append(f"x{pivot_col+1} = {rref_matrix[i, -1]:.2f}")
-
-    return "Solusi Unik (Tunggal).\n" + "\n".join(solusi)
+
+    def __init__(self, parent, langkah, format_matrix):
+        super().__init__(parent)
+        self.langkah = langkah
+        self.format_matrix = format_matrix
+        self.awal = 0
+        self.terlihat = 1
+
+        alat = ttk.Frame(self)
+        alat.pack(fill="x", padx=10, pady=(10, 0))
+        ttk.Label(alat, text="Ke langkah:").pack(side="left")
+        self.entry_langkah = ttk.Entry(alat, width=6)
+        self.entry_langkah.pack(side="left", padx=2)
+        self.entry_langkah.bind("<Return>", self.lompat)
+        ttk.Button(alat, text="Buka", command=self.lompat).pack(side="left", padx=(2, 10))
+        ttk.Label(alat, text="Cari:").pack(side="left")
+        self.entry_cari = ttk.Entry(alat, width=20)
+        self.entry_cari.pack(side="left", padx=2)
+        self.entry_cari.bind("<Return>", self.cari)
+        ttk.Button(alat, text="Berikutnya", command=self.cari).pack(side="left", padx=2)
+        self.status = ttk.Label(alat)
+        self.status.pack(side="right")
+
+        isi = ttk.Frame(self)
+        isi.pack(fill="both", expand=True, padx=10, pady=10)
+        self.scrollbar = ttk.Scrollbar(isi, orient="vertical", command=self.gulir)
+        self.scrollbar.pack(side="right", fill="y")
+        self.text = tk.Text(isi, wrap="none", font=("Courier New", 10), height=25, width=80)
+        self.text.pack(side="left", fill="both", expand=True)
+        self.text.tag_configure("bold", font=("Courier New", 10, "bold"))
+        self.text.tag_configure("result", font=("Courier New", 10, "italic"))
+        self.text.tag_configure("found", background="#fff3b0")
+
+        self.text.bind("<Configure>", lambda event: self.render())
+        self.text.bind("<MouseWheel>", self.roda)
+        self.text.bind("<Button-4>", lambda event: self.gulir("scroll", -1, "units"))
+        self.text.bind("<Button-5>", lambda event: self.gulir("scroll", 1, "units"))
+        self.text.bind("<Prior>", lambda event: self.gulir("scroll", -1, "pages"))
+        self.text.bind("<Next>", lambda event: self.gulir("scroll", 1, "pages"))
+        self.render()
+
+    def gulir(self, aksi, jumlah, satuan=None):
+        """Scrollbar command: 'moveto' fraction or 'scroll' n units (steps) / pages"""
+        if aksi == "moveto":
+            awal = int(float(jumlah) * len(self.langkah))
+        elif satuan == "pages":
+            awal = self.awal + int(jumlah) * max(self.terlihat - 1, 1)
+        else:
+            awal = self.awal + int(jumlah)
+        self.tampilkan_dari(awal)
+
+    def roda(self, event):
+        self.gulir("scroll", -1 if event.delta > 0 else 1, "units")
+        return "break"
+
+    def tampilkan_dari(self, awal, sorot=None):
+        self.awal = max(0, min(awal, len(self.langkah) - 1))
+        self.render(sorot)
+
+    def render(self, sorot=None):
+        """Format and insert only the steps from self.awal that fit in the widget"""
+        tinggi = self.text.winfo_height()
+        if tinggi > 1:
+            baris_layar = tinggi // tkfont.Font(font=self.text.cget("font")).metrics("linespace")
+        else:
+            baris_layar = int(self.text.cget("height"))
+
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        baris = jumlah = 0
+        n = len(self.langkah)
+        for deskripsi, konten in self.langkah.ambil(self.awal, n):
+            if jumlah and baris >= baris_layar:
+                break
+            index = self.awal + jumlah
+            self.text.insert(tk.END, f"{index + 1}. {deskripsi}\n",
+                             ("bold", "found") if index == sorot else "bold")
+            if isinstance(konten, str):  # String untuk hasil analisis
+                self.text.insert(tk.END, konten + "\n\n", "result")
+                baris += konten.count("\n") + 3
+            else:
+                teks = self.format_matrix(konten)
+                self.text.insert(tk.END, teks + "\n\n")
+                baris += teks.count("\n") + 3
+            jumlah += 1
+        self.text.config(state="disabled")  # Buat read-only
+
+        self.terlihat = jumlah
+        if n:
+            self.scrollbar.set(self.awal / n, (self.awal + jumlah) / n)
+            self.status.config(text=f"Langkah {self.awal + 1}-{self.awal + jumlah} dari {n}")
+
+    def lompat(self, event=None):
+        try:
+            nomor = int(self.entry_langkah.get())
+        except ValueError:
+            self.status.config(text="Nomor langkah tidak valid")
+            return
+        self.tampilkan_dari(nomor - 1, sorot=nomor - 1)
+
+    def cari(self, event=None):
+        """Next step after the first visible one whose description contains the text"""
+        kata = self.entry_cari.get().strip().lower()
+        n = len(self.langkah)
+        if not kata or not n:
+            return
+        for k in range(1, n + 1):
+            index = (self.awal + k) % n
+            if kata in self.langkah.teks(index).lower():
+                self.tampilkan_dari(index, sorot=index)
+                return
+        self.status.config(text=f"\"{kata}\" tidak ditemukan")
 
 
 # --- KELAS UNTUK ANTARMUKA PENGGUNA (GUI) ---
@@ -108,6 +177,13 @@ class App(tk.Tk):
         self.entries = []
         self.rows = 0
         self.cols = 0
+        self.solver = None
+        self.tugas = None
+        # Analisis cepat di thread pekerja: tugas yang berjalan, permintaan yang menunggu,
+        # dan generasi grid (hasil dari grid lama dibuang)
+        self.tugas_cepat = None
+        self.cepat_tertunda = False
+        self.generasi = 0
 
         self.create_widgets_ukuran()
 
@@ -187,9 +263,18 @@ class App(tk.Tk):
 
                 entry = ttk.Entry(matrix_frame, width=5)
                 entry.grid(row=i, column=j*2 + (1 if j == self.cols - 1 else 0), padx=5, pady=5)
+                entry.bind("<FocusOut>", self.analisis_cepat)
+                entry.bind("<Return>", self.analisis_cepat)
                 row_entries.append(entry)
             self.entries.append(row_entries)
 
+        # Analisis cepat, diperbarui setiap kali elemen selesai diubah
+        self.solver = None
+        self.generasi += 1
+        self.live_label = ttk.Label(main_frame, text="Analisis cepat: isi semua elemen dengan angka.",
+                                    justify="left")
+        self.live_label.pack(pady=5)
+
         # Frame untuk tombol aksi
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(pady=20, fill="x", expand=True)
@@ -220,6 +305,84 @@ class App(tk.Tk):
             messagebox.showerror("Error", "Pastikan semua input adalah angka dan tidak ada yang kosong.")
             return None
 
+    def baca_angka(self):
+        """Entries as numbers (int when possible, so integer systems stay exact), or None"""
+        matrix = []
+        try:
+            for i in range(self.rows):
+                row = []
+                for j in range(self.cols):
+                    teks = self.entries[i][j].get().strip()
+                    try:
+                        row.append(int(teks))
+                    except ValueError:
+                        row.append(float(teks))
+                matrix.append(row)
+            return matrix
+        except ValueError:
+            return None
+
+    def analisis_cepat(self, event=None):
+        matrix = self.baca_angka()
+        if matrix is None:
+            self.live_label.config(text="Analisis cepat: isi semua elemen dengan angka.")
+            return
+        # Satu analisis cepat pada satu waktu; perubahan selama itu dianalisis sesudahnya
+        if self.tugas_cepat is not None and self.tugas_cepat.is_alive():
+            self.cepat_tertunda = True
+            return
+
+        # Faktorisasi awal dan faktorisasi ulang O(n^3) tidak dijalankan di thread Tk.
+        # Selama thread berjalan, self.solver hanya dipakai oleh thread itu
+        solver, generasi = self.solver, self.generasi
+        antrian = queue.Queue()
+        self.tugas_cepat = self.mulai_thread(lambda progress: self.perbarui_solver(solver, matrix), antrian)
+        self.after(POLL_MS, self.periksa_cepat, antrian, generasi)
+
+    @staticmethod
+    def perbarui_solver(solver, matrix):
+        """Apply the edit to solver (or build a new one); returns (solver, text). Worker thread."""
+        # Satu elemen berubah: pembaruan rank-1 pada faktor yang disimpan (incremental.py)
+        if solver is not None:
+            lama = solver.matrix()
+            berubah = [(i, j) for i in range(len(matrix)) for j in range(len(matrix[0]))
+                       if matrix[i][j] != lama[i][j]]
+            if len(berubah) == 1:
+                i, j = berubah[0]
+                solver.set_cell(i, j, matrix[i][j])
+            elif berubah:
+                solver = None
+        if solver is None:
+            solver = IncrementalSolver(matrix)
+
+        inkonsisten, x = solver.solve()
+        if inkonsisten:
+            teks = "Tidak ada solusi."
+        elif x is None:
+            teks = "Solusi tak hingga banyak."
+        else:
+            teks = "Solusi unik: " + ", ".join(
+                f"x{j+1} = {v}" if solver.exact else f"x{j+1} = {v:.6g}" for j, v in enumerate(x))
+        return solver, teks
+
+    def periksa_cepat(self, antrian, generasi):
+        try:
+            pesan = antrian.get_nowait()
+        except queue.Empty:
+            self.after(POLL_MS, self.periksa_cepat, antrian, generasi)
+            return
+        if generasi != self.generasi:
+            # Grid sudah diganti (ukuran baru) selama perhitungan
+            return
+        if pesan[0] == 'selesai':
+            self.solver, teks = pesan[1]
+        else:
+            self.solver, teks = None, str(pesan[1])
+        self.live_label.config(text="Analisis cepat: " + teks)
+        if self.cepat_tertunda:
+            self.cepat_tertunda = False
+            self.analisis_cepat()
+
     def format_matrix(self, matrix):
         s = ""
         for row in matrix:
@@ -227,39 +390,103 @@ class App(tk.Tk):
         return s.strip()
 
     def tampilkan_hasil(self, title, steps):
+        """Result window for a DaftarLangkah; only the visible steps are formatted"""
         hasil_window = tk.Toplevel(self)
         hasil_window.title(title)
+        StepViewer(hasil_window, steps, self.format_matrix).pack(fill="both", expand=True)
+
+    # --- Perhitungan di thread pekerja (jendela tetap responsif) ---
+
+    def jalankan(self, judul, hitung, selesai):
+        """
+        Run hitung(progress) on a worker thread. Progress and the result come
+        back through a queue polled with after(); selesai(hasil) runs on the
+        Tk thread. The worker never touches a widget.
+        """
+        if self.tugas is not None and self.tugas.is_alive():
+            messagebox.showinfo("Sedang Menghitung", "Tunggu perhitungan sebelumnya selesai atau batalkan.")
+            return
+        antrian = queue.Queue()
+        batal = threading.Event()
+
+        def progress(kolom, total):
+            # Dipanggil dari thread pekerja; pembatalan diperiksa di setiap kolom pivot
+            if batal.is_set():
+                raise Dibatalkan()
+            antrian.put(('progress', kolom, total))
+
+        jendela = tk.Toplevel(self)
+        jendela.title(judul)
+        jendela.resizable(False, False)
+        label = ttk.Label(jendela, text="Memulai perhitungan...")
+        label.pack(padx=10, pady=(10, 5))
+        bar = ttk.Progressbar(jendela, length=300, mode="determinate")
+        bar.pack(padx=10, pady=5)
+        tombol = ttk.Button(jendela, text="Batal",
+                            command=lambda: (batal.set(), tombol.config(state="disabled")))
+        tombol.pack(pady=(5, 10))
+        jendela.protocol("WM_DELETE_WINDOW", batal.set)
+
+        self.tugas = self.mulai_thread(hitung, antrian, progress)
+        self.after(POLL_MS, self.periksa_antrian, antrian, jendela, label, bar, selesai)
+
+    @staticmethod
+    def mulai_thread(hitung, antrian, progress=None):
+        """Start hitung(progress) on a daemon thread; the outcome is put on antrian"""
+        def kerja():
+            try:
+                antrian.put(('selesai', hitung(progress)))
+            except Dibatalkan:
+                antrian.put(('batal',))
+            except Exception as e:
+                antrian.put(('error', e))
+
+        tugas = threading.Thread(target=kerja, daemon=True)
+        tugas.start()
+        return tugas
+
+    def periksa_antrian(self, antrian, jendela, label, bar, selesai):
+        try:
+            while True:
+                pesan = antrian.get_nowait()
+                if pesan[0] == 'progress':
+                    _, kolom, total = pesan
+                    bar.configure(maximum=total, value=kolom)
+                    if kolom < total:
+                        label.config(text=f"Kolom pivot {kolom + 1} dari {total}")
+                    else:
+                        label.config(text="Menganalisis solusi...")
+                    continue
+                jendela.destroy()
+                if pesan[0] == 'selesai':
+                    selesai(pesan[1])
+                elif pesan[0] == 'error':
+                    messagebox.showerror("Error", str(pesan[1]))
+                return
+        except queue.Empty:
+            pass
+        self.after(POLL_MS, self.periksa_antrian, antrian, jendela, label, bar, selesai)
 
-        text_widget = tk.Text(hasil_window, wrap="word", font=("Courier New", 10), height=25, width=80)
-        text_widget.pack(padx=10, pady=10, fill="both", expand=True)
-
-        for deskripsi, matriks in steps:
-            text_widget.insert(tk.END, f"{deskripsi}\n", "bold")
-            text_widget.insert(tk.END, self.format_matrix(matriks) + "\n\n")
-
-        text_widget.tag_configure("bold", font=("Courier New", 10, "bold"))
-        text_widget.config(state="disabled") # Buat read-only
-
-    def hitung_eselon(self):
+    def hitung_langkah(self, judul, make_one, jordan):
         matrix = self.get_matrix_from_input()
         if matrix is not None:
-            # Eliminasi Gauss (OBE)
-            hasil, langkah = eliminasi_gauss(matrix, make_one=False, jordan=False)
-            self.tampilkan_hasil("Hasil - Eliminasi Gauss (OBE)", langkah)
+            self.jalankan(
+                judul,
+                lambda progress: eliminasi_gauss(matrix, make_one=make_one, jordan=jordan, progress=progress)[1],
+                lambda langkah: self.tampilkan_hasil(judul, DaftarLangkah(langkah)),
+            )
+
+    def hitung_eselon(self):
+        # Eliminasi Gauss (OBE)
+        self.hitung_langkah("Hasil - Eliminasi Gauss (OBE)", make_one=False, jordan=False)
 
     def hitung_tereduksi(self):
-        matrix = self.get_matrix_from_input()
-        if matrix is not None:
-            # Eliminasi Gauss dengan Satu Utama
-            hasil, langkah = eliminasi_gauss(matrix, make_one=True, jordan=False)
-            self.tampilkan_hasil("Hasil - Eliminasi Gauss (Satu Utama)", langkah)
+        # Eliminasi Gauss dengan Satu Utama
+        self.hitung_langkah("Hasil - Eliminasi Gauss (Satu Utama)", make_one=True, jordan=False)
 
     def gauss_jordan(self):
-        matrix = self.get_matrix_from_input()
-        if matrix is not None:
-            # Eliminasi Gauss-Jordan
-            hasil, langkah = eliminasi_gauss(matrix, make_one=True, jordan=True)
-            self.tampilkan_hasil("Hasil - Eliminasi Gauss-Jordan", langkah)
+        # Eliminasi Gauss-Jordan
+        self.hitung_langkah("Hasil - Eliminasi Gauss-Jordan", make_one=True, jordan=True)
 
     def tentukan_solusi(self):
         matrix = self.get_matrix_from_input()
@@ -267,30 +494,27 @@ class App(tk.Tk):
             if matrix.shape[1] <= 1:
                 messagebox.showerror("Error", "Analisis solusi memerlukan matriks augmented (minimal 2 kolom).")
                 return
-
-            # Dapatkan langkah-langkah Gauss-Jordan dan analisis solusi
-            rref_matrix, langkah_rref = eliminasi_gauss(matrix, make_one=True, jordan=True)
-            solusi_text = analisis_solusi(matrix)
-            langkah_analisis = langkah_rref + [("Analisis Solusi:", solusi_text)]
-            self.tampilkan_hasil_solusi("Hasil - Analisis Solusi", langkah_analisis)
-
-    def tampilkan_hasil_solusi(self, title, steps):
-        hasil_window = tk.Toplevel(self)
-        hasil_window.title(title)
-
-        text_widget = tk.Text(hasil_window, wrap="word", font=("Courier New", 10), height=25, width=80)
-        text_widget.pack(padx=10, pady=10, fill="both", expand=True)
-
-        for deskripsi, konten in steps:
-            text_widget.insert(tk.END, f"{deskripsi}\n", "bold")
-            if isinstance(konten, np.ndarray):
-                text_widget.insert(tk.END, self.format_matrix(konten) + "\n\n")
-            else: # String untuk hasil analisis
-                text_widget.insert(tk.END, konten + "\n\n", "result")
-
-        text_widget.tag_configure("bold", font=("Courier New", 10, "bold"))
-        text_widget.tag_configure("result", font=("Courier New", 10, "italic"))
-        text_widget.config(state="disabled")
+            self.jalankan("Hasil - Analisis Solusi", lambda progress: self.analisis_lengkap(matrix, progress),
+                          lambda langkah: self.tampilkan_hasil("Hasil - Analisis Solusi", langkah))
+
+    @staticmethod
+    def analisis_lengkap(matrix, progress):
+        """Steps and analysis for tentukan_solusi (runs on the worker thread)"""
+        total = matrix.shape[1]
+        # Satu eliminasi Gauss-Jordan untuk langkah sekaligus analisis (dari RREF-nya)
+        rref_matrix, langkah_rref = eliminasi_gauss(matrix, make_one=True, jordan=True, progress=progress)
+        klasifikasi = klasifikasi_rref(rref_matrix)
+        tambahan = [("Analisis Solusi:", format_klasifikasi(klasifikasi))]
+        # Solusi tunggal juga ditampilkan sebagai pecahan (float + rekonstruksi, hybrid.py);
+        # progress terakhir juga memeriksa pembatalan sebelum tahap ini
+        progress(total, total)
+        if klasifikasi['jenis'] == 'unik':
+            eksak = hybrid.solve(hybrid.to_integer_rows(matrix.tolist()))
+            if eksak is not None:
+                tambahan.append(("Solusi Eksak (Pecahan):",
+                                 "\n".join(f"x{j+1} = {v}" for j, v in enumerate(eksak))))
+        # Langkah tetap berupa jejak, matriksnya dibangun saat ditampilkan
+        return DaftarLangkah(langkah_rref, tambahan)
 
 
 if __name__ == "__main__":
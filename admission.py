@@ -0,0 +1,381 @@
+import heapq
+import itertools
+import math
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from fractions import Fraction
+
+from workerpool import PoolBusy, PoolError
+
+# Kontrol penerimaan berbasis perkiraan biaya (/calculate, termasuk input sparse dan
+# parametrik, /calculate-batch, /session dan /upload). Sebelum pekerjaan dimulai,
+# biaya setiap jalur diperkirakan dari ukuran (m x n), jumlah langkah yang akan direkam
+# dan panjang bit elemen: pada eliminasi eksak panjang bit elemen tumbuh kira-kira
+# linear terhadap nomor pivot, jadi biaya per operasi naik dengan (bit / 64)^1.5.
+# Konstanta dikalibrasi kasar dari benchmark.py (cukup untuk membedakan milidetik,
+# detik dan menit). Keputusannya:
+#   admit  - murah, langsung dijalankan
+#   queue  - mahal, menunggu giliran di antrean prioritas (yang termurah dulu)
+#   reject - melebihi batas, ditolak dengan pesan yang jelas (HTTP 413)
+# Jika langkah terlalu mahal/besar tetapi hasil akhirnya tidak, permintaan dialihkan
+# (routed) ke jalur tanpa langkah lalu diterima atau diantrekan seperti biasa.
+
+# Detik per satuan operasi / sel langkah untuk setiap mesin
+BIAYA = {
+    'exact_op': 3e-7,          # operasi baris Bareiss (int Python)
+    'exact_op_word': 7e-8,     # ... tambahan per (bit/64)^1.5
+    'fraction_op': 5e-7,       # LU Fraction (det/invers/ruang nol)
+    'fraction_op_word': 2e-7,
+    'exact_cell': 3e-7,        # satu sel langkah eksak (normalisasi + format)
+    'exact_cell_bit': 1.2e-9,
+    'sympy_op': 2e-5,          # operasi baris SymPy (input float)
+    'sympy_cell': 3e-6,
+    'numpy_op': 1e-9,          # BLAS/LAPACK float
+    'sparse_row': 6e-7,        # satu baris sparse (dict) dialokasikan
+    'sparse_op': 4e-6,         # satu elemen yang disentuh eliminasi sparse (float)
+    'sparse_op_bit': 4e-9,     # ... tambahan Fraction per (pivot x bit elemen)
+    'poly_op': 1e-4,           # operasi Poly SymPy, per (derajat rata-rata)^2
+    'blocked_op': 2e-10,       # eliminasi out-of-core per panel (blocked.py)
+    'disk_byte': 1e-9,         # salinan file kerja out-of-core
+    'overhead': 1e-3,
+}
+STEP_OPERATIONS = ('rref', 'ref', 'ref-leading-one', 'gauss-jordan')
+FACTOR_OPERATIONS = ('det', 'inverse', 'nullspace', 'general')
+# Bit mantissa float64: input float tidak tumbuh seperti bilangan bulat
+FLOAT_BITS = 53
+LOG2_10 = math.log2(10)
+# Derajat terbesar yang diterima parametric.py (MAX_PANGKAT); tanpa memuat SymPy di sini
+MAX_DEGREE = 32
+_NAMA = re.compile(r"[A-Za-z_]\w*")
+_EKSPONEN = re.compile(r"(?:\^|\*\*)\s*(\d+)")
+
+
+class TooExpensive(PoolError):
+    code = 'too_expensive'
+    http_status = 413
+
+
+def entry_bits(x):
+    """Bit length of one entry (numerator + denominator for fractions)"""
+    if type(x) is int:
+        return x.bit_length()
+    if isinstance(x, Fraction):
+        return x.numerator.bit_length() + x.denominator.bit_length()
+    if isinstance(x, str):
+        # Teks angka ("12/35"): digit -> bit
+        return int(len(x) * LOG2_10) + 1
+    return FLOAT_BITS
+
+
+def entry_degree(x, parameter):
+    """
+    Upper bound on the degree of one parametric entry: occurrences of the
+    parameter times every exponent in the text, at most MAX_DEGREE
+    """
+    if not isinstance(x, str):
+        return 0
+    derajat = sum(1 for nama in _NAMA.findall(x) if nama == parameter)
+    for eksponen in _EKSPONEN.findall(x):
+        derajat *= max(int(eksponen), 1)
+        if derajat > MAX_DEGREE:
+            return MAX_DEGREE
+    return derajat
+
+
+class Estimate:
+    """
+    Predicted cost of one request, with and without steps. operation is a
+    /calculate operation or one of the engines without one: 'sparse' (nnz and
+    band = (lower, upper) bandwidth of the coefficients), 'parametric'
+    (degree = largest entry degree) and 'upload' (out-of-core float file).
+    """
+
+    def __init__(self, rows, cols, bits, exact, operation, with_steps, nnz=0, band=(0, 0), degree=0):
+        self.rows = rows
+        self.cols = cols
+        self.bits = bits
+        self.exact = exact
+        self.operation = operation
+        self.with_steps = with_steps and operation in STEP_OPERATIONS
+        self.nnz = nnz
+        self.degree = degree
+        m, n = rows, cols
+        r = min(m, n)
+        self.ops = m * n * r
+        if operation == 'sparse':
+            # Fill-in tetap di dalam pita koefisien: setiap pivot menyentuh paling banyak
+            # (lebar bawah + 1) x (lebar pita + 2) elemen, tidak lebih dari matriks penuh
+            bawah, atas = band
+            self.ops = min(self.ops, r * (bawah + 1) * (bawah + atas + 2))
+        # Panjang bit rata-rata / maksimum elemen selama eliminasi eksak: minor k x k
+        # berukuran sekitar k (bit + log2(k) / 2) bit (batas Hadamard)
+        self.avg_bits = r * (bits + math.log2(r + 1)) / 2 if exact else FLOAT_BITS
+        self.max_digits = int(r * (bits + math.log2(r + 1) / 2) / LOG2_10) + 1 if exact else 0
+        if operation == 'sparse':
+            # Solusi sparse dikirim sebagai float, tidak ada bilangan bulat yang dicetak
+            self.max_digits = 0
+        # Langkah: satu operasi baris per (pivot, baris), setiap langkah memuat m x n sel
+        self.steps = r * m if operation in ('rref', 'gauss-jordan') else r * m // 2
+        self.step_cells = self.steps * m * n
+        # Baris langkah dinormalisasi (FPB dibagi): rata-rata sekitar setengah panjang minor
+        digits = self.avg_bits / (2 * LOG2_10) if exact else 15
+        self.step_bytes = int(self.step_cells * (digits + 4))
+        self.final_seconds = self._seconds(False)
+        self.steps_seconds = self._seconds(True) if operation in STEP_OPERATIONS else self.final_seconds
+
+    def _seconds(self, with_steps):
+        w = (self.avg_bits / 64 + 1) ** 1.5
+        op = self.operation
+        r = min(self.rows, self.cols)
+        if op == 'sparse':
+            per_op = BIAYA['sparse_op'] + (BIAYA['sparse_op_bit'] * r * self.bits if self.exact else 0)
+            return self.rows * BIAYA['sparse_row'] + (self.nnz + self.ops) * per_op + BIAYA['overhead']
+        if op == 'parametric':
+            # Derajat elemen tumbuh kira-kira linear terhadap nomor pivot (dibatasi MAX_DEGREE)
+            derajat = 1 + min(self.degree * r, MAX_DEGREE) / 2
+            return self.ops * BIAYA['poly_op'] * derajat ** 2 + BIAYA['overhead']
+        if op == 'upload':
+            return (self.ops * BIAYA['blocked_op'] + self.rows * self.cols * 8 * BIAYA['disk_byte']
+                    + BIAYA['overhead'])
+        if op in FACTOR_OPERATIONS:
+            if self.exact:
+                return self.ops * (BIAYA['fraction_op'] + BIAYA['fraction_op_word'] * w) + BIAYA['overhead']
+            return self.ops * BIAYA['numpy_op'] + BIAYA['overhead']
+        if op == 'hybrid' or (op == 'classify' and not self.exact):
+            # Float + penyempurnaan; jalur eksak hanya jika verifikasi gagal
+            return 10 * self.ops * BIAYA['numpy_op'] + BIAYA['overhead']
+        if self.exact:
+            seconds = self.ops * (BIAYA['exact_op'] + BIAYA['exact_op_word'] * w)
+            if with_steps:
+                seconds += self.step_cells * (BIAYA['exact_cell'] + BIAYA['exact_cell_bit'] * self.avg_bits)
+        else:
+            seconds = self.ops * BIAYA['sympy_op']
+            if with_steps:
+                seconds += self.step_cells * BIAYA['sympy_cell']
+        return seconds + BIAYA['overhead']
+
+    @property
+    def seconds(self):
+        return self.steps_seconds if self.with_steps else self.final_seconds
+
+    def as_dict(self):
+        return {
+            'rows': self.rows,
+            'cols': self.cols,
+            'bits': self.bits,
+            'exact': self.exact,
+            'steps': self.steps if self.with_steps else 0,
+            'seconds': round(self.seconds, 6),
+            'final_seconds': round(self.final_seconds, 6),
+            'step_bytes': self.step_bytes if self.with_steps else 0,
+        }
+
+
+def estimate(matrix, operation, with_steps, exact):
+    """Cost estimate from the shape, the step count and the largest entry bit length"""
+    rows, cols = len(matrix), len(matrix[0])
+    if hasattr(matrix, 'dtype'):
+        # Array NumPy (input biner): int64 dari nilai terbesar, float selalu 53 bit
+        bits = max(int(matrix.max()), -int(matrix.min())).bit_length() if matrix.dtype.kind == 'i' else FLOAT_BITS
+    else:
+        bits = max((entry_bits(x) for row in matrix for x in row), default=0)
+    return Estimate(rows, cols, bits, exact, operation, with_steps)
+
+
+def estimate_sparse(shape, entries):
+    """
+    Cost estimate of sparse input from its shape, nnz and the bandwidth of the
+    coefficient columns, before any row is allocated. Malformed entries are
+    skipped here and rejected later by sparse.from_coo.
+    """
+    rows, cols = (max(int(x), 0) for x in shape)
+    bawah = atas = bits = 0
+    exact = True
+    for entry in entries:
+        try:
+            i, j, value = entry
+        except (TypeError, ValueError):
+            continue
+        if type(i) is int and type(j) is int and j < cols - 1:
+            bawah, atas = max(bawah, i - j), max(atas, j - i)
+        exact = exact and type(value) is int
+        bits = max(bits, entry_bits(value))
+    return Estimate(rows, cols, bits, exact, 'sparse', False, nnz=len(entries), band=(bawah, atas))
+
+
+def estimate_parametric(matrix, parameter):
+    """Cost estimate of a parametric system from its size and the largest entry degree"""
+    rows, cols = len(matrix), len(matrix[0])
+    bits = max((entry_bits(x) for row in matrix for x in row), default=0)
+    degree = max((entry_degree(x, parameter) for row in matrix for x in row), default=0)
+    return Estimate(rows, cols, bits, True, 'parametric', False, degree=degree)
+
+
+def estimate_upload(rows, cols):
+    """Cost estimate of an uploaded float64 file classified out of core"""
+    return Estimate(rows, cols, FLOAT_BITS, False, 'upload', False)
+
+
+class Decision:
+    def __init__(self, action, estimate, with_steps, routed=''):
+        self.action = action
+        self.estimate = estimate
+        self.with_steps = with_steps
+        # Alasan pengalihan ke jalur tanpa langkah ('' = tidak dialihkan)
+        self.routed = routed
+
+    @property
+    def seconds(self):
+        return self.estimate.steps_seconds if self.with_steps else self.estimate.final_seconds
+
+    def as_dict(self):
+        return {'decision': self.action, 'routed': self.routed, 'estimate': self.estimate.as_dict()}
+
+
+class AdmissionController:
+    """
+    Admit / route / queue / reject /calculate requests from their cost estimate.
+    At most slots queued (expensive) jobs run at once, so that cheap requests
+    always find a free worker; the rest wait in a priority queue (cheapest
+    first, then arrival order) of at most max_waiting entries.
+    """
+
+    def __init__(self, max_seconds=30.0, queue_seconds=1.0, max_step_bytes=64 * 1024 * 1024,
+                 slots=1, max_waiting=16, queue_timeout=30.0):
+        self.max_seconds = max_seconds
+        self.queue_seconds = queue_seconds
+        self.max_step_bytes = max_step_bytes
+        self.slots = max(slots, 1)
+        self.max_waiting = max_waiting
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._heap = []
+        self._urutan = itertools.count()
+        self._active = 0
+        self.decisions = {'admit': 0, 'queue': 0, 'reject': 0}
+        self.routed = 0
+        self.rejected = {'cost': 0, 'digits': 0, 'size': 0, 'queue_full': 0, 'queue_timeout': 0}
+        self.max_depth = 0
+        self.wait_seconds = 0.0
+
+    # --- keputusan ---
+
+    def decide(self, estimate, steps_required=False):
+        """
+        Decision for one estimate. steps_required (streaming, paged) means the
+        steps are the point of the request and cannot be dropped.
+        Raises TooExpensive when the request is rejected.
+        """
+        batas_digit = sys.get_int_max_str_digits() if hasattr(sys, 'get_int_max_str_digits') else 0
+        if batas_digit and estimate.max_digits > batas_digit:
+            self._reject('digits')
+            raise TooExpensive(
+                f"Elemen hasil diperkirakan sampai {estimate.max_digits} digit (batas {batas_digit}); "
+                f"perkecil matriks ({estimate.rows}x{estimate.cols}) atau nilai elemennya "
+                f"({estimate.bits} bit)")
+
+        with_steps = estimate.with_steps
+        routed = ''
+        if with_steps and not steps_required and estimate.final_seconds <= self.max_seconds:
+            if estimate.step_bytes > self.max_step_bytes:
+                routed = f"langkah diperkirakan {estimate.step_bytes // (1024 * 1024)} MiB, dihitung tanpa langkah"
+            elif estimate.steps_seconds > self.max_seconds:
+                routed = f"langkah diperkirakan {estimate.steps_seconds:.0f} detik, dihitung tanpa langkah"
+            with_steps = not routed
+        seconds = estimate.steps_seconds if with_steps else estimate.final_seconds
+        if seconds > self.max_seconds:
+            self._reject('cost')
+            saran = " tanpa langkah (steps: false)" if with_steps and estimate.final_seconds <= self.max_seconds else ""
+            raise TooExpensive(
+                f"Perkiraan biaya {seconds:.0f} detik melebihi batas {self.max_seconds:g} detik "
+                f"untuk matriks {estimate.rows}x{estimate.cols} ({estimate.bits} bit); "
+                f"kirim matriks yang lebih kecil{saran}")
+        action = 'queue' if seconds > self.queue_seconds else 'admit'
+        with self._cond:
+            self.decisions[action] += 1
+            self.routed += bool(routed)
+        return Decision(action, estimate, with_steps, routed)
+
+    def check_size(self, nbytes, limit, what):
+        """Reject (TooExpensive) an input of nbytes over limit, e.g. from Content-Length before reading it"""
+        if nbytes is not None and nbytes > limit:
+            self._reject('size')
+            raise TooExpensive(f"{what} {nbytes} byte melebihi batas {limit} byte")
+
+    def _reject(self, reason):
+        with self._cond:
+            self.decisions['reject'] += 1
+            self.rejected[reason] += 1
+
+    # --- antrean ---
+
+    @contextmanager
+    def slot(self, decision):
+        """
+        Hold a slot for a queued decision while the body runs (no-op otherwise);
+        yields the seconds spent waiting in the queue
+        """
+        if decision.action != 'queue':
+            yield 0.0
+            return
+        waited = self._acquire(decision.seconds)
+        try:
+            yield waited
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def _reject_antrean(self, reason):
+        # decide() sudah menghitung permintaan ini sebagai 'queue'; keputusan akhirnya reject
+        self.decisions['queue'] -= 1
+        self._reject(reason)
+
+    def _acquire(self, cost):
+        mulai = time.monotonic()
+        batas = mulai + self.queue_timeout
+        with self._cond:
+            if len(self._heap) >= self.max_waiting:
+                self._reject_antrean('queue_full')
+                raise PoolBusy(f"Antrean perhitungan berat penuh ({self.max_waiting}), coba lagi nanti")
+            item = (cost, next(self._urutan))
+            heapq.heappush(self._heap, item)
+            self.max_depth = max(self.max_depth, len(self._heap))
+            try:
+                while not (self._heap[0] == item and self._active < self.slots):
+                    sisa = batas - time.monotonic()
+                    if sisa <= 0:
+                        self._reject_antrean('queue_timeout')
+                        raise PoolBusy(f"Menunggu di antrean lebih dari {self.queue_timeout:g} detik, coba lagi nanti")
+                    self._cond.wait(sisa)
+            except BaseException:
+                self._heap.remove(item)
+                heapq.heapify(self._heap)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._heap)
+            self._active += 1
+            waited = time.monotonic() - mulai
+            self.wait_seconds += waited
+            # Antrean berikutnya bisa mendapat slot yang masih kosong
+            self._cond.notify_all()
+        return waited
+
+    def stats(self):
+        with self._cond:
+            return {
+                'slots': self.slots,
+                'active': self._active,
+                'queue_depth': len(self._heap),
+                'max_queue_depth': self.max_depth,
+                'max_waiting': self.max_waiting,
+                'max_seconds': self.max_seconds,
+                'queue_seconds': self.queue_seconds,
+                'decisions': dict(self.decisions),
+                'routed': self.routed,
+                'rejected': dict(self.rejected),
+                'wait_seconds': round(self.wait_seconds, 6),
+            }
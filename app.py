@@ -1,58 +1,159 @@
-from flask import Flask, render_template, request, jsonify
-import numpy as np
-import sympy as sp
-from sympy import Matrix, Rational
+import time
+
+_MULAI_IMPOR = time.perf_counter()
+
+import os
+import secrets
+import tempfile
+import threading
+
+from flask import Flask, render_template, request, jsonify, stream_with_context
+from fractions import Fraction
+
+import engines
+import wire
+from admission import AdmissionController, estimate, estimate_parametric, estimate_sparse, estimate_upload
+from resultcache import FactorCache, ResultCache, cache_key
+from steptrace import RowOp, StepTrace, apply_op
+from workerpool import PoolError, WorkerPool
+import metrics
+from metrics import PhaseTimer, fase
+
+# NumPy, SymPy dan modul mesin diimpor saat pertama dipakai (engines.py)
+np = engines.lazy('numpy')
+sp = engines.lazy('sympy')
+bareiss = engines.lazy('bareiss')
+blocked = engines.lazy('blocked')
+eliminasi = engines.lazy('eliminasi')
+hybrid = engines.lazy('hybrid')
+incremental = engines.lazy('incremental')
+lu = engines.lazy('lu')
+modular = engines.lazy('modular')
+parametric = engines.lazy('parametric')
+sparse = engines.lazy('sparse')
 
 app = Flask(__name__)
 
+# Cache hasil perhitungan, ukuran bisa diatur lewat environment
+result_cache = ResultCache(
+    max_entries=int(os.environ.get('RESULT_CACHE_ENTRIES', 256)),
+    max_bytes=int(os.environ.get('RESULT_CACHE_BYTES', 8 * 1024 * 1024)),
+)
+# Faktorisasi LU untuk /factorize + /solve, dan di setiap pekerja untuk det / invers /
+# nullspace / general dari /calculate (kedaluwarsa setelah TTL detik tanpa dipakai)
+factor_cache = FactorCache(
+    max_entries=int(os.environ.get('FACTOR_CACHE_ENTRIES', 64)),
+    ttl=float(os.environ.get('FACTOR_CACHE_TTL', 600)),
+)
+# Jejak langkah untuk /calculate {"paged": true}, dirender per halaman lewat /steps/<id>
+step_store = FactorCache(
+    max_entries=int(os.environ.get('STEP_STORE_ENTRIES', 32)),
+    ttl=float(os.environ.get('STEP_STORE_TTL', 600)),
+)
+# Sesi penyuntingan interaktif (/session): faktorisasi disimpan antar perubahan
+session_store = FactorCache(
+    max_entries=int(os.environ.get('SESSION_ENTRIES', 64)),
+    ttl=float(os.environ.get('SESSION_TTL', 1800)),
+)
+# Mesin yang dipanaskan di setiap proses pekerja baru dan oleh warm_up() (setelah fork),
+# misal ENGINE_WARMUP=sympy,eliminasi; kosong = semua mesin dimuat saat pertama dipakai
+ENGINE_WARMUP = [nama.strip() for nama in os.environ.get('ENGINE_WARMUP', '').split(',') if nama.strip()]
+for _nama in ENGINE_WARMUP:
+    if _nama not in engines.stats():
+        raise ValueError(f"ENGINE_WARMUP: mesin tidak dikenal {_nama!r}")
+# Perhitungan dijalankan di proses pekerja terpisah dengan batas waktu
+# (WORKER_PROCESSES=0 menjalankannya langsung di thread request)
+pool = WorkerPool(
+    processes=int(os.environ.get('WORKER_PROCESSES', 2)),
+    timeout=float(os.environ.get('CALCULATE_TIMEOUT', 30)),
+    queue_timeout=float(os.environ.get('WORKER_QUEUE_TIMEOUT', 5)),
+    start_method=os.environ.get('WORKER_START_METHOD', 'spawn'),
+    initializer=engines.warm if ENGINE_WARMUP else None,
+    initargs=(ENGINE_WARMUP,),
+)
+# Perkiraan biaya sebelum /calculate dijalankan: diterima, dialihkan tanpa langkah,
+# diantrekan (paling banyak ADMISSION_SLOTS perhitungan mahal sekaligus, agar satu
+# pekerja tetap bebas untuk request murah) atau ditolak
+admission = AdmissionController(
+    max_seconds=float(os.environ.get('ADMISSION_MAX_SECONDS', pool.timeout)),
+    queue_seconds=float(os.environ.get('ADMISSION_QUEUE_SECONDS', 1.0)),
+    max_step_bytes=int(os.environ.get('ADMISSION_MAX_STEP_BYTES', 64 * 1024 * 1024)),
+    slots=int(os.environ.get('ADMISSION_SLOTS', max(pool.processes - 1, 1))),
+    max_waiting=int(os.environ.get('ADMISSION_QUEUE_MAX', 16)),
+    queue_timeout=float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 30)),
+)
+# Waktu start-up proses ini: impor app.py dan /calculate pertama (GET /engines, /metrics)
+startup = {'import_seconds': None, 'first_request_seconds': None, 'first_request_operation': None}
+
+# Histogram latensi /calculate per fase, operasi dan ukuran matriks (GET /metrics)
+metrics_registry = metrics.Registry()
+metrics_registry.describe('matrix_calculate_duration_seconds', "Total /calculate time by operation and matrix size")
+metrics_registry.describe('matrix_calculate_phase_seconds', "/calculate time per phase by operation and matrix size")
+
 # Fungsi untuk formatasi matriks
+def is_sympy_matrix(matrix):
+    """isinstance(matrix, sp.Matrix) without loading SymPy (no SymPy objects exist before it is loaded)"""
+    return engines.loaded('sympy') and isinstance(matrix, sp.Matrix)
+
 def format_matrix(matrix):
     """Format matrix for display in proper matrix notation"""
-    if isinstance(matrix, (sp.Matrix, list)):
-        if isinstance(matrix, list):
+    if isinstance(matrix, list) or is_sympy_matrix(matrix):
+        # List berisi int/Fraction (dari mesin Bareiss) dicetak langsung,
+        # str() nya sama dengan Integer/Rational SymPy
+        if isinstance(matrix, list) and not all(
+                isinstance(x, (int, Fraction)) for row in matrix for x in row):
             matrix = sp.Matrix(matrix)
-        #utk get dimensi matriks nya bris&kolms
-        rows = matrix.shape[0]
-        cols = matrix.shape[1]
-        result = []
-        
-        # lebar maksimum yg dibutuhin utk setiap kolom
-        col_widths = [max(len(str(matrix[i, j])) for i in range(rows)) for j in range(cols)]
-        
-        # format setiap baris
-        for i in range(rows):
-            row = []
-            for j in range(cols):
-                element = str(matrix[i, j])
-                # Rata kanan setiap elemen sesuai lebar kolom
-                row.append(element.rjust(col_widths[j]))
-            result.append("  ".join(row))
-            
-        # untuk tanda kurung matriks
-        max_line_length = len(result[0])
-        bracket_height = len(result)
-        
-        formatted = "⎡" + " " * max_line_length + "⎤\n"
-        for idx, line in enumerate(result):
-            if idx == 0:
-                formatted += "⎢" + line + "⎥\n"
-            elif idx == bracket_height - 1:
-                formatted += "⎢" + line + "⎥\n"
-            else:
-                formatted += "⎢" + line + "⎥\n"
-        formatted += "⎣" + " " * max_line_length + "⎦"
-        
-        return formatted
+        if is_sympy_matrix(matrix):
+            matrix = matrix.tolist()
+        # str() setiap elemen cukup sekali, dipakai untuk lebar kolom dan isi baris
+        cells = [[str(x) for x in row] for row in matrix]
+        return _format_cells(cells, [[len(x) for x in row] for row in cells])
     return str(matrix)
 
+def _format_cells(cells, lengths):
+    """Lay out rows of element strings (with their lengths) in matrix brackets"""
+    # lebar maksimum yg dibutuhin utk setiap kolom
+    col_widths = [max(col) for col in zip(*lengths)]
+
+    # format setiap baris, rata kanan setiap elemen sesuai lebar kolom
+    result = ["  ".join(element.rjust(width) for element, width in zip(row, col_widths))
+              for row in cells]
+
+    # untuk tanda kurung matriks
+    max_line_length = len(result[0])
+    formatted = "⎡" + " " * max_line_length + "⎤\n"
+    for line in result:
+        formatted += "⎢" + line + "⎥\n"
+    formatted += "⎣" + " " * max_line_length + "⎦"
+    return formatted
+
+def format_steps(trace, start=0, stop=None):
+    """
+    [(description, formatted matrix)] for steps start..stop-1 of a StepTrace.
+    Rows are shared between consecutive steps, so the strings and widths of a
+    row are computed once per row object and reused.
+    """
+    cache = {}
+    hasil = []
+    for desc, rows in trace.rows_between(start, stop):
+        cells, lengths = [], []
+        for row in rows:
+            hit = cache.get(id(row))
+            if hit is None or hit[0] is not row:
+                strings = [str(x) for x in row]
+                hit = cache[id(row)] = (row, strings, [len(x) for x in strings])
+            cells.append(hit[1])
+            lengths.append(hit[2])
+        hasil.append((desc, _format_cells(cells, lengths)))
+    return hasil
+
 #---------------------------------------------------------------------------------------------------
 # Logika untuk operasi matriks gauss-jordan
-def gauss_jordan_steps(matrix):
+def gauss_jordan_ops(matrix):
     """
-    Perform Gauss-Jordan elimination with step tracking
+    Perform Gauss-Jordan elimination, yielding each row operation (RowOp)
     """
-    A = Matrix(matrix)
-    steps = [("Matriks Awal:", A.copy())]
+    A = sp.Matrix(matrix)
     m, n = A.shape
     r = 0  # baris saat ini
     c = 0  # kolom saat ini
@@ -74,26 +175,140 @@ def gauss_jordan_steps(matrix):
         # Langkah 2 : Tukar baris jika perlu
         if pivot != r:
             A.row_swap(r, pivot)
-            steps.append((f"Tukar baris {r+1} dan {pivot+1}:", A.copy()))
+            yield RowOp('swap', f"Tukar baris {r+1} dan {pivot+1}:", r, pivot, None)
         
         # Langkah 3: Membuat pivot = 1
         pivot_val = A[r, c]
         if pivot_val != 1:
             A.row_op(r, lambda x, k: x/pivot_val)
-            steps.append((f"R{r+1} = R{r+1}/{pivot_val}:", A.copy()))
+            yield RowOp('scale', f"R{r+1} = R{r+1}/{pivot_val}:", r, None, list(A.row(r)))
         
         # Langkah 4: Eliminasi elemen diatas dan bawah pivot
         for i in range(m):
             if i != r and A[i, c] != 0:
                 factor = A[i, c]
                 A.row_op(i, lambda x, k: x - factor*A[r, k])
-                steps.append((f"R{i+1} = R{i+1} - {factor}*R{r+1}:", A.copy()))
+                yield RowOp('axpy', f"R{i+1} = R{i+1} - {factor}*R{r+1}:", i, r, list(A.row(i)))
         
         # Pindah ke kolom berikutnya
         r += 1
         c += 1
-    
-    return steps
+
+def gauss_jordan_steps(matrix):
+    """
+    Perform Gauss-Jordan elimination with step tracking (returns a StepTrace)
+    """
+    return StepTrace.collect(sp.Matrix(matrix).tolist(), gauss_jordan_ops(matrix), build=sp.Matrix)
+
+# Logika untuk eliminasi Gauss (OBE) dan Gauss dengan satu utama
+def ref_ops(A, leading_one=False):
+    """
+    Perform Gaussian elimination to upper-triangular form, yielding each row operation
+    """
+    current = A.copy()
+    m, n = A.shape
+
+    for i in range(min(m, n)):
+        # Cari pivot selain nol
+        pivot_found = False
+        for j in range(i, m):
+            if current[j, i] != 0:
+                if j != i:
+                    current.row_swap(i, j)
+                    yield RowOp('swap', f"Tukar baris {i+1} dan {j+1}:", i, j, None)
+                pivot_found = True
+                break
+
+        if not pivot_found:
+            continue
+
+        # Buat pivot menjadi 1 (hanya untuk satu utama)
+        if leading_one:
+            pivot_val = current[i, i]
+            if pivot_val != 1:
+                current.row_op(i, lambda x, k: x/pivot_val)
+                yield RowOp('scale', f"R{i+1} = R{i+1}/{pivot_val} (Membuat pivot = 1):", i, None,
+                            list(current.row(i)))
+
+        # Eliminasi di bawah pivot
+        for j in range(i + 1, m):
+            if current[j, i] != 0:
+                factor = current[j, i] if leading_one else current[j, i] / current[i, i]
+                current.row_op(j, lambda x, k: x - factor*current[i, k])
+                yield RowOp('axpy', f"R{j+1} = R{j+1} - {factor}*R{i+1}:", j, i, list(current.row(j)))
+
+def ref_steps(A, leading_one=False):
+    """
+    Perform Gaussian elimination to upper-triangular form with step tracking
+    """
+    steps = StepTrace.collect(A.tolist(), ref_ops(A, leading_one), initial_desc=None, build=sp.Matrix)
+    return steps, steps.final()
+
+#---------------------------------------------------------------------------------------------------
+# Analisis solusi sistem persamaan linear dari bentuk RREF
+def analisis_rref(rref_matrix):
+    """
+    Classify the linear system from its RREF (sympy Matrix or list of rows)
+    """
+    if is_sympy_matrix(rref_matrix):
+        rref_matrix = rref_matrix.tolist()
+    m, n = len(rref_matrix), len(rref_matrix[0])
+    num_vars = n - 1  # Kolom terakhir adalah kolom hasil
+
+    # Cek inkonsistensi menggunakan metode yang sama dengan Test.py
+    for i in range(m):
+        row = rref_matrix[i]
+        # Cek apakah semua koefisien adalah nol (kecuali kolom terakhir)
+        koefisien_nol = all(abs(row[j]) < 1e-10 for j in range(num_vars))
+        # Cek apakah konstanta tidak nol
+        konstanta_non_nol = abs(row[num_vars]) > 1e-10
+
+        if koefisien_nol and konstanta_non_nol:
+            return f"Tidak ada solusi.\nTerjadi inkonsistensi pada baris {i+1} " + \
+                   f"(0 = {row[num_vars]})."
+
+    # Hitung rank efektif (jumlah baris non-nol)
+    rank = 0
+    for i in range(m):
+        if not all(abs(rref_matrix[i][j]) < 1e-10 for j in range(n)):
+            rank += 1
+
+    # Analisis tipe solusi berdasarkan rank
+    if rank < num_vars:
+        # Hitung variabel bebas
+        pivot_cols = []
+        for i in range(m):
+            for j in range(num_vars):
+                if abs(rref_matrix[i][j]) > 1e-10:
+                    pivot_cols.append(j)
+                    break
+
+        free_vars = [i+1 for i in range(num_vars) if i not in pivot_cols]
+        free_vars_str = ", ".join(f"x_{i}" for i in free_vars)
+        return f"Solusi tak hingga banyak.\nJumlah variabel ({num_vars}) > " + \
+               f"Rank matriks ({rank}).\nVariabel bebas: {free_vars_str}"
+
+    # Solusi unik - verifikasi dan dapatkan nilai
+    solution_values = []
+
+    # Pastikan setiap variabel memiliki nilai yang terdefinisi
+    for i in range(num_vars):
+        value_found = False
+        for row_idx in range(m):
+            if abs(rref_matrix[row_idx][i]) > 1e-10:
+                # Pastikan ini adalah baris yang mendefinisikan variabel ini
+                is_defining_row = all(abs(rref_matrix[row_idx][j]) < 1e-10 for j in range(i))
+                if is_defining_row:
+                    value_found = True
+                    solution_values.append(f"x_{i+1} = {rref_matrix[row_idx][-1]}")
+                    break
+
+        if not value_found:
+            return "Tidak ada solusi.\nSistem tidak konsisten."
+
+    if len(solution_values) == num_vars:
+        return "Solusi unik (tunggal).\n" + "\n".join(solution_values)
+    return "Tidak ada solusi.\nSistem tidak konsisten."
 
 #---------------------------------------------------------------------------------------------------
 # Logika untuk kalkulasi RREF dan analisis solusi
@@ -101,171 +316,415 @@ def gauss_jordan_steps(matrix):
 def home():
     return render_template('index.html')
 
+# Penjelasan tetap untuk operasi yang tidak memerlukan analisis solusi
+PENJELASAN = {
+    'ref': "Hasil Eliminasi Gauss (OBE) - Bentuk segitiga atas diperoleh.",
+    'ref-leading-one': "Hasil Eliminasi Gauss dengan Satu Utama - Bentuk segitiga atas dengan leading 1 diperoleh.",
+    'gauss-jordan': "Hasil Eliminasi Gauss-Jordan (Bentuk Tereduksi) diperoleh.",
+}
+
+def rref_bulat(matrix):
+    """
+    Exact RREF of a rational matrix without steps: Bareiss for small inputs,
+    multi-modular (modular.py) from modular.MIN_ROWS rows up
+    """
+    if len(matrix) >= modular.MIN_ROWS:
+        if is_array(matrix):
+            # Array int64 dari input biner langsung dipakai mesin modular
+            return modular.rref(matrix)
+        # Baris diskalakan ke bilangan bulat, RREF-nya tetap sama
+        return modular.rref(bareiss.integer_rows(matrix))
+    return bareiss.rref(matrix)
+
+def hitung(matrix, operation, with_steps=True):
+    """
+    Run one operation on one augmented matrix and build the result payload
+    (with_steps=False leaves 'steps' empty and skips work only needed for them)
+    """
+    result, steps = hitung_trace(matrix, operation, with_steps)
+    if steps is not None:
+        with fase('format'):
+            result['steps'] = format_steps(steps)
+    return result
+
+def hitung_biner(matrix, operation, with_steps=True, admission=None):
+    """
+    hitung() with raw numeric blocks instead of formatted matrices, as one wire.py
+    message; admission (the routing decision) goes into the message metadata
+    """
+    result, steps = hitung_trace(matrix, operation, with_steps, render=wire.encode_matrix)
+    if admission is not None:
+        result['admission'] = admission
+    with fase('format'):
+        if steps is not None:
+            result['steps'] = [(desc, wire.encode_matrix(rows)) for desc, rows in steps.rows_between(0)]
+        return wire.encode_message(result)
+
+def hitung_stream_biner(matrix, operation):
+    """hitung_stream() events as wire.py messages"""
+    for event in hitung_stream(matrix, operation, render=wire.encode_matrix):
+        yield wire.encode_message(event)
+
+def hitung_trace(matrix, operation, with_steps=True, render=format_matrix):
+    """
+    hitung() without formatting the steps: returns (payload with empty
+    'steps', StepTrace of the elimination or None when with_steps is False).
+    render turns the final matrix into its payload value.
+    """
+    # Input rasional (bilangan bulat / pecahan) memakai mesin Bareiss (tanpa SymPy),
+    # selain itu konversi ke Matrix SymPy
+    with fase('convert'):
+        exact = input_eksak(matrix)
+        A = None if exact or operation in ('rref', 'classify', 'hybrid', *FACTOR_OPERATIONS) else sp.Matrix(matrix)
+    
+    result = {
+        'status': 'success',
+        'steps': [],
+        'final_matrix': '',
+        'explanation': ''
+    }
+    steps = None
+    
+    # Operasi Gauss-Jordan tereduksi
+    if operation == 'rref':
+        if exact:
+            with fase('eliminate'):
+                rref_matrix, pivots = rref_bulat(matrix)
+        else:
+            rref_matrix, pivots = rref_float(matrix)
+        if with_steps:
+            with fase('steps'):
+                steps = bareiss.gauss_jordan_steps(matrix) if exact else gauss_jordan_steps(matrix)
+        with fase('format'):
+            result['final_matrix'] = render(rref_matrix)
+        with fase('analyze'):
+            result['explanation'] = analisis_rref(rref_matrix)
+        
+    # Eliminasi Gauss (OBE) - Bentuk segitiga atas
+    elif operation in ('ref', 'ref-leading-one'):
+        leading_one = operation == 'ref-leading-one'
+        with fase('steps'):
+            if exact:
+                steps, current = bareiss.ref_steps(matrix, leading_one)
+            else:
+                steps, current = ref_steps(A, leading_one)
+        with fase('format'):
+            result['final_matrix'] = render(current)
+        result['explanation'] = PENJELASAN[operation]
+        
+    # Eliminasi Gauss-Jordan (Tereduksi)
+    elif operation == 'gauss-jordan':
+        if exact and not with_steps:
+            # Hasil akhir Gauss-Jordan eksak sama dengan RREF
+            with fase('eliminate'):
+                final = rref_bulat(matrix)[0]
+            with fase('format'):
+                result['final_matrix'] = render(final)
+        else:
+            with fase('steps'):
+                steps = bareiss.gauss_jordan_steps(matrix) if exact else gauss_jordan_steps(matrix)
+            with fase('format'):
+                result['final_matrix'] = render(steps.final())
+        result['explanation'] = PENJELASAN[operation]
+
+    # Klasifikasi saja (unik / tak hingga / tidak ada), tanpa langkah
+    elif operation == 'classify':
+        with fase('analyze'):
+            result['classification'], result['explanation'] = klasifikasi(matrix, exact)
+        return result, None
+
+    # Solusi eksak: float + penyempurnaan iteratif + rekonstruksi pecahan (hybrid.py),
+    # mesin eksak hanya dipakai jika hasilnya tidak lolos verifikasi
+    elif operation == 'hybrid':
+        with fase('convert'):
+            rows = bareiss.integer_rows(matrix) if exact else hybrid.to_integer_rows(matrix)
+        with fase('eliminate'):
+            x = hybrid.solve(rows)
+            if x is None:
+                rref_matrix = rref_bulat(rows)[0]
+            else:
+                n = len(x)
+                rref_matrix = [[int(i == j) for j in range(n)] + [x[i]] for i in range(n)]
+                rref_matrix += [[0] * (n + 1) for _ in range(len(rows) - n)]
+        result['engine'] = 'hybrid' if x is not None else 'exact'
+        with fase('format'):
+            result['final_matrix'] = render(rref_matrix)
+        with fase('analyze'):
+            result['explanation'] = analisis_rref(rref_matrix)
+        return result, None
+
+    # Determinan / invers / ruang nol / solusi umum dari LU matriks koefisien
+    elif operation in FACTOR_OPERATIONS:
+        factor = faktor_koefisien(matrix)
+        return hitung_faktor(factor, [row[-1] for row in matrix], operation, render), None
+
+    return result, steps if with_steps else None
+
+def klasifikasi(matrix, exact):
+    """
+    Rank and free variables of an augmented matrix without recording steps:
+    exact pivots for rational input, SVD with a scale-aware tolerance
+    (eliminasi.klasifikasi_solusi) otherwise. Returns (classification, explanation)
+    """
+    if not exact:
+        hasil = eliminasi.klasifikasi_solusi(matrix)
+        return klasifikasi_json(hasil), eliminasi.format_klasifikasi(hasil)
+    rref_matrix, pivots = rref_bulat(matrix)
+    num_vars = len(matrix[0]) - 1
+    pivot_koef = [j for j in pivots if j < num_vars]
+    if len(pivot_koef) < len(pivots):
+        jenis = 'tidak ada'
+    elif len(pivot_koef) < num_vars:
+        jenis = 'tak hingga'
+    else:
+        jenis = 'unik'
+    return {
+        'jenis': jenis,
+        'rank': len(pivot_koef),
+        'num_vars': num_vars,
+        'free_variables': [j + 1 for j in range(num_vars) if j not in pivot_koef],
+        'exact': True,
+    }, analisis_rref(rref_matrix)
+
+def klasifikasi_json(hasil):
+    """Float classification dict ready for jsonify"""
+    # JSON tidak punya Infinity: matriks koefisien singular -> null
+    condition = None if hasil['condition'] == float('inf') else hasil['condition']
+    return {**hasil, 'condition': condition, 'exact': False}
+
+def hitung_stream(matrix, operation, render=format_matrix):
+    """
+    Streaming version of hitung(): yields one event dict per row operation,
+    as soon as it is done, and the final matrix + explanation as the last event.
+    Only the current matrix is kept in memory; render turns it into the event value.
+    """
+    exact = bareiss.is_rational_matrix(matrix)
+    A = None if exact else sp.Matrix(matrix)
+
+    if operation in ('rref', 'gauss-jordan'):
+        ops = bareiss.gauss_jordan_ops(matrix) if exact else gauss_jordan_ops(matrix)
+        initial_desc = "Matriks Awal:"
+    elif operation in ('ref', 'ref-leading-one'):
+        leading_one = operation == 'ref-leading-one'
+        ops = bareiss.ref_ops(matrix, leading_one) if exact else ref_ops(A, leading_one)
+        initial_desc = None
+    else:
+        ops = iter(())
+        initial_desc = None
+
+    current = bareiss.initial_rows(matrix) if exact else A.tolist()
+    m, n = len(current), len(current[0])
+    yield {'event': 'start', 'operation': operation, 'rows': m, 'cols': n}
+
+    index = 0
+    if initial_desc is not None:
+        yield {'event': 'step', 'index': index, 'description': initial_desc,
+               'matrix': render(current)}
+        index += 1
+    for op in ops:
+        apply_op(current, op)
+        yield {'event': 'step', 'index': index, 'description': op.desc, 'op': op.kind,
+               'target': op.target, 'source': op.source, 'matrix': render(current)}
+        index += 1
+
+    result = {'event': 'result', 'status': 'success', 'final_matrix': '', 'explanation': ''}
+    if operation == 'rref':
+        # Bentuk akhir Gauss-Jordan eksak sama dengan RREF; selain itu rref_float seperti hitung()
+        rref_matrix = current if exact else rref_float(matrix)[0]
+        result['final_matrix'] = render(rref_matrix)
+        result['explanation'] = analisis_rref(rref_matrix)
+    elif operation in PENJELASAN:
+        result['final_matrix'] = render(current)
+        result['explanation'] = PENJELASAN[operation]
+    yield result
+
+STREAM_MIMETYPES = {
+    'ndjson': 'application/x-ndjson',
+    'sse': 'text/event-stream',
+    'binary': wire.STREAM_MIMETYPE,
+}
+
+def _stream_mode(data):
+    """Streaming is chosen with {"stream": "ndjson"|"sse"|"binary"} or the Accept header"""
+    mode = data.get('stream')
+    if mode in STREAM_MIMETYPES:
+        return mode
+    best = request.accept_mimetypes.best_match(['application/json', *STREAM_MIMETYPES.values()])
+    for mode, mimetype in STREAM_MIMETYPES.items():
+        if best == mimetype:
+            return mode
+    return None
+
+def error_payload(e):
+    """Error body; pool failures (timeout, busy) also carry a machine-readable code"""
+    payload = {'status': 'error', 'message': str(e)}
+    if isinstance(e, PoolError):
+        payload['error'] = e.code
+    return payload
+
+def pool_error_response(e):
+    return jsonify(error_payload(e)), e.http_status
+
+def stream_response(events, mode):
+    """
+    Serialize events as NDJSON lines or Server-Sent Events, flushed one by one.
+    In binary mode the events are already wire.py messages.
+    """
+    def generate():
+        try:
+            for event in events:
+                if mode == 'binary':
+                    yield event
+                    continue
+                body = app.json.dumps(event)
+                if mode == 'sse':
+                    yield f"event: {event['event']}\ndata: {body}\n\n"
+                else:
+                    yield body + "\n"
+        except Exception as e:
+            error = {'event': 'error', **error_payload(e)}
+            if mode == 'binary':
+                yield wire.encode_message(error)
+                return
+            body = app.json.dumps(error)
+            yield f"event: error\ndata: {body}\n\n" if mode == 'sse' else body + "\n"
+
+    response = app.response_class(stream_with_context(generate()), mimetype=STREAM_MIMETYPES[mode])
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+def antre_stream(keputusan, generator, matrix, operation):
+    """pool.stream() that first waits for an admission slot (queued requests) and holds it to the end"""
+    with admission.slot(keputusan):
+        yield from pool.stream(generator, matrix, operation)
+
+def perkiraan_biaya(matrix, operation, with_steps):
+    """admission.estimate() for /calculate: exact when the engine will be the rational one"""
+    exact = input_eksak(koefisien(matrix) if operation in FACTOR_OPERATIONS else matrix)
+    return estimate(matrix, operation, with_steps, exact)
+
+def is_array(matrix):
+    """NumPy array (binary request body) instead of a list of rows"""
+    return hasattr(matrix, 'dtype')
+
+def input_eksak(matrix):
+    """Input for the exact engines: an int64 array or a rational list matrix"""
+    if is_array(matrix):
+        return matrix.dtype.kind == 'i'
+    return bareiss.is_rational_matrix(matrix)
+
+def jalur_array(matrix, operation, with_steps):
+    """
+    Whether a binary (NumPy) input can stay an array: float64 for the NumPy
+    engines (SVD classify, LU, hybrid), int64 for the multi-modular RREF.
+    Every other path (SymPy, Bareiss, steps) works on lists of Python numbers.
+    """
+    if matrix.dtype.kind == 'f':
+        return operation in ('classify', 'hybrid', *FACTOR_OPERATIONS)
+    return (not with_steps and operation in ('rref', 'gauss-jordan', 'classify')
+            and len(matrix) >= modular.MIN_ROWS)
+
+def baca_permintaan():
+    """
+    Request data of /calculate: the JSON body, or for a binary body
+    (Content-Type application/x-matrix, one wire.py block) the matrix from the
+    block and the other fields from the query string
+    """
+    if request.mimetype != wire.MIMETYPE:
+        return request.get_json()
+    data = {key: request.args[key] for key in ('operation', 'stream') if key in request.args}
+    for key in ('steps', 'paged', 'timing'):
+        if key in request.args:
+            data[key] = request.args[key].lower() not in ('0', 'false', 'no', '')
+    # Array NumPy; calculate() mengubahnya menjadi list hanya untuk jalur yang memerlukannya
+    data['matrix'] = wire.decode_matrix(request.get_data())
+    return data
+
 @app.route('/calculate', methods=['POST'])
 def calculate():
+    timer = PhaseTimer()
     try:
         # Ambil data dari permintaan POST
-        data = request.get_json()
-        matrix = data['matrix']
+        with timer.phase('parse'):
+            data = baca_permintaan()
         operation = data['operation']
-        
-        # Konversi ke Matrix SymPy
-        A = Matrix(matrix)
-        
-        result = {
-            'status': 'success',
-            'steps': [],
-            'final_matrix': '',
-            'explanation': ''
-        }
-        
-        # Operasi Gauss-Jordan tereduksi
-        if operation == 'rref':
-            rref_matrix, pivots = A.rref()
-            steps = gauss_jordan_steps(matrix)
-            result['steps'] = [(step[0], format_matrix(step[1])) for step in steps]
-            result['final_matrix'] = format_matrix(rref_matrix)
-            
-            # Analisis solusi sistem persamaan linear
-            m, n = A.shape
-            num_vars = n - 1  # Kolom terakhir adalah kolom hasil
-
-            # Cek inkonsistensi menggunakan metode yang sama dengan Test.py
-            for i in range(m):
-                row = rref_matrix.row(i)
-                # Cek apakah semua koefisien adalah nol (kecuali kolom terakhir)
-                koefisien_nol = all(abs(row[j]) < 1e-10 for j in range(num_vars))
-                # Cek apakah konstanta tidak nol
-                konstanta_non_nol = abs(row[num_vars]) > 1e-10
-                
-                if koefisien_nol and konstanta_non_nol:
-                    result['explanation'] = f"Tidak ada solusi.\nTerjadi inkonsistensi pada baris {i+1} " + \
-                                         f"(0 = {row[num_vars]})."
-                    return jsonify(result)
-
-            # Hitung rank efektif (jumlah baris non-nol)
-            rank = 0
-            for i in range(m):
-                if not all(abs(rref_matrix[i, j]) < 1e-10 for j in range(n)):
-                    rank += 1
-
-            # Analisis tipe solusi berdasarkan rank
-            if rank < num_vars:
-                # Hitung variabel bebas
-                pivot_cols = []
-                for i in range(m):
-                    for j in range(num_vars):
-                        if abs(rref_matrix[i, j]) > 1e-10:
-                            pivot_cols.append(j)
-                            break
-                
-                free_vars = [i+1 for i in range(num_vars) if i not in pivot_cols]
-                free_vars_str = ", ".join(f"x_{i}" for i in free_vars)
-                result['explanation'] = f"Solusi tak hingga banyak.\nJumlah variabel ({num_vars}) > " + \
-                                     f"Rank matriks ({rank}).\nVariabel bebas: {free_vars_str}"
-            else:
-                # Solusi unik - verifikasi dan dapatkan nilai
-                solution_found = True
-                solution_values = []
-                
-                # Pastikan setiap variabel memiliki nilai yang terdefinisi
-                for i in range(num_vars):
-                    value_found = False
-                    for row_idx in range(m):
-                        if abs(rref_matrix[row_idx, i]) > 1e-10:
-                            # Pastikan ini adalah baris yang mendefinisikan variabel ini
-                            is_defining_row = all(abs(rref_matrix[row_idx, j]) < 1e-10 for j in range(i))
-                            if is_defining_row:
-                                value_found = True
-                                solution_values.append(f"x_{i+1} = {rref_matrix[row_idx, -1]}")
-                                break
-                    
-                    if not value_found:
-                        solution_found = False
-                        break
-                
-                if solution_found and len(solution_values) == num_vars:
-                    result['explanation'] = "Solusi unik (tunggal).\n" + "\n".join(solution_values)
+        if 'sparse' in data:
+            return calculate_sparse(data['sparse'], operation)
+        matrix = data['matrix']
+        if operation == 'parametric':
+            return calculate_parametric(matrix.tolist() if is_array(matrix) else matrix, data.get('parameter', 'k'))
+        with_steps = bool(data.get('steps', True))
+        mode = _stream_mode(data) if operation not in FACTOR_OPERATIONS else None
+        paged = with_steps and bool(data.get('paged')) and operation not in FACTOR_OPERATIONS
+        if is_array(matrix) and (mode is not None or paged or not jalur_array(matrix, operation, with_steps)):
+            # Bilangan bulat int64 menjadi int Python agar memakai mesin eksak
+            with timer.phase('parse'):
+                matrix = matrix.tolist()
+
+        # Perkiraan biaya sebelum pekerjaan apa pun; langkah streaming/halaman tidak
+        # bisa dihilangkan, jadi permintaan itu hanya diterima, diantrekan atau ditolak
+        with timer.phase('admission'):
+            keputusan = admission.decide(perkiraan_biaya(matrix, operation, with_steps),
+                                         steps_required=mode is not None or paged)
+        with_steps = keputusan.with_steps
+
+        # Mode streaming: langkah dikirim satu per satu (tanpa cache). Operasi dari
+        # faktorisasi tidak punya langkah dan selalu dijawab sebagai satu respons
+        if mode is not None:
+            generator = hitung_stream_biner if mode == 'binary' else hitung_stream
+            return stream_response(antre_stream(keputusan, generator, matrix, operation), mode)
+
+        # Mode halaman: langkah disimpan tanpa diformat, diambil lewat /steps/<id>
+        if paged:
+            return jsonify(calculate_paged(matrix, operation, timer, keputusan))
+
+        # Format respons dipilih lewat Accept: JSON (default) atau biner wire.py
+        binary = request.accept_mimetypes.best_match(['application/json', wire.MIMETYPE]) == wire.MIMETYPE
+        options = {'binary': True} if binary else {}
+        if keputusan.routed:
+            options['routed'] = True
+
+        # Hasil yang sama sudah pernah dihitung -> kirim payload dari cache
+        with timer.phase('cache'):
+            key = cache_key(matrix, operation, normalize_rows=_rref_like(operation, with_steps),
+                            steps=with_steps, **options)
+            payload = result_cache.get(key)
+        if payload is None:
+            with admission.slot(keputusan) as tunggu:
+                if tunggu:
+                    timer.add('queue', tunggu)
+                fungsi = hitung_biner if binary else hitung
+                args = (matrix, operation, with_steps)
+                if binary and keputusan.routed:
+                    # Payload biner dibuat di pekerja, jadi catatan pengalihan ikut dikirim
+                    args += (keputusan.as_dict(),)
+                mulai = time.perf_counter()
+                if binary:
+                    payload, phases = pool.run(metrics.timed, fungsi, *args)
                 else:
-                    result['explanation'] = "Tidak ada solusi.\nSistem tidak konsisten."
-            
-        # Eliminasi Gauss (OBE) - Bentuk segitiga atas
-        elif operation == 'ref':
-            ref_steps = []
-            current = A.copy()
-            m, n = A.shape
-            
-            for i in range(min(m, n)):
-                # Cari pivot selain nol
-                pivot_found = False
-                for j in range(i, m):
-                    if current[j, i] != 0:
-                        if j != i:
-                            current.row_swap(i, j)
-                            ref_steps.append((f"Tukar baris {i+1} dan {j+1}:", current.copy()))
-                        pivot_found = True
-                        break
-                
-                if not pivot_found:
-                    continue
-                    
-                # Eliminasi di bawah pivot (tanpa membuat pivot = 1)
-                for j in range(i + 1, m):
-                    if current[j, i] != 0:
-                        factor = current[j, i] / current[i, i]
-                        current.row_op(j, lambda x, k: x - factor*current[i, k])
-                        ref_steps.append((f"R{j+1} = R{j+1} - {factor}*R{i+1}:", current.copy()))
-            
-            result['steps'] = [(step[0], format_matrix(step[1])) for step in ref_steps]
-            result['final_matrix'] = format_matrix(current)
-            result['explanation'] = "Hasil Eliminasi Gauss (OBE) - Bentuk segitiga atas diperoleh."
-            
-        # Eliminasi Gauss dengan Satu Utama
-        elif operation == 'ref-leading-one':
-            ref_steps = []
-            current = A.copy()
-            m, n = A.shape
-            
-            for i in range(min(m, n)):
-                # Cari pivot selain nol
-                pivot_found = False
-                for j in range(i, m):
-                    if current[j, i] != 0:
-                        if j != i:
-                            current.row_swap(i, j)
-                            ref_steps.append((f"Tukar baris {i+1} dan {j+1}:", current.copy()))
-                        pivot_found = True
-                        break
-                
-                if not pivot_found:
-                    continue
-                
-                # Buat pivot menjadi 1
-                pivot_val = current[i, i]
-                if pivot_val != 1:
-                    current.row_op(i, lambda x, k: x/pivot_val)
-                    ref_steps.append((f"R{i+1} = R{i+1}/{pivot_val} (Membuat pivot = 1):", current.copy()))
-                    
-                # Eliminasi di bawah pivot
-                for j in range(i + 1, m):
-                    if current[j, i] != 0:
-                        factor = current[j, i]
-                        current.row_op(j, lambda x, k: x - factor*current[i, k])
-                        ref_steps.append((f"R{j+1} = R{j+1} - {factor}*R{i+1}:", current.copy()))
-            
-            result['steps'] = [(step[0], format_matrix(step[1])) for step in ref_steps]
-            result['final_matrix'] = format_matrix(current)
-            result['explanation'] = "Hasil Eliminasi Gauss dengan Satu Utama - Bentuk segitiga atas dengan leading 1 diperoleh."
-            
-        # Eliminasi Gauss-Jordan (Tereduksi)
-        elif operation == 'gauss-jordan':
-            steps = gauss_jordan_steps(matrix)
-            result['steps'] = [(step[0], format_matrix(step[1])) for step in steps]
-            result['final_matrix'] = format_matrix(steps[-1][1])
-            result['explanation'] = "Hasil Eliminasi Gauss-Jordan (Bentuk Tereduksi) diperoleh."
+                    result, phases = pool.run(metrics.timed, fungsi, *args)
+            # Selisih waktu pool dengan fase di dalam pekerja = antre + kirim data antarproses
+            timer.add('pool', time.perf_counter() - mulai - sum(phases.values()))
+            timer.merge(phases)
+            if not binary:
+                if keputusan.routed:
+                    result['admission'] = keputusan.as_dict()
+                with timer.phase('serialize'):
+                    payload = jsonify(result).get_data()
+            result_cache.put(key, payload)
 
-        # Kirim hasil sebagai JSON    
-        return jsonify(result)
+        # Kirim hasil sebagai JSON / biner
+        response = app.response_class(payload, mimetype=wire.MIMETYPE if binary else 'application/json')
+        response.headers['X-Admission'] = keputusan.action + ('; routed' if keputusan.routed else '')
+        observe_request(operation, matrix, timer)
+        if data.get('timing') or request.headers.get('X-Timing'):
+            response.headers['Server-Timing'] = timer.server_timing()
+        return response
+
+    # Batas waktu habis / semua pekerja sibuk
+    except PoolError as e:
+        return pool_error_response(e)
 
     # menangani kesalahan jika terjadi error pas proses
     except Exception as e:
@@ -274,6 +733,733 @@ def calculate():
             'message': str(e)
         })
 
+#---------------------------------------------------------------------------------------------------
+# Langkah per halaman
+STEPS_PAGE_MAX = 200
+
+def calculate_paged(matrix, operation, timer, keputusan):
+    """
+    Compute once and keep the StepTrace in step_store; the payload carries
+    a result id and the step count instead of formatted steps
+    """
+    result_id = cache_key(matrix, operation, paged=True)
+    with timer.phase('cache'):
+        stored = step_store.get(result_id)
+    if stored is None:
+        with admission.slot(keputusan) as tunggu:
+            if tunggu:
+                timer.add('queue', tunggu)
+            mulai = time.perf_counter()
+            (result, steps), phases = pool.run(metrics.timed, hitung_trace, matrix, operation, True)
+        timer.add('pool', time.perf_counter() - mulai - sum(phases.values()))
+        timer.merge(phases)
+        stored = (result, steps)
+        step_store.put(result_id, stored)
+    result, steps = stored
+    observe_request(operation, matrix, timer)
+    return {
+        **result,
+        'result_id': result_id,
+        'step_count': len(steps) if steps is not None else 0,
+    }
+
+@app.route('/steps/<result_id>')
+def steps_page(result_id):
+    try:
+        stored = step_store.get(result_id)
+        if stored is None:
+            raise ValueError("Hasil tidak ditemukan atau sudah kedaluwarsa, panggil /calculate lagi")
+        _, steps = stored
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        limit = min(max(request.args.get('limit', 20, type=int), 0), STEPS_PAGE_MAX)
+        step_count = len(steps) if steps is not None else 0
+        return jsonify({
+            'status': 'success',
+            'result_id': result_id,
+            'offset': offset,
+            'limit': limit,
+            'step_count': step_count,
+            # Hanya langkah di halaman ini yang diformat
+            'steps': format_steps(steps, offset, offset + limit) if steps is not None else [],
+        })
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+
+#---------------------------------------------------------------------------------------------------
+# Input sparse: {"shape": [m, n], "entries": [[baris, kolom, nilai], ...]}
+def hitung_sparse(shape, entries, operation):
+    """
+    Classify a sparse augmented system with the Markowitz engine (sparse.py).
+    Only 'rref' is supported and no steps are produced; explanation and
+    classification match the 'classify' operation, fill-in statistics are added.
+    """
+    if operation != 'rref':
+        raise ValueError("Input sparse hanya mendukung operasi 'rref'")
+    rows = sparse.from_coo(shape, entries)
+    hasil, stats = sparse.klasifikasi_sparse(rows, int(shape[1]))
+    return {
+        'status': 'success',
+        'steps': [],
+        'final_matrix': '',
+        'explanation': eliminasi.format_klasifikasi(hasil),
+        'classification': hasil,
+        'fill_in': stats,
+    }
+
+def calculate_sparse(data, operation):
+    shape = data['shape']
+    entries = sorted(data['entries'])
+    # Perkiraan dari ukuran, nnz dan lebar pita, sebelum from_coo membuat satu dict per baris
+    keputusan = admission.decide(estimate_sparse(shape, entries))
+    key = cache_key(entries, operation, sparse=list(shape))
+    payload = result_cache.get(key)
+    if payload is None:
+        with admission.slot(keputusan):
+            payload = jsonify(pool.run(hitung_sparse, shape, entries, operation)).get_data()
+        result_cache.put(key, payload)
+    return app.response_class(payload, mimetype='application/json')
+
+#---------------------------------------------------------------------------------------------------
+# Sistem parametrik: elemen boleh berupa polinomial dalam satu parameter, misal "2k - 1"
+def hitung_parametrik(matrix, parameter):
+    """
+    Eliminate once over polynomials in the parameter (parametric.py) and
+    report the critical values and the classification of every region.
+    final_matrix is the fraction-free echelon form of the generic case.
+    """
+    hasil = parametric.analisis_parametrik(matrix, parameter)
+    return {
+        'status': 'success',
+        'steps': [],
+        'final_matrix': _format_cells(hasil['echelon'], [[len(x) for x in row] for row in hasil['echelon']]),
+        'explanation': parametric.format_parametrik(hasil),
+        'parametric': {key: hasil[key] for key in ('parameter', 'generic', 'critical_values', 'regions')},
+    }
+
+def calculate_parametric(matrix, parameter):
+    keputusan = admission.decide(estimate_parametric(matrix, parameter))
+    key = cache_key(matrix, 'parametric', parameter=parameter)
+    payload = result_cache.get(key)
+    if payload is None:
+        with admission.slot(keputusan):
+            payload = jsonify(pool.run(hitung_parametrik, matrix, parameter)).get_data()
+        result_cache.put(key, payload)
+    return app.response_class(payload, mimetype='application/json')
+
+#---------------------------------------------------------------------------------------------------
+# Banyak sistem dalam satu permintaan
+# operasi -> (make_one, jordan) untuk jalur float NumPy; rref memakai eliminasi.rref_batch
+ELIMINASI_BATCH = {
+    'ref': (False, False),
+    'ref-leading-one': (True, False),
+    'gauss-jordan': (True, True),
+}
+
+def _is_float_matrix(matrix):
+    """
+    Rectangular list of rows whose entries are all floats (an int entry stays an
+    exact Integer / Rational in SymPy, which the float64 stack cannot reproduce)
+    """
+    try:
+        cols = len(matrix[0])
+        return cols > 0 and all(
+            len(row) == cols and all(type(x) is float for x in row) for row in matrix
+        )
+    except (TypeError, IndexError, KeyError):
+        return False
+
+def _matrix_batch(mat, dihitung, pivots=None):
+    """
+    One stacked result as SymPy holds it: Float entries, an exact 0 where an
+    arithmetic result is zero (an untouched input 0.0 stays 0.0) and exact 1 at
+    the rref pivots
+    """
+    rows = [[0 if d and x == 0 else sp.Float(x) for x, d in zip(row, flags)]
+            for row, flags in zip(mat.tolist(), dihitung.tolist())]
+    for i, c in enumerate([] if pivots is None else pivots.tolist()):
+        if c >= 0:
+            rows[i][c] = 1
+    return sp.Matrix(rows)
+
+def _rref_like(operation, with_steps):
+    """Payload only depends on the RREF, so row-scaled duplicates can share a cache key"""
+    return not with_steps and operation in ('rref', 'gauss-jordan')
+
+def _payload(result, key):
+    """Serialize one item result; only successful results go into the cache"""
+    payload = app.json.dumps(result).encode('utf-8')
+    if key is not None and result['status'] == 'success':
+        result_cache.put(key, payload)
+    return payload
+
+def hitung_batch(matrices, operation, with_steps=False):
+    """
+    Compute many systems at once. Same-shape all-float inputs are stacked into
+    a 3-D array and eliminated together with the row operations /calculate
+    makes, so each item equals its /calculate result; everything else goes
+    through hitung().
+    Returns one JSON payload (bytes) per item, served from result_cache when
+    possible. A failing item becomes an error entry instead of aborting the batch.
+    """
+    payloads = [None] * len(matrices)
+    keys = [None] * len(matrices)
+    groups = {}
+    sisa = []
+
+    for idx, matrix in enumerate(matrices):
+        batch_float = (not with_steps and (operation == 'rref' or operation in ELIMINASI_BATCH)
+                       and _is_float_matrix(matrix))
+        try:
+            keys[idx] = cache_key(matrix, operation, normalize_rows=_rref_like(operation, with_steps),
+                                  steps=with_steps, batch=batch_float)
+            payloads[idx] = result_cache.get(keys[idx])
+        except Exception:
+            pass
+        if payloads[idx] is not None:
+            continue
+        if batch_float:
+            groups.setdefault((len(matrix), len(matrix[0])), []).append(idx)
+        else:
+            sisa.append(idx)
+
+    # Operasi baris yang sama dengan /calculate pada Float SymPy, jadi hasilnya identik
+    for indices in groups.values():
+        try:
+            stack = np.array([matrices[idx] for idx in indices], dtype=np.float64)
+            # Overflow / pembagian dengan nol sudah ditandai lewat valid
+            with np.errstate(all='ignore'):
+                if operation == 'rref':
+                    mats, dihitung, valid, pivots = eliminasi.rref_batch(stack)
+                else:
+                    mats, dihitung, valid = eliminasi.eliminasi_gauss_batch(stack, *ELIMINASI_BATCH[operation])
+                    pivots = [None] * len(indices)
+        except Exception as e:
+            for idx in indices:
+                payloads[idx] = _payload({'status': 'error', 'message': str(e)}, None)
+            continue
+        for k, idx in enumerate(indices):
+            if not valid[k]:
+                # Nilai di luar rentang float normal (Float SymPy tidak membulatkan seperti
+                # float64 di sana) atau pembagian dengan pivot 0.0: dihitung lewat hitung()
+                sisa.append(idx)
+                continue
+            try:
+                final = _matrix_batch(mats[k], dihitung[k], pivots[k])
+                result = {
+                    'status': 'success',
+                    'steps': [],
+                    'final_matrix': format_matrix(final),
+                    'explanation': analisis_rref(final) if operation == 'rref' else PENJELASAN[operation],
+                }
+            except Exception as e:
+                result = {'status': 'error', 'message': str(e)}
+            payloads[idx] = _payload(result, keys[idx])
+
+    for idx in sorted(sisa):
+        matrix = matrices[idx]
+        try:
+            # Setiap item diperkirakan seperti /calculate; yang terlalu mahal menjadi error
+            # too_expensive, yang dialihkan tanpa langkah tidak disimpan di cache
+            keputusan = admission.decide(perkiraan_biaya(matrix, operation, with_steps))
+            with admission.slot(keputusan):
+                result = pool.run(hitung, matrix, operation, keputusan.with_steps)
+            if keputusan.routed:
+                result['admission'] = keputusan.as_dict()
+                keys[idx] = None
+        except Exception as e:
+            result = error_payload(e)
+        payloads[idx] = _payload(result, keys[idx])
+
+    return payloads
+
+@app.route('/calculate-batch', methods=['POST'])
+def calculate_batch():
+    try:
+        data = request.get_json()
+        matrices = data['matrices']
+        operation = data['operation']
+        with_steps = bool(data.get('steps', False))
+
+        # Payload per item sudah berupa JSON, cukup digabung
+        payloads = hitung_batch(matrices, operation, with_steps)
+        body = b'{"results":[' + b','.join(payloads) + b'],"status":"success"}\n'
+        return app.response_class(body, mimetype='application/json')
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+
+#---------------------------------------------------------------------------------------------------
+# Faktorkan sekali, selesaikan banyak ruas kanan
+
+def analisis_lu(factor, inkonsisten, x):
+    """
+    Explanation for one RHS solved with an LU factor, worded exactly like
+    analisis_rref() on the RREF of the augmented matrix [A | b]
+    """
+    m, n = factor.shape
+    rows = []
+    for k, c in enumerate(factor.pivots):
+        row = [0] * (n + 1)
+        row[c] = 1
+        if x is not None:
+            row[n] = x[c] if factor.exact or not x[c] else sp.Float(x[c])
+        rows.append(row)
+    if inkonsisten:
+        # Baris inkonsisten pada RREF [A | b] berada tepat setelah baris pivot: 0 = 1
+        rows.append([0] * n + [1])
+    rows += [[0] * (n + 1) for _ in range(m - len(rows))]
+    return analisis_rref(rows)
+
+# Operasi /calculate yang dihitung dari LU matriks koefisien A (kolom terakhir = b)
+FACTOR_OPERATIONS = ('det', 'inverse', 'nullspace', 'general')
+
+def nilai_lu(factor, x):
+    """A value computed from an LU factor as displayed: Fraction, or SymPy Float (0 for zero)"""
+    if factor.exact:
+        return x
+    return sp.Float(x) if x else 0
+
+def koefisien(matrix):
+    """Coefficient part A of an augmented matrix [A | b]"""
+    if len(matrix[0]) < 2:
+        raise ValueError("Matriks augmented harus memiliki minimal 2 kolom")
+    if is_array(matrix):
+        return matrix[:, :-1]
+    return [row[:-1] for row in matrix]
+
+def faktor_koefisien(matrix):
+    """
+    LU of the coefficient part from this process's factor_cache, factorized on
+    a miss. Called inside the pool job, so the factor stays in the worker that
+    made it instead of being pickled on every request; the handle is the one
+    /factorize returns for the same coefficients.
+    """
+    A = koefisien(matrix)
+    handle = cache_key(A, 'lu')
+    factor = factor_cache.get(handle)
+    if factor is None:
+        with fase('factorize'):
+            factor = lu.factorize(A)
+        factor_cache.put(handle, factor)
+    return factor
+
+def _rref_angka(matrix):
+    """
+    Matrix.rref() replayed on int/float entries without SymPy objects: the same
+    fraction-free row operations, pivot choice (largest |x| in a column holding
+    a Float, else the first nonzero) and normalization at the end. Floats are
+    kept as raw mpmath values and rounded with the same libmp calls (53 bits,
+    round-to-nearest) that sympy.Float makes, so the result is bit-identical.
+    """
+    from mpmath import libmp
+    bits, rnd = 53, libmp.round_nearest
+
+    def mpf(x):
+        return x if type(x) is tuple else libmp.from_int(x, bits, rnd)
+
+    def nol(x):
+        # Hasil aritmetika yang nol menjadi 0 eksak, seperti Float._new -> S.Zero
+        return 0 if x == libmp.fzero else x
+
+    def kali(x, y):
+        if type(x) is int and type(y) is int:
+            return x * y
+        return nol(libmp.mpf_mul(mpf(x), mpf(y), bits, rnd))
+
+    def kurang(x, y):
+        if type(x) is int and type(y) is int:
+            return x - y
+        return nol(libmp.mpf_sub(mpf(x), mpf(y), bits, rnd))
+
+    def bagi(x, pivot):
+        if type(x) is int:
+            if type(pivot) is int:
+                return Fraction(x, pivot)
+            # Integer / Float dihitung SymPy sebagai Integer * (1 / Float)
+            return kali(x, libmp.mpf_div(libmp.fone, pivot, bits, rnd))
+        return nol(libmp.mpf_div(x, mpf(pivot), bits, rnd))
+
+    def mutlak(x):
+        return libmp.mpf_abs(x) if type(x) is tuple else libmp.from_int(abs(x))
+
+    mat = [[libmp.from_float(x) if type(x) is float else x for x in row] for row in matrix]
+    m, n = len(mat), len(mat[0])
+    pivots = []
+    r = 0
+    for c in range(n):
+        if r >= m:
+            break
+        kolom = [mat[i][c] for i in range(r, m)]
+        if any(type(x) is tuple for x in kolom):
+            k, terbesar = None, libmp.fzero
+            for i, x in enumerate(kolom):
+                if libmp.mpf_cmp(mutlak(x), terbesar) > 0:
+                    k, terbesar = r + i, mutlak(x)
+        else:
+            k = next((r + i for i, x in enumerate(kolom) if x != 0), None)
+        if k is None:
+            continue
+        mat[r], mat[k] = mat[k], mat[r]
+        pivot, baris_pivot = mat[r][c], mat[r]
+        for i in range(m):
+            val = mat[i][c]
+            if i != r and val != 0 and val != libmp.fzero:
+                mat[i] = [kurang(kali(pivot, x), kali(val, y)) for x, y in zip(mat[i], baris_pivot)]
+        pivots.append(c)
+        r += 1
+    for i, c in enumerate(pivots):
+        pivot = mat[i][c]
+        mat[i][c] = 1
+        for j in range(c + 1, n):
+            mat[i][j] = bagi(mat[i][j], pivot)
+    return mat, tuple(pivots)
+
+def rref_float(matrix):
+    """
+    Matrix.rref() of a non-rational [A | b]: replayed without SymPy objects
+    (_rref_angka) when every entry is an int or float, SymPy itself otherwise
+    (symbols, expressions, mixed fraction strings)
+    """
+    with fase('eliminate'):
+        if not all(type(x) in (int, float) for row in matrix for x in row):
+            return sp.Matrix(matrix).rref()
+        rows, pivots = _rref_angka(matrix)
+        return sp.Matrix([[sp.Float._new(x, 53, zero=False) if type(x) is tuple else x for x in row] for row in rows]), pivots
+
+def solusi_umum(factor, xp, basis):
+    """Parametric general solution x = xp + t_1 v_1 + ... + t_k v_k, one line per variable"""
+    t = sp.symbols(f't_1:{len(basis) + 1}')
+    lines = []
+    for i in range(factor.shape[1]):
+        expr = sp.sympify(nilai_lu(factor, xp[i]))
+        expr += sum(sp.sympify(nilai_lu(factor, v[i])) * t_k for v, t_k in zip(basis, t))
+        lines.append(f"x_{i + 1} = {expr}")
+    return lines
+
+def hitung_faktor(factor, b, operation, render=format_matrix):
+    """
+    det / inverse / nullspace / general for [A | b] from the LU factor of A,
+    as a /calculate payload without steps
+    """
+    result = {
+        'status': 'success',
+        'steps': [],
+        'final_matrix': '',
+        'explanation': ''
+    }
+    with fase('eliminate'):
+        if operation == 'det':
+            det = factor.determinant()
+        elif operation == 'inverse':
+            inverse = factor.inverse()
+        elif operation == 'nullspace':
+            basis = factor.nullspace()
+        else:
+            inkonsisten, xp = factor.particular(b)
+            basis = factor.nullspace() if not inkonsisten else []
+
+    with fase('format'):
+        if operation == 'det':
+            result['determinant'] = str(nilai_lu(factor, det))
+            result['explanation'] = f"Determinan matriks koefisien: det(A) = {result['determinant']}."
+        elif operation == 'inverse':
+            if inverse is None:
+                result['explanation'] = "Invers tidak ada: matriks koefisien singular (det(A) = 0)."
+            else:
+                result['final_matrix'] = render([[nilai_lu(factor, x) for x in row] for row in inverse])
+                result['explanation'] = "Invers matriks koefisien A^-1 diperoleh."
+        elif operation == 'nullspace':
+            result['nullspace'] = [[str(nilai_lu(factor, x)) for x in v] for v in basis]
+            if basis:
+                # Vektor basis sebagai kolom
+                result['final_matrix'] = render([[nilai_lu(factor, v[i]) for v in basis]
+                                                 for i in range(factor.shape[1])])
+                result['explanation'] = (f"Ruang nol matriks koefisien berdimensi {len(basis)}; "
+                                         f"basisnya adalah kolom-kolom hasil akhir.")
+            else:
+                result['explanation'] = "Ruang nol matriks koefisien hanya berisi vektor nol."
+        else:
+            if inkonsisten or not basis:
+                result['explanation'] = analisis_lu(factor, inkonsisten, xp)
+            else:
+                result['final_matrix'] = render(
+                    [[nilai_lu(factor, xp[i])] + [nilai_lu(factor, v[i]) for v in basis]
+                     for i in range(factor.shape[1])])
+                result['explanation'] = "\n".join([
+                    "Solusi tak hingga banyak.",
+                    "Solusi umum x = x_p + t_1 v_1 + ... (kolom hasil akhir: x_p, v_1, ...):",
+                    *solusi_umum(factor, xp, basis),
+                ])
+            result['particular'] = None if xp is None else [str(nilai_lu(factor, x)) for x in xp]
+            result['nullspace'] = [[str(nilai_lu(factor, x)) for x in v] for v in basis]
+    return result
+
+@app.route('/factorize', methods=['POST'])
+def factorize():
+    try:
+        matrix = request.get_json()['matrix']
+        # Handle berbasis isi: matriks yang sama memakai faktorisasi yang sama
+        handle = cache_key(matrix, 'lu')
+        factor = factor_cache.get(handle)
+        if factor is None:
+            factor = pool.run(lu.factorize, matrix)
+            factor_cache.put(handle, factor)
+        return jsonify({
+            'status': 'success',
+            'handle': handle,
+            'shape': list(factor.shape),
+            'rank': factor.rank,
+            'exact': factor.exact,
+            'expires_in': factor_cache.ttl,
+        })
+    except PoolError as e:
+        return pool_error_response(e)
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+
+@app.route('/solve', methods=['POST'])
+def solve():
+    try:
+        data = request.get_json()
+        factor = factor_cache.get(data['handle'])
+        if factor is None:
+            raise ValueError("Faktorisasi tidak ditemukan atau sudah kedaluwarsa, panggil /factorize lagi")
+        results = []
+        for inkonsisten, x in factor.solve(data['rhs']):
+            results.append({
+                'explanation': analisis_lu(factor, inkonsisten, x),
+                'solution': None if x is None else [str(v) for v in x],
+            })
+        return jsonify({'status': 'success', 'results': results})
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+
+#---------------------------------------------------------------------------------------------------
+# Upload matriks biner besar (.npy / float64 mentah), diklasifikasi out-of-core (blocked.py)
+UPLOAD_DIR = os.environ.get('UPLOAD_DIR') or None
+UPLOAD_MAX_BYTES = int(os.environ.get('UPLOAD_MAX_BYTES', 2 * 1024 ** 3))
+UPLOAD_CHUNK = 1024 * 1024
+
+def simpan_upload(stream, path):
+    """Copy an upload to path in chunks, the whole file is never held in memory"""
+    total = 0
+    with open(path, 'wb') as f:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK)
+            if not chunk:
+                break
+            total += len(chunk)
+            admission.check_size(total, UPLOAD_MAX_BYTES, "File")
+            f.write(chunk)
+
+@app.route('/upload', methods=['POST'])
+def upload():
+    """
+    Classify a large system sent as a .npy file, or as raw little-endian float64
+    with ?rows=&cols=. The file is the request body or the multipart field 'matrix'.
+    """
+    try:
+        # Content-Length diperiksa sebelum apa pun ditulis ke disk
+        admission.check_size(request.content_length, UPLOAD_MAX_BYTES, "File")
+    except PoolError as e:
+        return pool_error_response(e)
+    fd, path = tempfile.mkstemp(suffix='.upload', dir=UPLOAD_DIR)
+    os.close(fd)
+    try:
+        if request.mimetype == 'multipart/form-data':
+            stream = request.files['matrix'].stream
+        else:
+            stream = request.stream
+        simpan_upload(stream, path)
+        rows = request.args.get('rows', type=int)
+        cols = request.args.get('cols', type=int)
+        if (rows is None) != (cols is None):
+            raise ValueError("File float64 mentah memerlukan rows dan cols")
+        shape = None if rows is None else (rows, cols)
+
+        # Ukuran dari header .npy / rows x cols, tanpa membaca isinya
+        keputusan = admission.decide(estimate_upload(*blocked.open_matrix(path, shape).shape))
+        with admission.slot(keputusan):
+            hasil = pool.run(blocked.klasifikasi_file, path, shape, UPLOAD_DIR)
+        return jsonify({
+            'status': 'success',
+            'classification': klasifikasi_json(hasil),
+            'explanation': eliminasi.format_klasifikasi(hasil),
+        })
+    except PoolError as e:
+        return pool_error_response(e)
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+    finally:
+        os.remove(path)
+
+#---------------------------------------------------------------------------------------------------
+# Sesi penyuntingan: ubah satu elemen/baris, selesaikan ulang O(n^2) (incremental.py)
+def sesi_payload(session_id, solver, refactored):
+    inkonsisten, x = solver.solve()
+    return {
+        'status': 'success',
+        'session': session_id,
+        'explanation': analisis_lu(solver, inkonsisten, x),
+        'solution': None if x is None else [str(v) for v in x],
+        'refactored': refactored,
+        'updates': solver.updates,
+        'refactors': solver.refactors,
+    }
+
+def faktor_pool(A):
+    """lu.factorize in the worker pool, for IncrementalSolver refactors"""
+    return pool.run(lu.factorize, A)
+
+@app.route('/session', methods=['POST'])
+def session_create():
+    try:
+        matrix = request.get_json()['matrix']
+        # Biaya sesi = satu faktorisasi LU, seperti operasi 'general'
+        keputusan = admission.decide(perkiraan_biaya(matrix, 'general', False))
+        with admission.slot(keputusan):
+            solver = pool.run(incremental.IncrementalSolver, matrix)
+        session_id = secrets.token_hex(16)
+        # Satu kunci per sesi: perubahan pada sesi yang sama dijalankan berurutan
+        session_store.put(session_id, (solver, threading.Lock()))
+        return jsonify(sesi_payload(session_id, solver, True))
+    except PoolError as e:
+        return pool_error_response(e)
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+
+@app.route('/session/<session_id>/edit', methods=['POST'])
+def session_edit(session_id):
+    """Body {"row", "col", "value"} for one entry or {"row", "values"} for a whole row"""
+    try:
+        data = request.get_json()
+        stored = session_store.get(session_id)
+        if stored is None:
+            raise ValueError("Sesi tidak ditemukan atau sudah kedaluwarsa, buat sesi baru")
+        solver, lock = stored
+        with lock:
+            # Pembaruan rank-1 O(n^2) di sini; faktorisasi ulang O(n^3) di pool pekerja
+            if 'values' in data:
+                refactored = solver.set_row(int(data['row']), data['values'], faktor_pool)
+            else:
+                refactored = solver.set_cell(int(data['row']), int(data['col']), data['value'], faktor_pool)
+            return jsonify(sesi_payload(session_id, solver, refactored))
+    except PoolError as e:
+        return pool_error_response(e)
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+
+@app.route('/cache-stats')
+def cache_stats():
+    stats = result_cache.stats()
+    stats['factorizations'] = factor_cache.stats()
+    stats['sessions'] = session_store.stats()
+    return jsonify(stats)
+
+#---------------------------------------------------------------------------------------------------
+# Metrik
+OPERATIONS = ('rref', 'ref', 'ref-leading-one', 'gauss-jordan', 'classify', 'hybrid', *FACTOR_OPERATIONS)
+
+def observe_request(operation, matrix, timer):
+    """Record one finished /calculate request in the latency histograms"""
+    labels = {
+        # Label dibatasi ke nilai yang dikenal agar jumlah seri tidak meledak
+        'operation': operation if operation in OPERATIONS else 'other',
+        'size': metrics.size_bucket(len(matrix), len(matrix[0]) if len(matrix) else 0),
+    }
+    if startup['first_request_seconds'] is None:
+        startup['first_request_seconds'] = timer.total()
+        startup['first_request_operation'] = labels['operation']
+    metrics_registry.observe('matrix_calculate_duration_seconds', labels, timer.total())
+    for phase, seconds in timer.phases.items():
+        metrics_registry.observe('matrix_calculate_phase_seconds', {'phase': phase, **labels}, seconds)
+
+@app.route('/metrics')
+def metrics_endpoint():
+    cache = result_cache.stats()
+    workers = pool.stats()
+    antrean = admission.stats()
+    extra = [
+        ('matrix_result_cache_hits_total', 'counter', "Result cache hits", cache['hits']),
+        ('matrix_result_cache_misses_total', 'counter', "Result cache misses", cache['misses']),
+        ('matrix_result_cache_bytes', 'gauge', "Bytes held by the result cache", cache['bytes']),
+        ('matrix_pool_busy_workers', 'gauge', "Worker processes running a job", workers['busy']),
+        ('matrix_pool_waiting_requests', 'gauge', "Requests waiting for a worker", workers['waiting']),
+        ('matrix_pool_timeouts_total', 'counter', "Jobs killed by the timeout", workers['timeouts']),
+        ('matrix_pool_rejected_total', 'counter', "Jobs rejected because all workers were busy", workers['rejected']),
+        ('matrix_admission_queue_depth', 'gauge', "Expensive requests waiting for an admission slot",
+         antrean['queue_depth']),
+        ('matrix_admission_active_jobs', 'gauge', "Expensive requests holding an admission slot", antrean['active']),
+        ('matrix_admission_decisions_total', 'counter', "Admission decisions for /calculate",
+         [({'decision': nama}, jumlah) for nama, jumlah in antrean['decisions'].items()]),
+        ('matrix_admission_rejected_total', 'counter', "Rejected /calculate requests by reason",
+         [({'reason': nama}, jumlah) for nama, jumlah in antrean['rejected'].items()]),
+        ('matrix_admission_routed_total', 'counter', "Requests computed without steps to stay within budget",
+         antrean['routed']),
+        ('matrix_app_import_seconds', 'gauge', "Time to import app.py", startup['import_seconds']),
+        ('matrix_engine_import_seconds', 'gauge', "Import time per engine in the server process",
+         [({'engine': nama}, s['import_seconds']) for nama, s in engines.stats().items() if s['loaded']]),
+    ]
+    if startup['first_request_seconds'] is not None:
+        extra.append(('matrix_first_request_seconds', 'gauge', "Duration of the first /calculate request",
+                      startup['first_request_seconds']))
+    return app.response_class(metrics_registry.render(extra), mimetype='text/plain; version=0.0.4')
+
+@app.route('/pool-stats')
+def pool_stats():
+    return jsonify(pool.stats())
+
+@app.route('/admission-stats')
+def admission_stats():
+    return jsonify(admission.stats())
+
+@app.route('/engines')
+def engines_endpoint():
+    """Engine load state and import/warm-up times, in this process and in one worker"""
+    try:
+        worker = pool.run(engines.stats) if pool.processes > 0 else None
+    except PoolError as e:
+        worker = error_payload(e)
+    return jsonify({
+        'status': 'success',
+        'startup': startup,
+        'warmup': ENGINE_WARMUP,
+        'engines': engines.stats(),
+        'worker_engines': worker,
+    })
+
+def warm_up():
+    """
+    Post-fork hook for preforking servers (e.g. gunicorn post_fork): warm
+    ENGINE_WARMUP in this process and start the worker processes now
+    """
+    engines.warm(ENGINE_WARMUP)
+    pool.prestart()
+
+startup['import_seconds'] = time.perf_counter() - _MULAI_IMPOR
+
 # untuk menjalankan aplikasi flask nya
 if __name__ == '__main__':
+    warm_up()
     app.run(debug=True)
\ No newline at end of file
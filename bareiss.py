@@ -0,0 +1,240 @@
+import re
+from fractions import Fraction
+from math import gcd, lcm
+
+from steptrace import RowOp, StepTrace
+
+# Mesin eliminasi eksak bebas-pecahan (fraction-free / Bareiss) untuk input rasional.
+# Setiap baris disimpan sebagai list int + satu penyebut bersama (positif), jadi nilai
+# sebenarnya baris i adalah rows[i][k] / dens[i]. Pecahan baru dibuat ketika baris
+# dinormalisasi (untuk ditampilkan atau untuk hasil akhir). Input pecahan ("1/3" atau
+# Fraction) masuk dengan penyebut baris = KPK penyebut elemennya, sehingga langkah,
+# pivot dan RREF-nya sama dengan jalur SymPy Rational tanpa objek SymPy per elemen.
+
+# Teks yang dibaca SymPy sebagai Integer/Rational. Desimal ("0.5") tidak termasuk:
+# SymPy membacanya sebagai Float dan menampilkannya lain
+_PECAHAN = re.compile(r"[-+]?(?:0|[1-9][0-9]*)(?:/[1-9][0-9]*)?")
+
+
+def is_integer_matrix(matrix):
+    """Return True if every entry is a plain Python int (bool excluded)"""
+    try:
+        cols = len(matrix[0])
+        return cols > 0 and all(
+            len(row) == cols and all(type(x) is int for x in row) for row in matrix
+        )
+    except (TypeError, IndexError, KeyError):
+        return False
+
+
+def is_rational_matrix(matrix):
+    """
+    Return True if every entry is an int, a Fraction or an integer/fraction
+    string such as "-3" or "2/5" (no floats, decimals or symbols)
+    """
+    try:
+        cols = len(matrix[0])
+        return cols > 0 and all(
+            len(row) == cols and all(
+                type(x) is int or isinstance(x, Fraction)
+                or (isinstance(x, str) and _PECAHAN.fullmatch(x) is not None)
+                for x in row)
+            for row in matrix
+        )
+    except (TypeError, IndexError, KeyError):
+        return False
+
+
+def _scaled_rows(matrix):
+    """Integer rows and their denominators: row i of matrix == rows[i] / dens[i]"""
+    if is_integer_matrix(matrix):
+        return [list(row) for row in matrix], [1] * len(matrix)
+    rows, dens = [], []
+    for row in initial_rows(matrix):
+        d = lcm(*(x.denominator for x in row))
+        rows.append([x.numerator * (d // x.denominator) for x in row])
+        dens.append(d)
+    return rows, dens
+
+
+def integer_rows(matrix):
+    """Rational matrix with every row scaled to integers (same RREF, pivots and solution set)"""
+    return _scaled_rows(matrix)[0]
+
+
+def _normalize(row, den):
+    """Buat penyebut positif dan bagi baris dengan FPB isi baris & penyebut"""
+    if den < 0:
+        row = [-x for x in row]
+        den = -den
+    g = gcd(den, *row)
+    if g > 1:
+        row = [x // g for x in row]
+        den //= g
+    return row, den
+
+
+def _value(rows, dens, i, j):
+    """Nilai eksak elemen (i, j) sebagai Fraction"""
+    return Fraction(rows[i][j], dens[i])
+
+
+def to_rationals(rows, dens):
+    """Normalize integer rows with their denominators into rows of Fraction"""
+    return [[Fraction(x, d) for x in row] for row, d in zip(rows, dens)]
+
+
+def initial_rows(matrix):
+    """Input rows as Fraction, the starting point of every step trace"""
+    return [[Fraction(x) for x in row] for row in matrix]
+
+
+def _row_rationals(rows, dens, i):
+    return [Fraction(x, dens[i]) for x in rows[i]]
+
+
+def _scale(rows, dens, r, c):
+    # R_r = R_r / pivot  ->  (A_r/d_r) / (A_rc/d_r) = A_r / A_rc
+    rows[r], dens[r] = _normalize(rows[r], rows[r][c])
+
+
+def _axpy(rows, dens, i, r, c):
+    # R_i = R_i - (x_ic/x_rc) * R_r, tanpa pecahan:
+    # (A_rc * A_i - A_ic * A_r) / (d_i * A_rc)
+    a_rc = rows[r][c]
+    a_ic = rows[i][c]
+    pivot_row = rows[r]
+    new_row = [a_rc * x - a_ic * y for x, y in zip(rows[i], pivot_row)]
+    rows[i], dens[i] = _normalize(new_row, dens[i] * a_rc)
+
+
+def gauss_jordan_ops(matrix):
+    """
+    Fraction-free counterpart of app.gauss_jordan_ops for rational matrices:
+    yields each row operation (RowOp) as soon as it is done
+    """
+    rows, dens = _scaled_rows(matrix)
+    m, n = len(rows), len(rows[0])
+    r = 0
+    c = 0
+
+    while r < m and c < n:
+        pivot = next((i for i in range(r, m) if rows[i][c] != 0), -1)
+        if pivot == -1:
+            c += 1
+            continue
+
+        if pivot != r:
+            rows[r], rows[pivot] = rows[pivot], rows[r]
+            dens[r], dens[pivot] = dens[pivot], dens[r]
+            yield RowOp('swap', f"Tukar baris {r+1} dan {pivot+1}:", r, pivot, None)
+
+        pivot_val = _value(rows, dens, r, c)
+        if pivot_val != 1:
+            _scale(rows, dens, r, c)
+            yield RowOp('scale', f"R{r+1} = R{r+1}/{pivot_val}:", r, None, _row_rationals(rows, dens, r))
+
+        for i in range(m):
+            if i != r and rows[i][c] != 0:
+                factor = _value(rows, dens, i, c)
+                _axpy(rows, dens, i, r, c)
+                yield RowOp('axpy', f"R{i+1} = R{i+1} - {factor}*R{r+1}:", i, r, _row_rationals(rows, dens, i))
+
+        r += 1
+        c += 1
+
+
+def gauss_jordan_steps(matrix):
+    """
+    Fraction-free counterpart of app.gauss_jordan_steps for rational matrices
+    """
+    return StepTrace.collect(initial_rows(matrix), gauss_jordan_ops(matrix))
+
+
+def ref_ops(matrix, leading_one=False):
+    """
+    Fraction-free counterpart of app.ref_ops for rational matrices
+    """
+    rows, dens = _scaled_rows(matrix)
+    m, n = len(rows), len(rows[0])
+
+    for i in range(min(m, n)):
+        # Cari pivot selain nol pada kolom i
+        pivot = next((j for j in range(i, m) if rows[j][i] != 0), -1)
+        if pivot == -1:
+            continue
+        if pivot != i:
+            rows[i], rows[pivot] = rows[pivot], rows[i]
+            dens[i], dens[pivot] = dens[pivot], dens[i]
+            yield RowOp('swap', f"Tukar baris {i+1} dan {pivot+1}:", i, pivot, None)
+
+        if leading_one:
+            pivot_val = _value(rows, dens, i, i)
+            if pivot_val != 1:
+                _scale(rows, dens, i, i)
+                yield RowOp('scale', f"R{i+1} = R{i+1}/{pivot_val} (Membuat pivot = 1):", i, None,
+                            _row_rationals(rows, dens, i))
+
+        for j in range(i + 1, m):
+            if rows[j][i] != 0:
+                factor = _value(rows, dens, j, i)
+                if not leading_one:
+                    factor /= _value(rows, dens, i, i)
+                _axpy(rows, dens, j, i, i)
+                yield RowOp('axpy', f"R{j+1} = R{j+1} - {factor}*R{i+1}:", j, i, _row_rationals(rows, dens, j))
+
+
+def ref_steps(matrix, leading_one=False):
+    """
+    Fraction-free counterpart of app.ref_steps for rational matrices
+    """
+    steps = StepTrace.collect(initial_rows(matrix), ref_ops(matrix, leading_one), initial_desc=None)
+    return steps, steps.final()
+
+
+def rref(matrix):
+    """
+    Bareiss fraction-free Gauss-Jordan over Python ints (rational rows are
+    scaled to integers first, which leaves the RREF unchanged).
+    Returns (rref rows as Fraction, pivot columns), like sympy's Matrix.rref()
+    """
+    M = integer_rows(matrix)
+    m, n = len(M), len(M[0])
+    prev = 1
+    pivots = []
+    r = 0
+
+    for c in range(n):
+        if r >= m:
+            break
+        pivot = next((i for i in range(r, m) if M[i][c] != 0), -1)
+        if pivot == -1:
+            continue
+        if pivot != r:
+            M[r], M[pivot] = M[pivot], M[r]
+
+        piv = M[r][c]
+        pivot_row = M[r]
+        for i in range(m):
+            if i == r:
+                continue
+            a = M[i][c]
+            # Pembagian dengan pivot sebelumnya selalu eksak (sifat Bareiss)
+            if a == 0:
+                if piv != prev:
+                    M[i] = [x * piv // prev for x in M[i]]
+            else:
+                M[i] = [(piv * x - a * y) // prev for x, y in zip(M[i], pivot_row)]
+        prev = piv
+        pivots.append(c)
+        r += 1
+
+    # Baris pivot dibagi dengan pivotnya -> bentuk tereduksi dengan Fraction
+    result = []
+    for i, row in enumerate(M):
+        if i < len(pivots):
+            d = row[pivots[i]]
+            result.append([Fraction(x, d) for x in row])
+        else:
+            result.append([Fraction(0)] * n)
+    return result, tuple(pivots)
@@ -0,0 +1,366 @@
+"""
+Benchmark suite for the elimination engines.
+
+Engines:
+  numpy        eliminasi.eliminasi_gauss + analisis_solusi (Tkinter, Test.py)
+  sympy-rowops app.gauss_jordan_steps (SymPy row operations) + analisis_rref
+  sympy-rref   static/Test2.py solve_matrix_sympy (SymPy rref on Rationals)
+  web          app.hitung(..., 'rref') as served by /calculate (JSON payload)
+  web-final    same without steps ("steps": false)
+  hybrid       app.hitung(..., 'hybrid'): float solve + rational reconstruction
+  startup      fresh interpreter: import app + first app.hitung(..., 'rref'), i.e.
+               the cold start of a server or worker process (engines load lazily)
+
+Usage:
+  python benchmark.py                          # run and print the table
+  python benchmark.py --save baseline.json     # store a baseline
+  python benchmark.py --compare baseline.json  # exit 1 on regressions
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from fractions import Fraction
+
+import numpy as np
+
+KINDS = ('dense', 'integer', 'rational', 'singular', 'inconsistent', 'sparse', 'ill-conditioned')
+SIZES = (3, 10, 25, 50, 100, 200)
+ENGINES = ('numpy', 'sympy-rowops', 'sympy-rref', 'web', 'web-final', 'hybrid', 'startup')
+
+# Ukuran terbesar yang masih dicoba per engine (SymPy dan langkah berformat
+# tidak realistis di atas ini)
+MAX_SIZE = {
+    'numpy': 200,
+    'sympy-rowops': 25,
+    'sympy-rref': 50,
+    'web': 25,
+    'web-final': 200,
+    'hybrid': 200,
+    'startup': 10,
+}
+# Di atas ukuran ini teks langkah tidak dirender (response_bytes = None)
+RENDER_MAX_SIZE = 50
+# --compare memakai median dari minimal sekian ulangan (satu ulangan terlalu bising)
+COMPARE_MIN_REPEAT = 3
+
+
+# --- workload ---
+
+def workload(kind, n, seed=0):
+    """Deterministic n x (n+1) augmented matrix of the given kind"""
+    rng = random.Random(f"{kind}-{n}-{seed}")
+    if kind == 'dense':
+        return [[rng.uniform(-10, 10) for _ in range(n + 1)] for _ in range(n)]
+    if kind == 'integer':
+        return [[rng.randint(-9, 9) for _ in range(n + 1)] for _ in range(n)]
+    if kind == 'rational':
+        # Pecahan sebagai teks ("3/4"), seperti yang dikirim lewat JSON
+        return [[f"{rng.randint(-9, 9)}/{rng.randint(1, 9)}" for _ in range(n + 1)] for _ in range(n)]
+    if kind in ('singular', 'inconsistent'):
+        A = [[rng.randint(-9, 9) for _ in range(n + 1)] for _ in range(n)]
+        if n > 1:
+            # Baris terakhir kombinasi dua baris pertama -> rank < n
+            A[-1] = [a + b for a, b in zip(A[0], A[1 % n])]
+            if kind == 'inconsistent':
+                A[-1][-1] += 1
+        else:
+            A[0][0] = 0
+            A[0][-1] = 1 if kind == 'inconsistent' else 0
+        return A
+    if kind == 'sparse':
+        # +-5% elemen tak nol, diagonal selalu terisi
+        A = [[0] * (n + 1) for _ in range(n)]
+        for i in range(n):
+            A[i][i] = rng.randint(1, 9)
+            A[i][n] = rng.randint(-9, 9)
+            for _ in range(max(1, n // 20)):
+                A[i][rng.randrange(n)] = rng.randint(-9, 9)
+        return A
+    if kind == 'ill-conditioned':
+        # Matriks Hilbert, ruas kanan = jumlah baris (solusi eksak semua 1)
+        return [[1.0 / (i + j + 1) for j in range(n)] + [sum(1.0 / (i + j + 1) for j in range(n))]
+                for i in range(n)]
+    raise ValueError(f"Jenis workload tidak dikenal: {kind}")
+
+
+# --- engine ---
+
+def _load_test2():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'Test2.py')
+    spec = importlib.util.spec_from_file_location('Test2', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _payload_bytes(size, steps, final, explanation):
+    if size > RENDER_MAX_SIZE:
+        return None
+    payload = {
+        'steps': [(desc, str(matrix)) for desc, matrix in steps],
+        'final_matrix': str(final),
+        'explanation': explanation,
+    }
+    return len(json.dumps(payload))
+
+
+def _float_array(matrix):
+    return np.array([[float(Fraction(x)) if isinstance(x, str) else x for x in row] for row in matrix],
+                    dtype=np.float64)
+
+
+def run_numpy(matrix):
+    from eliminasi import analisis_solusi, eliminasi_gauss
+    mat, steps = eliminasi_gauss(_float_array(matrix), make_one=True, jordan=True)
+    explanation = analisis_solusi(_float_array(matrix))
+    return len(steps), _payload_bytes(len(matrix), steps, mat, explanation)
+
+
+def run_sympy_rowops(matrix):
+    import app
+    steps = app.gauss_jordan_steps(matrix)
+    final = steps.final()
+    explanation = app.analisis_rref(final)
+    return len(steps), _payload_bytes(len(matrix), steps, final, explanation)
+
+
+def run_sympy_rref(matrix, _module=[]):
+    if not _module:
+        _module.append(_load_test2())
+    initial, rref_matrix, explanation = _module[0].solve_matrix_sympy(matrix)
+    return 1, _payload_bytes(len(matrix), [], rref_matrix, explanation)
+
+
+def run_web(matrix, with_steps=True):
+    import app
+    result = app.hitung(matrix, 'rref', with_steps)
+    with app.app.app_context():
+        body = app.jsonify(result).get_data()
+    return len(result['steps']), len(body)
+
+
+def run_web_final(matrix):
+    return run_web(matrix, with_steps=False)
+
+
+def run_hybrid(matrix):
+    import app
+    result = app.hitung(matrix, 'hybrid', False)
+    with app.app.app_context():
+        body = app.jsonify(result).get_data()
+    return 1, len(body)
+
+
+# Dijalankan di interpreter baru: waktu impor app dan request pertama, lalu ringkasannya
+STARTUP_SCRIPT = """
+import json, resource, sys, time
+mulai = time.perf_counter()
+import app
+impor = time.perf_counter() - mulai
+mulai = time.perf_counter()
+result = app.hitung(json.loads(sys.argv[1]), 'rref')
+pertama = time.perf_counter() - mulai
+with app.app.app_context():
+    body = app.jsonify(result).get_data()
+print(json.dumps({'import_seconds': impor, 'first_request_seconds': pertama,
+                  'steps': len(result['steps']), 'response_bytes': len(body),
+                  'peak_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}))
+"""
+
+
+def measure_startup(matrix, repeat=3):
+    """Median cold start (process + import + first request) over repeat fresh interpreters"""
+    folder = os.path.dirname(os.path.abspath(__file__))
+    env = {**os.environ, 'WORKER_PROCESSES': '0'}
+    runs = []
+    for _ in range(repeat):
+        mulai = time.perf_counter()
+        out = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT, json.dumps(matrix)], cwd=folder,
+                             env=env, capture_output=True, text=True, check=True).stdout
+        runs.append({'seconds': time.perf_counter() - mulai, **json.loads(out)})
+    hasil = dict(runs[0])
+    # Median per fase: satu proses yang kebetulan lambat (cache disk dingin) tidak menentukan
+    for fase in ('seconds', 'import_seconds', 'first_request_seconds', 'peak_bytes'):
+        hasil[fase] = statistics.median(run[fase] for run in runs)
+    for fase in ('seconds', 'import_seconds', 'first_request_seconds'):
+        hasil[fase] = round(hasil[fase], 6)
+    hasil['peak_bytes'] = int(hasil['peak_bytes'])
+    hasil['repeat'] = repeat
+    return hasil
+
+
+RUNNERS = {
+    'numpy': run_numpy,
+    'sympy-rowops': run_sympy_rowops,
+    'sympy-rref': run_sympy_rref,
+    'web': run_web,
+    'web-final': run_web_final,
+    'hybrid': run_hybrid,
+}
+
+
+def measure(engine, matrix, repeat=3):
+    """
+    Median wall time over repeat runs, plus peak traced memory of one extra run.
+    The caller warms the runner up first (run_suite times one cold probe run).
+    """
+    if engine == 'startup':
+        return measure_startup(matrix, repeat)
+    runner = RUNNERS[engine]
+    waktu = []
+    for _ in range(repeat):
+        mulai = time.perf_counter()
+        steps, size = runner(matrix)
+        waktu.append(time.perf_counter() - mulai)
+    tracemalloc.start()
+    try:
+        runner(matrix)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'seconds': round(statistics.median(waktu), 6),
+        'peak_bytes': peak,
+        'steps': steps,
+        'response_bytes': size,
+        'repeat': repeat,
+    }
+
+
+def run_suite(engines=ENGINES, kinds=KINDS, sizes=SIZES, repeat=3, budget=20.0, log=print):
+    """
+    Run every (engine, kind, size). Once a run of an engine takes longer than
+    budget seconds, larger sizes of that engine and kind are skipped.
+    """
+    results = []
+    for engine in engines:
+        # Pemanasan: impor modul dan cache internal SymPy tidak ikut terukur
+        # (kecuali 'startup', yang justru mengukur proses dingin)
+        if engine in RUNNERS:
+            RUNNERS[engine](workload('integer', 2))
+        for kind in kinds:
+            terlalu_lama = False
+            for n in sizes:
+                case = {'engine': engine, 'kind': kind, 'size': n}
+                if n > MAX_SIZE[engine] or terlalu_lama:
+                    case['skipped'] = True
+                    results.append(case)
+                    continue
+                # Percobaan pertama hanya pemanasan untuk ukuran ini (cache SymPy, alokasi
+                # NumPy) dan penentu jumlah ulangan; ulangan dikurangi untuk kasus yang lambat.
+                # 'startup' selalu diulang karena setiap ulangan adalah proses dingin baru.
+                pertama = measure(engine, workload(kind, n), repeat=1)
+                if engine == 'startup' or pertama['seconds'] * repeat < budget:
+                    pertama = measure(engine, workload(kind, n), repeat=repeat)
+                case.update(pertama)
+                terlalu_lama = case['seconds'] > budget
+                results.append(case)
+                log(format_row(case))
+    return results
+
+
+# --- laporan & baseline ---
+
+def _key(case):
+    return f"{case['engine']}/{case['kind']}/{case['size']}"
+
+
+def format_row(case):
+    if case.get('skipped'):
+        return f"{_key(case):<36} {'skipped':>10}"
+    row = (f"{_key(case):<36} {case['seconds'] * 1000:>10.2f} ms {case['peak_bytes'] / 1024:>10.0f} KiB "
+           f"{case['steps']:>6} steps {case['response_bytes'] or '-':>10} B")
+    if 'import_seconds' in case:
+        row += (f"  (import {case['import_seconds'] * 1000:.0f} ms, "
+                f"first request {case['first_request_seconds'] * 1000:.0f} ms)")
+    return row
+
+
+def compare(results, baseline, tolerance=1.25, min_seconds=0.005):
+    """
+    Regressions against a baseline: time or peak memory above tolerance times
+    the baseline value, or a different step count. Runs faster than
+    min_seconds in both are too noisy to compare and only the other metrics count,
+    and so are times measured only once (a single run cannot be told from noise).
+    """
+    base = {_key(case): case for case in baseline['results'] if not case.get('skipped')}
+    regressions = []
+    for case in results:
+        old = base.get(_key(case))
+        if case.get('skipped') or old is None:
+            continue
+        alasan = []
+        # Kasus yang terlalu lambat untuk diulang (budget) hanya punya satu pengukuran
+        terukur = min(case.get('repeat', COMPARE_MIN_REPEAT), old.get('repeat', COMPARE_MIN_REPEAT)) >= COMPARE_MIN_REPEAT
+        if terukur and max(case['seconds'], old['seconds']) >= min_seconds and \
+                case['seconds'] > old['seconds'] * tolerance:
+            alasan.append(f"time {old['seconds'] * 1000:.2f} -> {case['seconds'] * 1000:.2f} ms")
+        if case['peak_bytes'] > old['peak_bytes'] * tolerance:
+            alasan.append(f"memory {old['peak_bytes']} -> {case['peak_bytes']} B")
+        for fase in ('import_seconds', 'first_request_seconds'):
+            if terukur and fase in case and fase in old and max(case[fase], old[fase]) >= min_seconds and \
+                    case[fase] > old[fase] * tolerance:
+                alasan.append(f"{fase} {old[fase] * 1000:.2f} -> {case[fase] * 1000:.2f} ms")
+        if case['steps'] != old['steps']:
+            alasan.append(f"steps {old['steps']} -> {case['steps']}")
+        if case['response_bytes'] and old['response_bytes'] and \
+                case['response_bytes'] > old['response_bytes'] * tolerance:
+            alasan.append(f"response {old['response_bytes']} -> {case['response_bytes']} B")
+        if alasan:
+            regressions.append((_key(case), alasan))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the elimination engines")
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=ENGINES)
+    parser.add_argument('--kinds', nargs='+', default=list(KINDS), choices=KINDS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=3,
+                        help=f"timed runs per case, median reported (--compare uses at least {COMPARE_MIN_REPEAT})")
+    parser.add_argument('--budget', type=float, default=20.0,
+                        help="skip larger sizes once one run exceeds this many seconds")
+    parser.add_argument('--save', metavar='FILE', help="write the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE', help="compare against a JSON baseline")
+    parser.add_argument('--tolerance', type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    repeat = max(args.repeat, 1)
+    if args.compare and repeat < COMPARE_MIN_REPEAT:
+        print(f"--compare: --repeat dinaikkan ke {COMPARE_MIN_REPEAT} (median setelah pemanasan)")
+        repeat = COMPARE_MIN_REPEAT
+    results = run_suite(args.engines, args.kinds, sorted(args.sizes), repeat, args.budget)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'machine': platform.machine(),
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'results': results,
+            }, f, indent=1)
+        print(f"Baseline disimpan ke {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for key, alasan in regressions:
+            print(f"REGRESI {key}: " + "; ".join(alasan))
+        if regressions:
+            return 1
+        print("Tidak ada regresi dibanding baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import os
+import tempfile
+
+import numpy as np
+
+from eliminasi import RESIDU_FAKTOR
+
+# Klasifikasi sistem besar (ribuan baris) dari file biner tanpa memuat seluruh matriks.
+# File .npy atau float64 mentah di-memory-map, disalin blok demi blok ke file kerja
+# float64, lalu dieliminasi per panel kolom (LU berpivot parsial, right-looking):
+#   1. panel PANEL kolom dari baris aktif dimuat ke RAM dan dieliminasi di sana,
+#   2. pertukaran baris diterapkan ke file kerja,
+#   3. baris pivot panel (U12) diselesaikan dengan L11, lalu sisa baris diperbarui
+#      per blok ROW_BLOCK baris: A22 -= L21 @ U12.
+# Yang ada di RAM hanya panel, faktor L panel, U12 dan satu blok baris.
+
+PANEL = 64
+ROW_BLOCK = 1024
+
+
+def open_matrix(path, shape=None):
+    """
+    Read-only memmap of a .npy file (shape from its header) or of raw
+    little-endian float64 data with the given (rows, cols) shape
+    """
+    if shape is None:
+        with open(path, 'rb') as f:
+            if f.read(6) != b'\x93NUMPY':
+                raise ValueError("Bukan file .npy; untuk float64 mentah sertakan rows dan cols")
+        M = np.load(path, mmap_mode='r')
+    else:
+        rows, cols = (int(x) for x in shape)
+        if rows <= 0 or cols <= 0:
+            raise ValueError("Ukuran matriks tidak valid")
+        if os.path.getsize(path) != rows * cols * 8:
+            raise ValueError(f"Ukuran file tidak sama dengan {rows} x {cols} float64")
+        M = np.memmap(path, dtype='<f8', mode='r', shape=(rows, cols))
+    if M.ndim != 2 or M.shape[1] < 2:
+        raise ValueError("Matriks augmented harus 2 dimensi dengan minimal 2 kolom")
+    if M.dtype.kind not in 'iuf':
+        raise ValueError(f"Tipe data tidak didukung: {M.dtype}")
+    return M
+
+
+def _row_blocks(m, start=0):
+    for i0 in range(start, m, ROW_BLOCK):
+        yield i0, min(i0 + ROW_BLOCK, m)
+
+
+def _working_copy(M, path):
+    """
+    Copy M into a float64 memmap at path block by block; also returns the
+    Frobenius norm of the coefficients and the largest |b|
+    """
+    m, n = M.shape
+    W = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(m, n))
+    norm2, b_max = 0.0, 0.0
+    for i0, i1 in _row_blocks(m):
+        blok = np.asarray(M[i0:i1], dtype=np.float64)
+        if not np.all(np.isfinite(blok)):
+            raise ValueError("Matriks berisi NaN atau tak hingga")
+        W[i0:i1] = blok
+        norm2 += float(np.sum(blok[:, :-1] ** 2))
+        b_max = max(b_max, float(np.max(np.abs(blok[:, -1]))))
+    return W, float(np.sqrt(norm2)), b_max
+
+
+def _eliminate(W, tol):
+    """Blocked forward elimination of W in place; returns the pivots as (row, col)"""
+    m, n = W.shape
+    num_vars = n - 1
+    pivots = []
+    r = 0
+    for c0 in range(0, num_vars, PANEL):
+        if r >= m:
+            break
+        c1 = min(c0 + PANEL, num_vars)
+        P = np.array(W[r:, c0:c1])
+        L = np.zeros((m - r, c1 - c0))
+        swaps = []
+        t = 0
+        for j in range(c1 - c0):
+            if t >= m - r:
+                break
+            p = t + int(np.argmax(np.abs(P[t:, j])))
+            if abs(P[p, j]) <= tol:
+                continue
+            if p != t:
+                P[[t, p]] = P[[p, t]]
+                L[[t, p], :t] = L[[p, t], :t]
+                swaps.append((r + t, r + p))
+            faktor = P[t + 1:, j] / P[t, j]
+            L[t + 1:, t] = faktor
+            P[t + 1:, j:] -= np.outer(faktor, P[t, j:])
+            P[t + 1:, j] = 0
+            pivots.append((r + t, c0 + j))
+            t += 1
+        k = t
+
+        # Pertukaran baris untuk kolom di luar panel, lalu panel ditulis kembali
+        for a, b in swaps:
+            W[[a, b], c1:] = W[[b, a], c1:]
+        W[r:, c0:c1] = P
+        if k == 0:
+            continue
+
+        # U12 = L11^-1 A12, lalu A22 -= L21 U12 per blok baris
+        U12 = np.array(W[r:r + k, c1:])
+        for i in range(1, k):
+            U12[i] -= L[i, :i] @ U12[:i]
+        W[r:r + k, c1:] = U12
+        for i0, i1 in _row_blocks(m, r + k):
+            W[i0:i1, c1:] -= L[i0 - r:i1 - r, :k] @ U12
+        r += k
+    W.flush()
+    return pivots
+
+
+def _back_substitute(W, pivots, num_vars):
+    """Basic solution (free variables = 0) from the echelon rows, read in blocks from the bottom"""
+    x = np.zeros(num_vars)
+    rank = len(pivots)
+    for i1 in range(rank, 0, -ROW_BLOCK):
+        i0 = max(i1 - ROW_BLOCK, 0)
+        blok = np.array(W[i0:i1])
+        for i in range(i1 - 1, i0 - 1, -1):
+            row = blok[i - i0]
+            c = pivots[i][1]
+            x[c] = (row[-1] - row[c + 1:-1] @ x[c + 1:]) / row[c]
+    return x
+
+
+def _residual(M, x):
+    """||A x - b|| against the original matrix, read in blocks"""
+    total = 0.0
+    for i0, i1 in _row_blocks(M.shape[0]):
+        blok = np.asarray(M[i0:i1], dtype=np.float64)
+        total += float(np.sum((blok[:, :-1] @ x - blok[:, -1]) ** 2))
+    return float(np.sqrt(total))
+
+
+def klasifikasi_file(path, shape=None, workdir=None):
+    """
+    Classify the augmented system stored in a .npy / raw float64 file.
+    Returns the same dict as eliminasi.klasifikasi_solusi; the condition is
+    estimated from the pivots (max |u_kk| / min |u_kk|), inf when rank deficient.
+    """
+    M = open_matrix(path, shape)
+    m, n = M.shape
+    num_vars = n - 1
+    eps = np.finfo(np.float64).eps
+
+    fd, work_path = tempfile.mkstemp(suffix='.npy', dir=workdir)
+    os.close(fd)
+    try:
+        W, norm, b_max = _working_copy(M, work_path)
+        # LU berpivot parsial tidak sepenuhnya rank-revealing: sisa eliminasi kolom yang
+        # bergantung linear bisa beberapa kali eps * norm, jadi toleransinya diberi faktor
+        tol = RESIDU_FAKTOR * max(m, n) * eps * norm
+        pivots = _eliminate(W, tol)
+        rank = len(pivots)
+
+        x = _back_substitute(W, pivots, num_vars)
+        residual = _residual(M, x)
+        # Baris tanpa pivot tinggal konstanta b sisa eliminasi; yang terbesar menentukan
+        # konsistensi dan dilaporkan sebagai baris inkonsisten
+        sisa, baris_sisa = 0.0, None
+        for i0, i1 in _row_blocks(m, rank):
+            i = i0 + int(np.argmax(np.abs(W[i0:i1, -1])))
+            if baris_sisa is None or abs(W[i, -1]) > sisa:
+                sisa, baris_sisa = abs(float(W[i, -1])), (i + 1, float(W[i, -1]))
+        diagonal = np.abs([W[i, c] for i, c in pivots])
+        del W
+    finally:
+        os.remove(work_path)
+
+    batas = RESIDU_FAKTOR * max(m, n) * eps * (norm * float(np.max(np.abs(x), initial=0)) + b_max)
+    if sisa > batas:
+        jenis = 'tidak ada'
+    elif rank < num_vars:
+        jenis = 'tak hingga'
+    else:
+        jenis = 'unik'
+    pivot_cols = {c for _, c in pivots}
+    if rank < num_vars or rank == 0:
+        condition = float('inf')
+    else:
+        condition = float(diagonal.max() / diagonal.min())
+    hasil = {
+        'jenis': jenis,
+        'rank': rank,
+        'num_vars': num_vars,
+        'free_variables': [j + 1 for j in range(num_vars) if j not in pivot_cols],
+        'condition': condition,
+        'residual': residual,
+        'tolerance': float(tol),
+        'solution': x.tolist() if jenis == 'unik' else None,
+    }
+    if jenis == 'tidak ada':
+        hasil['inconsistent_row'], hasil['inconsistent_value'] = baris_sisa
+    return hasil
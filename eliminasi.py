@@ -0,0 +1,377 @@
+import numpy as np
+
+from steptrace import StepTrace
+
+# --- FUNGSI LOGIKA PERHITUNGAN MATRIKS (float NumPy) ---
+
+def eliminasi_gauss(matrix, make_one=False, jordan=False, record_steps=True, progress=None):
+    """
+    Fungsi umum untuk semua jenis eliminasi Gauss
+    make_one: True untuk Satu Utama, False untuk OBE biasa
+    jordan: True untuk Gauss-Jordan, False untuk Gauss biasa
+    record_steps: False untuk jalur cepat tanpa jejak langkah (langkah = None)
+    progress: dipanggil progress(kolom, jumlah_kolom) sebelum setiap kolom pivot;
+              exception dari callback menghentikan eliminasi (pembatalan)
+    """
+    mat = np.copy(matrix).astype(np.float64)
+    num_rows, num_cols = mat.shape
+    pivot_row = 0
+    langkah_langkah = StepTrace(mat, build=np.array) if record_steps else None
+
+    # Forward elimination
+    for j in range(num_cols):
+        if pivot_row >= num_rows:
+            break
+        if progress is not None:
+            progress(j, num_cols)
+
+        # Cari pivot terbesar (partial pivoting)
+        max_row = pivot_row + int(np.argmax(np.abs(mat[pivot_row:, j])))
+        
+        if abs(mat[max_row, j]) < 1e-10:
+            continue
+
+        # Tukar baris jika perlu
+        if max_row != pivot_row:
+            mat[[pivot_row, max_row]] = mat[[max_row, pivot_row]]
+            if record_steps:
+                langkah_langkah.swap(f"Tukar baris {pivot_row+1} dan {max_row+1}:", pivot_row, max_row)
+
+        # Buat pivot menjadi 1 jika diminta
+        if make_one:
+            pivot_val = mat[pivot_row, j]
+            if abs(pivot_val - 1.0) > 1e-10:
+                mat[pivot_row] = mat[pivot_row] / pivot_val
+                if record_steps:
+                    langkah_langkah.scale(f"R{pivot_row+1} = R{pivot_row+1}/{pivot_val:.2f}:", pivot_row, mat[pivot_row])
+
+        # Eliminasi di bawah pivot (atau semua baris untuk Jordan) sekaligus
+        # dengan satu update rank-1: mat[rows] -= faktor (outer) baris pivot
+        target = np.abs(mat[:, j]) > 1e-10
+        target[pivot_row] = False
+        if not jordan:
+            target[:pivot_row] = False
+        rows = np.flatnonzero(target)
+        if rows.size:
+            faktor = mat[rows, j] / mat[pivot_row, j]
+            mat[rows] -= np.outer(faktor, mat[pivot_row])
+            if record_steps:
+                for i, f in zip(rows, faktor):
+                    langkah_langkah.axpy(f"R{i+1} = R{i+1} - ({f:.2f})*R{pivot_row+1}:", i, pivot_row, mat[i])
+
+        pivot_row += 1
+
+    # Atasi nilai yang sangat kecil mendekati nol
+    kecil = np.abs(mat) < 1e-10
+    if not record_steps:
+        mat[kecil] = 0
+        return mat, None
+    # -0.0 juga berubah (menjadi 0.0), seperti salinan matriks di langkah akhir versi lama
+    baris_berubah = np.flatnonzero(np.any(kecil & ((mat != 0) | np.signbit(mat)), axis=1))
+    mat[kecil] = 0
+    
+    # Tentukan judul hasil akhir berdasarkan jenis eliminasi
+    if jordan:
+        hasil = "Hasil Akhir (Eliminasi Gauss-Jordan):"
+    elif make_one:
+        hasil = "Hasil Akhir (Eliminasi Gauss dengan Satu Utama):"
+    else:
+        hasil = "Hasil Akhir (Eliminasi Gauss/OBE):"
+    langkah_langkah.set(hasil, {i: mat[i] for i in baris_berubah})
+    
+    return mat, langkah_langkah
+
+# Faktor pengali toleransi residu: sistem konsisten yang diselesaikan dengan SVD
+# (backward stable) punya residu sekitar eps * (||A|| ||x|| + ||b||)
+RESIDU_FAKTOR = 10
+
+def _kolom_pivot(A, rank, tol):
+    """
+    Pivot columns in the RREF sense (first columns not in the span of the
+    previous ones), found with Gram-Schmidt in column order; exactly rank
+    columns are returned
+    """
+    basis = np.zeros((A.shape[0], 0))
+    pivot, sisa = [], []
+    for j in range(A.shape[1]):
+        v = A[:, j].copy()
+        # Ortogonalisasi dua kali agar stabil
+        for _ in range(2):
+            v -= basis @ (basis.T @ v)
+        norm = np.linalg.norm(v)
+        if norm > tol and len(pivot) < rank:
+            pivot.append(j)
+            basis = np.column_stack([basis, v / norm])
+        else:
+            sisa.append((norm, j))
+    # Kasus batas (toleransi Gram-Schmidt vs SVD berbeda): lengkapi dengan residu terbesar
+    for _, j in sorted(sisa, reverse=True)[:rank - len(pivot)]:
+        pivot.append(j)
+    return sorted(pivot)
+
+def klasifikasi_solusi(matrix):
+    """
+    Classification-only analysis of an augmented matrix [A | b] with SVD, no
+    elimination steps. The rank uses the scale-aware tolerance
+    max(m, n) * eps * sigma_max (like numpy.linalg.matrix_rank), consistency is
+    decided from the least-squares residual.
+    Returns a dict: jenis ('unik' | 'tak hingga' | 'tidak ada'), rank,
+    free_variables (1-based), condition, residual, tolerance, solution
+    (unique solution or None)
+    """
+    M = np.asarray(matrix, dtype=np.float64)
+    A, b = M[:, :-1], M[:, -1]
+    m, n = A.shape
+    eps = np.finfo(np.float64).eps
+
+    if n == 0:
+        s = np.zeros(0)
+    else:
+        U, s, Vt = np.linalg.svd(A, full_matrices=False)
+    s_max = s[0] if s.size else 0.0
+    tol = max(m, n) * eps * s_max
+    rank = int(np.sum(s > tol))
+
+    # Solusi kuadrat terkecil norma minimum dari komponen rank saja
+    if rank:
+        x = Vt[:rank].T @ ((U[:, :rank].T @ b) / s[:rank])
+    else:
+        x = np.zeros(n)
+    residual = float(np.linalg.norm(A @ x - b))
+    batas_residu = RESIDU_FAKTOR * max(m, n, 1) * eps * (s_max * np.linalg.norm(x) + np.linalg.norm(b))
+
+    if s.size == 0 or s[-1] == 0:
+        condition = float('inf')
+    else:
+        condition = float(s_max / s[-1])
+
+    pivot = _kolom_pivot(A, rank, tol) if n else []
+    if residual > batas_residu:
+        jenis = 'tidak ada'
+    elif rank < n:
+        jenis = 'tak hingga'
+    else:
+        jenis = 'unik'
+    hasil = {
+        'jenis': jenis,
+        'rank': rank,
+        'num_vars': n,
+        'free_variables': [j + 1 for j in range(n) if j not in pivot],
+        'condition': condition,
+        'residual': residual,
+        'tolerance': float(tol),
+        'solution': None,
+    }
+    if jenis == 'tidak ada':
+        # Baris yang ditunjuk pesan inkonsistensi berasal dari RREF; eliminasi hanya
+        # dijalankan untuk sistem yang tidak konsisten atau yang solusinya ditampilkan
+        rref_matrix, _ = eliminasi_gauss(M, make_one=True, jordan=True, record_steps=False)
+        hasil['inconsistent_row'], hasil['inconsistent_value'] = baris_inkonsisten(rref_matrix)
+    elif jenis == 'unik':
+        # Nilai dari substitusi balik eliminasi, dibulatkan seperti analisis_solusi lama;
+        # x kuadrat terkecil SVD hanya dipakai jika eliminasi (ambang tetap 1e-10) tidak
+        # menemukan semua pivot, misalnya matriks berskala sangat kecil
+        rref_matrix, _ = eliminasi_gauss(M, make_one=True, jordan=True, record_steps=False)
+        solusi = klasifikasi_rref(rref_matrix)['solution']
+        if solusi is None:
+            x[np.abs(x) <= max(m, n) * eps * np.abs(x).max(initial=0)] = 0.0
+            solusi = x.tolist()
+        # -0.0 dicetak sebagai -0.00
+        hasil['solution'] = [value + 0.0 for value in solusi]
+    return hasil
+
+def baris_inkonsisten(rref_matrix):
+    """
+    Row (1-based) and constant of the first 0 = c row of a float RREF.
+    When no row passes the fixed 1e-10 thresholds (the SVD tolerance is scale
+    aware), the row with the smallest coefficients is reported.
+    """
+    num_vars = rref_matrix.shape[1] - 1
+    koefisien = np.abs(rref_matrix[:, :num_vars]).max(axis=1, initial=0)
+    for i in range(rref_matrix.shape[0]):
+        if koefisien[i] < 1e-10 and abs(rref_matrix[i, -1]) > 1e-10:
+            return i + 1, float(rref_matrix[i, -1])
+    i = int(np.argmin(koefisien))
+    return i + 1, float(rref_matrix[i, -1])
+
+def klasifikasi_rref(rref_matrix):
+    """
+    Classification dict (the keys format_klasifikasi reads) of a float RREF from
+    eliminasi_gauss(make_one=True, jordan=True), so a caller that already has the
+    elimination needs no second pass. Uses the elimination's fixed 1e-10
+    threshold instead of the scale-aware SVD tolerance.
+    """
+    num_vars = rref_matrix.shape[1] - 1
+    pivot = []
+    for row in rref_matrix:
+        nonzero = np.flatnonzero(np.abs(row) > 1e-10)
+        if nonzero.size and nonzero[0] < num_vars:
+            pivot.append(int(nonzero[0]))
+    hasil = {
+        'jenis': 'unik',
+        'rank': len(pivot),
+        'num_vars': num_vars,
+        'free_variables': [j + 1 for j in range(num_vars) if j not in pivot],
+        'solution': None,
+    }
+    if any(np.abs(row[-1]) > 1e-10 and np.all(np.abs(row[:num_vars]) < 1e-10) for row in rref_matrix):
+        hasil['jenis'] = 'tidak ada'
+        hasil['inconsistent_row'], hasil['inconsistent_value'] = baris_inkonsisten(rref_matrix)
+    elif len(pivot) < num_vars:
+        hasil['jenis'] = 'tak hingga'
+    else:
+        hasil['solution'] = rref_matrix[:num_vars, -1].tolist()
+    return hasil
+
+def analisis_solusi(matrix):
+    """
+    Menganalisis jenis solusi dari matriks augmented
+    (klasifikasi SVD, tanpa eliminasi dan tanpa langkah)
+    """
+    return format_klasifikasi(klasifikasi_solusi(matrix))
+
+def format_klasifikasi(k):
+    """
+    Explanation text for a classification dict as returned by klasifikasi_solusi;
+    condition and residual are only reported in the dict (JSON) itself
+    """
+    if k['jenis'] == 'tidak ada':
+        return (f"Tidak Ada Solusi.\nTerjadi inkonsistensi pada baris {k['inconsistent_row']} "
+                f"(0 = {k['inconsistent_value']:.2f}).")
+
+    if k['jenis'] == 'tak hingga':
+        return f"Solusi Tak Hingga Banyak.\nJumlah variabel ({k['num_vars']}) > Rank matriks ({k['rank']})."
+
+    solusi = [f"x{j+1} = {value:.2f}" for j, value in enumerate(k['solution'])]
+    return "Solusi Unik (Tunggal).\n" + "\n".join(solusi)
+
+def _normal(mats):
+    """
+    Per matriks: setiap nilai berhingga dan nol atau normal. Float SymPy (53 bit)
+    membulatkan seperti float64 kecuali tidak pernah overflow atau subnormal.
+    """
+    a = np.abs(mats.reshape(len(mats), -1))
+    return np.all(np.isfinite(a) & ((a == 0) | (a >= np.finfo(np.float64).tiny)), axis=1)
+
+def _tukar(b, p, q, *arrays):
+    """Tukar baris p dan q matriks b (tidak berpengaruh jika p == q)"""
+    for arr in arrays:
+        tmp = arr[b, p].copy()
+        arr[b, p] = arr[b, q]
+        arr[b, q] = tmp
+
+def eliminasi_gauss_batch(stack, make_one=False, jordan=False):
+    """
+    Versi batch dari operasi baris /calculate (ref_ops dan gauss_jordan_ops di
+    app.py) tanpa jejak langkah, untuk matriks yang semua entrinya float
+    stack: array (jumlah, baris, kolom) berisi matriks berukuran sama
+    Pivot pertama yang "!= 0" dan urutan bagi / kali / kurang yang sama, jadi
+    nilainya identik dengan Float SymPy. Mengembalikan (mats, dihitung, valid):
+    dihitung menandai entri hasil aritmetika (nol di sana adalah 0 eksak SymPy,
+    bukan 0.0 input); valid False untuk matriks yang keluar dari rentang _normal
+    atau yang pivotnya 0.0 input (/calculate gagal membagi dengan nol).
+    """
+    mats = np.array(stack, dtype=np.float64)
+    jumlah, num_rows, num_cols = mats.shape
+    baris = np.arange(num_rows)
+    dihitung = np.zeros(mats.shape, dtype=bool)
+    valid = _normal(mats)
+    pivot_row = np.zeros(jumlah, dtype=np.intp)
+
+    # Gauss-Jordan: baris pivot tiap matriks maju sendiri; Gauss: pivot di diagonal
+    for j in range(num_cols if jordan else min(num_rows, num_cols)):
+        if not jordan:
+            pivot_row[:] = j
+
+        # Float SymPy 0.0 dari input tidak sama dengan 0 (hanya hasil nol menjadi 0 eksak),
+        # jadi "!= 0" benar untuk setiap entri yang belum dihitung
+        bukan_nol = (mats[:, :, j] != 0) | ~dihitung[:, :, j]
+        kandidat = bukan_nol & (baris[None, :] >= pivot_row[:, None])
+        b = np.flatnonzero(kandidat.any(axis=1))
+        if b.size == 0:
+            continue
+        p = pivot_row[b]
+        _tukar(b, p, np.argmax(kandidat[b], axis=1), mats, dihitung, bukan_nol)
+        nol = mats[b, p, j] == 0
+
+        # Buat pivot menjadi 1 jika diminta; Float SymPy tidak pernah sama dengan
+        # Integer 1, jadi baris pivot selalu dibagi
+        if make_one:
+            mats[b, p] = mats[b, p] / mats[b, p, j][:, None]
+            dihitung[b, p] = True
+
+        # Eliminasi: R_i = R_i - faktor * R_pivot untuk semua matriks sekaligus
+        sub = mats[b]
+        baris_pivot = sub[np.arange(b.size), p]
+        target = bukan_nol[b]
+        target[np.arange(b.size), p] = False
+        if not jordan:
+            target[baris[None, :] < p[:, None]] = False
+        # Pivot 0.0 input yang dipakai untuk membagi: /calculate gagal (ZeroDivisionError)
+        valid[b[nol & (make_one | target.any(axis=1))]] = False
+        faktor = sub[:, :, j] if make_one else sub[:, :, j] / baris_pivot[:, j][:, None]
+        produk = faktor[:, :, None] * baris_pivot[:, None, :]
+        mats[b] = np.where(target[:, :, None], sub - produk, sub)
+        dihitung[b] |= target[:, :, None]
+        valid[b] &= _normal(np.where(target[:, :, None], produk, 0)) & _normal(mats[b])
+
+        pivot_row[b] += 1
+
+    return mats, dihitung, valid
+
+def rref_batch(stack):
+    """
+    Matrix.rref() SymPy untuk banyak matriks float berukuran sama sekaligus:
+    eliminasi bebas pecahan R_i = pivot * R_i - nilai * R_pivot, pivot |x| terbesar,
+    lalu setiap baris pivot dibagi pivotnya. Mengembalikan (mats, dihitung, valid,
+    pivots) seperti eliminasi_gauss_batch; pivots (jumlah, baris) berisi kolom
+    pivot tiap baris atau -1. Di posisi pivot SymPy menulis 1 eksak.
+    """
+    mats = np.array(stack, dtype=np.float64)
+    jumlah, num_rows, num_cols = mats.shape
+    baris = np.arange(num_rows)
+    dihitung = np.zeros(mats.shape, dtype=bool)
+    valid = _normal(mats)
+    pivot_row = np.zeros(jumlah, dtype=np.intp)
+    pivots = np.full((jumlah, num_rows), -1, dtype=np.intp)
+
+    for j in range(num_cols):
+        kolom = np.abs(mats[:, :, j])
+        kolom[baris[None, :] < pivot_row[:, None]] = -1
+        max_row = np.argmax(kolom, axis=1)
+        b = np.flatnonzero(np.take_along_axis(kolom, max_row[:, None], axis=1)[:, 0] > 0)
+        if b.size == 0:
+            continue
+        p = pivot_row[b]
+        _tukar(b, p, max_row[b], mats, dihitung)
+
+        sub = mats[b]
+        baris_pivot = sub[np.arange(b.size), p]
+        nilai = sub[:, :, j]
+        target = nilai != 0
+        target[np.arange(b.size), p] = False
+        kiri = baris_pivot[:, j][:, None, None] * sub
+        kanan = nilai[:, :, None] * baris_pivot[:, None, :]
+        mats[b] = np.where(target[:, :, None], kiri - kanan, sub)
+        dihitung[b] |= target[:, :, None]
+        valid[b] &= (_normal(np.where(target[:, :, None], kiri, 0))
+                     & _normal(np.where(target[:, :, None], kanan, 0)) & _normal(mats[b]))
+
+        pivots[b, p] = j
+        pivot_row[b] += 1
+
+    # Normalisasi: entri setelah pivot dibagi pivot, pivot menjadi 1
+    kolom = np.arange(num_cols)
+    for i in range(num_rows):
+        b = np.flatnonzero(pivots[:, i] >= 0)
+        if b.size == 0:
+            continue
+        c = pivots[b, i]
+        pivot_val = mats[b, i, c]
+        setelah = kolom[None, :] >= c[:, None]
+        mats[b, i] = np.where(setelah, mats[b, i] / pivot_val[:, None], mats[b, i])
+        mats[b, i, c] = 1
+        dihitung[b, i] |= setelah
+    valid &= _normal(mats)
+
+    return mats, dihitung, valid, pivots
@@ -0,0 +1,148 @@
+import importlib
+import sys
+import threading
+import time
+
+# Registry mesin perhitungan yang dimuat saat pertama dipakai. app.py tidak mengimpor
+# NumPy, SymPy atau modul mesin di awal, sehingga proses server dan pekerja yang baru
+# dibuat cepat siap; request pertama yang memerlukan sebuah mesin membayar impornya.
+# Hook pemanasan (warm-up) opsional bisa dijalankan setelah fork, di luar request.
+# Waktu impor dan pemanasan setiap mesin dicatat untuk /engines dan /metrics.
+
+_lock = threading.RLock()
+_engines = {}
+
+
+class Engine:
+    """A registered engine: module name, engines it needs first and an optional warm-up hook"""
+
+    def __init__(self, name, module, requires=(), warmup=None, description=''):
+        self.name = name
+        self.module_name = module
+        self.requires = tuple(requires)
+        self.warmup = warmup
+        self.description = description
+        self.module = None
+        self.import_seconds = None
+        self.warmup_seconds = None
+
+    def stats(self):
+        return {
+            'module': self.module_name,
+            'description': self.description,
+            'loaded': self.module is not None,
+            'import_seconds': self.import_seconds,
+            'warmup_seconds': self.warmup_seconds,
+        }
+
+
+def register(name, module, requires=(), warmup=None, description=''):
+    """
+    Register an engine. requires lists engines loaded before it, so that the
+    import time of a shared dependency (NumPy) is counted once, on its own
+    entry. warmup(module) runs from warm().
+    """
+    with _lock:
+        _engines[name] = Engine(name, module, requires, warmup, description)
+
+
+def load(name):
+    """Import the engine module on first use and return it"""
+    engine = _engines[name]
+    if engine.module is not None:
+        return engine.module
+    with _lock:
+        if engine.module is None:
+            for dependency in engine.requires:
+                load(dependency)
+            mulai = time.perf_counter()
+            # Modul yang sudah diimpor pihak lain tetap dicatat (waktu ~0)
+            module = sys.modules.get(engine.module_name) or importlib.import_module(engine.module_name)
+            engine.import_seconds = time.perf_counter() - mulai
+            engine.module = module
+    return engine.module
+
+
+def loaded(name):
+    return _engines[name].module is not None
+
+
+def warm(names=None):
+    """
+    Import and warm up the given engines (all registered ones for None).
+    Meant to run after fork / at worker start, before the first request.
+    """
+    for name in (list(_engines) if names is None else names):
+        engine = _engines[name]
+        module = load(name)
+        if engine.warmup is not None and engine.warmup_seconds is None:
+            mulai = time.perf_counter()
+            engine.warmup(module)
+            engine.warmup_seconds = time.perf_counter() - mulai
+
+
+def stats():
+    with _lock:
+        return {name: engine.stats() for name, engine in _engines.items()}
+
+
+class LazyModule:
+    """Module stand-in: the first attribute access loads the engine"""
+
+    def __init__(self, name):
+        self._engine = name
+
+    def __getattr__(self, attr):
+        return getattr(load(self._engine), attr)
+
+    def __repr__(self):
+        return f"<lazy engine {self._engine!r}>"
+
+
+def lazy(name):
+    return LazyModule(name)
+
+
+# --- mesin bawaan ---
+
+def _warm_numpy(np):
+    # Memuat BLAS/LAPACK (matmul, SVD) yang dipakai semua mesin float
+    A = np.arange(1.0, 10.0).reshape(3, 3) + np.eye(3)
+    np.linalg.svd(A @ A)
+
+
+def _warm_sympy(sp):
+    # rref dan cetak Float/Rational mengisi cache internal SymPy
+    str(sp.Matrix([[sp.Float(1.5), 2, 3], [4, 5, sp.Rational(1, 3)]]).rref())
+
+
+def _warm_eliminasi(eliminasi):
+    eliminasi.analisis_solusi([[2.0, 1.0, 3.0], [1.0, 3.0, 4.0]])
+
+
+def _warm_bareiss(bareiss):
+    bareiss.rref([[2, 1, 3], [1, 3, 4]])
+
+
+register('numpy', 'numpy', warmup=_warm_numpy,
+         description="NumPy (dipakai semua mesin float)")
+register('sympy', 'sympy', warmup=_warm_sympy,
+         description="SymPy: langkah input non-bulat dan tampilan Float")
+register('eliminasi', 'eliminasi', requires=('numpy',), warmup=_warm_eliminasi,
+         description="Eliminasi float NumPy, batch dan klasifikasi SVD")
+register('bareiss', 'bareiss', warmup=_warm_bareiss,
+         description="Eliminasi eksak rasional (Bareiss) untuk input bulat/pecahan")
+register('modular', 'modular', requires=('numpy',),
+         description="RREF eksak multi-modular untuk matriks bulat besar")
+register('lu', 'lu', requires=('numpy',),
+         description="Faktorisasi LU float/eksak")
+register('hybrid', 'hybrid', requires=('numpy',),
+         description="Solusi eksak float + rekonstruksi pecahan")
+register('sparse', 'sparse', requires=('eliminasi',),
+         description="Eliminasi sparse dengan pivot Markowitz")
+register('blocked', 'blocked', requires=('numpy',),
+         description="Eliminasi out-of-core untuk upload besar")
+register('parametric', 'parametric', requires=('sympy',),
+         description="Eliminasi bebas-pecahan atas polinomial untuk sistem berparameter")
+register('incremental', 'incremental', requires=('numpy',),
+         description="Penyelesaian ulang rank-1 untuk /session")
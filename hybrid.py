@@ -0,0 +1,139 @@
+from fractions import Fraction
+from math import isqrt, lcm, log2
+
+import numpy as np
+
+import modular
+
+# Pemecah hibrida untuk sistem dengan solusi tunggal: selesaikan dulu dengan float64,
+# lalu perbaiki secara iteratif dengan residu bilangan bulat yang dihitung eksak
+# (x ~ X / D, setiap putaran menambah bit ke D dan menjaga r = D*b - A*X tetap kecil).
+# Setelah D cukup besar, setiap x_i direkonstruksi menjadi pecahan dengan pecahan
+# berlanjut dan hasilnya diverifikasi eksak terhadap A x = b. Jika gagal (singular,
+# kondisi terlalu buruk, tidak konsisten) hasilnya None dan pemanggil memakai mesin eksak.
+
+# Bit yang ditambahkan ke penyebut D per putaran (dikurangi jika residu membesar)
+STEP_BITS = 30
+MIN_STEP_BITS = 4
+# Rekonstruksi dianggap stabil jika penyebut kandidat jauh di bawah akar D
+GUARD_BITS = 20
+
+
+def to_integer_rows(matrix):
+    """
+    Exact integer version of an augmented matrix. Floats are read as the decimal
+    they print as (0.1 -> 1/10), then every row is scaled by the lcm of its
+    denominators, which keeps the solution set.
+    """
+    rows = []
+    for row in matrix:
+        values = []
+        for x in row:
+            if type(x) is int:
+                values.append(Fraction(x))
+            elif isinstance(x, (float, np.floating)):
+                values.append(Fraction(repr(float(x))))
+            else:
+                raise ValueError(f"Nilai tidak valid: {x!r}")
+        d = lcm(*(v.denominator for v in values))
+        rows.append([int(v * d) for v in values])
+    return rows
+
+
+def _dot(A, A64, v, max_a):
+    """Exact A @ v for an integer vector v: int64 when it cannot overflow, Python ints otherwise"""
+    max_v = max((abs(x) for x in v), default=0)
+    if A64 is not None and max_a * max_v * A.shape[1] < 2**62:
+        return A64.dot(np.array(v, dtype=np.int64)).astype(object)
+    return A.dot(np.array(v, dtype=object))
+
+
+def _reconstruct(X, D):
+    """
+    Fractions x_i close to X_i / D. The common denominator L found so far is
+    multiplied in first, so later components usually need only a short
+    continued fraction.
+    """
+    bound = isqrt(D >> 1)
+    L = 1
+    hasil = []
+    for xi in X:
+        approx = Fraction(int(xi) * L, D).limit_denominator(max(bound // L, 1))
+        hasil.append(approx / L)
+        L *= approx.denominator
+    return hasil, L
+
+
+def _verify(A, b, x, L):
+    """Exact check of A x = b, using x * L as integers"""
+    N = np.array([int(v * L) for v in x], dtype=object)
+    return np.array_equal(A.dot(N), b * L)
+
+
+def solve(matrix):
+    """
+    Unique solution of an integer augmented matrix [A | b] as a list of
+    Fractions, or None when the float phase cannot produce a verified answer
+    (fewer equations than variables, singular or badly conditioned A,
+    inconsistent system).
+    """
+    M = np.array(matrix, dtype=object)
+    A, b = M[:, :-1], M[:, -1]
+    m, n = A.shape
+    if n == 0 or m < n:
+        return None
+
+    # Invers pendekatan (pseudo-invers untuk m > n) dari SVD, dihitung sekali. Baris
+    # diskalakan ke maks 1 dulu, karena to_integer_rows bisa membuat skala baris sangat berbeda
+    Af = A.astype(np.float64)
+    row_max = np.abs(Af).max(axis=1)
+    w = 1 / np.where(row_max > 0, row_max, 1)
+    U, s, Vt = np.linalg.svd(Af * w[:, None], full_matrices=False)
+    if s[-1] <= max(m, n) * np.finfo(np.float64).eps * s[0]:
+        return None
+    A_inv = ((Vt.T / s) @ U.T) * w
+    step = min(STEP_BITS, int(50 - log2(s[0] / s[-1])))
+    if step < MIN_STEP_BITS:
+        return None
+
+    max_a = int(max(abs(x) for x in A.ravel()))
+    A64 = A.astype(np.int64) if max_a < 2**62 else None
+    # Penyebut dan pembilang solusi dibatasi determinan (Hadamard); setelah itu menyerah
+    max_bits = 2 * modular.hadamard_bits(matrix) + log2(s[0] / s[-1]) + 2 * GUARD_BITS + STEP_BITS
+
+    X = [0] * n
+    D = 1
+    r = b.copy()
+    r_max = max(abs(int(x)) for x in r)
+    # Residu tidak pernah turun di bawah galat pembulatan dN, sekitar jumlah |A| per baris
+    floor = max(sum(abs(int(x)) for x in row) for row in A)
+    next_check = 2 * STEP_BITS
+    while True:
+        if r_max == 0:
+            return [Fraction(x, D) for x in X]
+        d = A_inv @ r.astype(np.float64)
+        alpha = 1 << step
+        dN = [int(v) for v in np.rint(d * alpha)]
+        r_new = r * alpha - _dot(A, A64, dN, max_a)
+        r_new_max = max(abs(int(x)) for x in r_new)
+        if r_new_max > 2 * max(r_max, floor):
+            # Langkah terlalu besar untuk kondisi matriks ini
+            step //= 2
+            if step < MIN_STEP_BITS:
+                return None
+            continue
+        X = [x * alpha + dx for x, dx in zip(X, dN)]
+        D *= alpha
+        r, r_max = r_new, r_new_max
+
+        if D.bit_length() >= next_check or D.bit_length() > max_bits:
+            # Rekonstruksi dicoba begitu penyebut komponen pertama sudah stabil; pemeriksaan
+            # ini O(bit^2), jadi hanya dilakukan saat D tumbuh 25%
+            next_check = D.bit_length() * 5 // 4
+            q = Fraction(X[0], D).limit_denominator(isqrt(D >> 1)).denominator
+            if 2 * q.bit_length() + GUARD_BITS < D.bit_length():
+                x, L = _reconstruct(X, D)
+                if _verify(A, b, x, L):
+                    return x
+        if D.bit_length() > max_bits:
+            return None
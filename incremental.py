@@ -0,0 +1,161 @@
+import numpy as np
+
+import lu
+
+# Penyelesaian ulang bertahap untuk penyuntingan interaktif ("bagaimana jika").
+# Faktor LU matriks terakhir disimpan; perubahan satu elemen atau satu baris koefisien
+# adalah pembaruan rank-1 A' = A + u v^T, sehingga dengan Sherman-Morrison
+#   A'^-1 b = y - w (v . y) / (1 + v . w),   y = A^-1 b,  w = A^-1 u
+# cukup O(n^2) per perubahan. Pembaruan disimpan berantai di atas faktor dasar dan
+# faktor dihitung ulang (O(n^3)) jika penyebut terlalu kecil, residu solusi tidak lolos
+# pemeriksaan, rantai sudah MAX_UPDATES panjangnya, atau matriks tidak persegi/singular.
+# Faktorisasi ulang memakai fungsi factorize yang diberikan pemanggil (misal lewat pool
+# pekerja di server), pembaruan O(n^2) tetap dijalankan di tempat.
+
+MAX_UPDATES = 16
+# Penyebut Sherman-Morrison relatif di bawah ini dianggap tidak stabil (float)
+SM_TOL = 1e-8
+# Batas residu relatif ||A x - b|| / (||A|| ||x|| + ||b||) setelah pembaruan (float)
+RESIDU_TOL = 1e-10
+
+
+class IncrementalSolver:
+    """
+    Augmented system [A | b] that keeps its factorization between edits.
+    Integer systems stay exact (Fraction) until a non-integer value is entered.
+    """
+
+    def __init__(self, matrix, max_updates=MAX_UPDATES):
+        rows = [list(row) for row in matrix]
+        if not all(type(x) in (int, float) for row in rows for x in row):
+            raise ValueError("Nilai harus berupa angka")
+        if not rows or len(rows[0]) < 2 or any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("Matriks augmented harus persegi panjang dengan minimal 2 kolom")
+        self.max_updates = max_updates
+        self.updates = 0
+        self.refactors = 0
+        self._rows = rows
+        self._refactor()
+
+    # --- keadaan ---
+
+    @property
+    def shape(self):
+        return self.factor.shape
+
+    @property
+    def exact(self):
+        return self.factor.exact
+
+    @property
+    def pivots(self):
+        return self.factor.pivots
+
+    def matrix(self):
+        return [list(row) for row in self._rows]
+
+    def _vector(self, values):
+        return np.array(values, dtype=object if self.exact else np.float64)
+
+    def _refactor(self, factorize=lu.factorize):
+        m, n = len(self._rows), len(self._rows[0]) - 1
+        self.factor = factorize([row[:-1] for row in self._rows])
+        self._chain = []
+        self.refactors += 1
+        # Sherman-Morrison hanya untuk A persegi yang tidak singular
+        self._incremental = m == n and self.factor.rank == n
+        self._solve_current()
+
+    def _base_solve(self, rhs):
+        return self._vector(self.factor.solve([list(rhs)])[0][1])
+
+    def _chain_solve(self, rhs):
+        """A^-1 rhs for the current A: base factor, then every rank-1 update in order"""
+        y = self._base_solve(rhs)
+        for w, v, d in self._chain:
+            y = y - w * (v.dot(y) / d)
+        return y
+
+    def _solve_current(self):
+        b = [row[-1] for row in self._rows]
+        if self._incremental:
+            self._result = (False, self._chain_solve(b))
+        else:
+            inkonsisten, x = self.factor.solve([b])[0]
+            self._result = (inkonsisten, None if x is None else self._vector(x))
+
+    def _residual_ok(self):
+        """Backward-error check of the Sherman-Morrison solution (float only)"""
+        if self.exact or not self._incremental:
+            return True
+        x = self._result[1]
+        M = np.array(self._rows, dtype=np.float64)
+        A, b = M[:, :-1], M[:, -1]
+        skala = np.abs(A).sum(axis=1).max() * np.abs(x).max() + np.abs(b).max()
+        return np.abs(A @ x - b).max() <= RESIDU_TOL * max(skala, 1.0)
+
+    # --- penyuntingan ---
+
+    def set_cell(self, i, j, value, factorize=lu.factorize):
+        """Change one entry (j = last column changes b). Returns True if it refactored."""
+        row = list(self._rows[i])
+        row[j] = value
+        return self.set_row(i, row, factorize)
+
+    def set_row(self, i, values, factorize=lu.factorize):
+        """
+        Replace row i of [A | b]. Returns True if it refactored (with factorize).
+        If factorize raises (e.g. a pool timeout) the edit is undone.
+        """
+        values = list(values)
+        if len(values) != len(self._rows[i]):
+            raise ValueError(f"Baris harus berisi {len(self._rows[i])} nilai")
+        if not all(type(x) in (int, float) for x in values):
+            raise ValueError("Nilai harus berupa angka")
+        lama = self._rows[i]
+        rantai, hasil = list(self._chain), self._result
+        self._rows[i] = values
+        try:
+            return self._ubah(i, values, lama, factorize)
+        except Exception:
+            self._rows[i] = lama
+            self._chain, self._result = rantai, hasil
+            raise
+
+    def _ubah(self, i, values, lama, factorize):
+        if self.exact and not all(type(x) is int for x in values):
+            # Nilai pecahan/desimal: lanjut dengan faktor float
+            self._refactor(factorize)
+            return True
+
+        n = self.shape[1]
+        v = self._vector(values[:n]) - self._vector(lama[:n])
+        if v.any():
+            if not self._incremental or len(self._chain) >= self.max_updates:
+                self._refactor(factorize)
+                return True
+            e = self._vector([0] * self.shape[0])
+            e[i] = 1
+            # A' = A + e_i v^T
+            w = self._chain_solve(e)
+            d = 1 + v.dot(w)
+            if self.exact:
+                stabil = d != 0
+            else:
+                stabil = abs(d) > SM_TOL * max(1.0, float(np.abs(v).max() * np.abs(w).max()))
+            if not stabil:
+                self._refactor(factorize)
+                return True
+            self._chain.append((w, v, d))
+        # Hanya b yang berubah: faktor yang sama cukup diselesaikan ulang
+        self._solve_current()
+        if not self._residual_ok():
+            self._refactor(factorize)
+            return True
+        self.updates += 1
+        return False
+
+    def solve(self):
+        """(inconsistent, x) for the current system; x is None unless the solution is unique"""
+        inkonsisten, x = self._result
+        return inkonsisten, None if x is None else x.tolist()
@@ -0,0 +1,258 @@
+from fractions import Fraction
+
+import numpy as np
+
+import bareiss
+
+# Faktorisasi LU berpivot untuk pola "faktorkan sekali, selesaikan berkali-kali".
+# PA = LU dengan U berbentuk eselon (matriks boleh persegi panjang/singular), sehingga
+# setiap ruas kanan b cukup diselesaikan dengan substitusi maju/mundur O(n^2):
+#   y = L^-1 P b, sistem tidak konsisten jika y[rank:] != 0, solusi unik jika rank = n.
+# Matriks rasional (bulat / pecahan) difaktorkan eksak (Fraction), selain itu float NumPy.
+# Dari faktor yang sama juga diperoleh determinan, invers dan basis ruang nol.
+
+TOL = 1e-10
+
+
+def _as_columns(rhs, m):
+    """One RHS vector or a list of them -> list of vectors of length m"""
+    if len(rhs) and not isinstance(rhs[0], (list, tuple)):
+        rhs = [rhs]
+    for b in rhs:
+        if len(b) != m:
+            raise ValueError(f"Panjang ruas kanan harus {m}")
+    return rhs
+
+
+def _perm_sign(perm):
+    """+1 for an even permutation, -1 for an odd one"""
+    sign = 1
+    seen = [False] * len(perm)
+    for i in range(len(perm)):
+        panjang = 0
+        while not seen[i]:
+            seen[i] = True
+            i = perm[i]
+            panjang += 1
+        if panjang and panjang % 2 == 0:
+            sign = -sign
+    return sign
+
+
+class LUFactor:
+    """Float LU with partial pivoting (largest entry in the column)"""
+
+    exact = False
+
+    def __init__(self, matrix):
+        U = np.array(matrix, dtype=np.float64)
+        m, n = U.shape
+        L = np.eye(m)
+        perm = np.arange(m)
+        pivots = []
+        r = 0
+        for c in range(n):
+            if r >= m:
+                break
+            p = r + int(np.argmax(np.abs(U[r:, c])))
+            if abs(U[p, c]) < TOL:
+                continue
+            if p != r:
+                U[[r, p]] = U[[p, r]]
+                L[[r, p], :r] = L[[p, r], :r]
+                perm[[r, p]] = perm[[p, r]]
+            faktor = U[r + 1:, c] / U[r, c]
+            L[r + 1:, r] = faktor
+            U[r + 1:, c:] -= np.outer(faktor, U[r, c:])
+            U[r + 1:, c] = 0
+            pivots.append(c)
+            r += 1
+        U[np.abs(U) < TOL] = 0
+        self.shape = (m, n)
+        self.L, self.U, self.perm = L, U, perm
+        self.pivots = tuple(pivots)
+
+    @property
+    def rank(self):
+        return len(self.pivots)
+
+    def _forward(self, B):
+        """L^-1 P B for the right-hand sides in the columns of B"""
+        Y = B[self.perm].copy()
+        # Substitusi maju (L segitiga bawah dengan diagonal 1)
+        for i in range(1, self.shape[0]):
+            Y[i] -= self.L[i, :i] @ Y[:i]
+        return Y
+
+    def _back(self, Y):
+        """Pivot variables from the first rank rows of Y, free variables = 0"""
+        r = self.rank
+        # Substitusi mundur pada kolom pivot
+        Up = self.U[:r, list(self.pivots)]
+        Z = np.zeros((r, Y.shape[1]))
+        for i in range(r - 1, -1, -1):
+            Z[i] = (Y[i] - Up[i, i + 1:] @ Z[i + 1:]) / Up[i, i]
+        X = np.zeros((self.shape[1], Y.shape[1]))
+        X[list(self.pivots)] = Z
+        return X
+
+    def solve(self, rhs):
+        """
+        Solve for every RHS at once. Returns one (inconsistent, x) pair per RHS,
+        x is the unique solution (list of floats) or None
+        """
+        m, n = self.shape
+        Y = self._forward(np.array(_as_columns(rhs, m), dtype=np.float64).T)
+        r = self.rank
+
+        inkonsisten = np.any(np.abs(Y[r:]) > TOL, axis=0)
+        X = self._back(Y[:r]) if r == n else None
+        return [(bool(inkonsisten[k]), None if X is None or inkonsisten[k] else X[:, k].tolist())
+                for k in range(Y.shape[1])]
+
+    def particular(self, b):
+        """(inconsistent, x) for one RHS, x with the free variables set to 0"""
+        Y = self._forward(np.array(_as_columns(b, self.shape[0]), dtype=np.float64).T)
+        if np.any(np.abs(Y[self.rank:]) > TOL):
+            return True, None
+        return False, self._back(Y[:self.rank])[:, 0].tolist()
+
+    def determinant(self):
+        m, n = self.shape
+        if m != n:
+            raise ValueError("Determinan hanya untuk matriks koefisien persegi")
+        if self.rank < n:
+            return 0.0
+        return float(_perm_sign(self.perm) * np.prod(np.diag(self.U)))
+
+    def inverse(self):
+        """Rows of A^-1, or None when A is singular"""
+        m, n = self.shape
+        if m != n:
+            raise ValueError("Invers hanya untuk matriks koefisien persegi")
+        if self.rank < n:
+            return None
+        return self._back(self._forward(np.eye(n))).tolist()
+
+    def nullspace(self):
+        """Basis of {x : A x = 0}: one vector per free column, that variable 1 and the other free ones 0"""
+        free = [c for c in range(self.shape[1]) if c not in self.pivots]
+        X = self._back(-self.U[:self.rank, free])
+        X[free, range(len(free))] = 1
+        return X.T.tolist()
+
+
+class ExactLUFactor:
+    """Exact LU over the rationals (first nonzero pivot) for rational matrices"""
+
+    exact = True
+
+    def __init__(self, matrix):
+        U = [[Fraction(x) for x in row] for row in matrix]
+        m, n = len(U), len(U[0])
+        L = [[Fraction(0)] * m for _ in range(m)]
+        perm = list(range(m))
+        pivots = []
+        r = 0
+        for c in range(n):
+            if r >= m:
+                break
+            p = next((i for i in range(r, m) if U[i][c] != 0), None)
+            if p is None:
+                continue
+            if p != r:
+                U[r], U[p] = U[p], U[r]
+                L[r], L[p] = L[p], L[r]
+                perm[r], perm[p] = perm[p], perm[r]
+            pivot_row = U[r]
+            for i in range(r + 1, m):
+                if U[i][c] != 0:
+                    f = U[i][c] / pivot_row[c]
+                    L[i][r] = f
+                    U[i] = [a - f * b for a, b in zip(U[i], pivot_row)]
+            pivots.append(c)
+            r += 1
+        self.shape = (m, n)
+        self.L, self.U, self.perm = L, U, perm
+        self.pivots = tuple(pivots)
+
+    @property
+    def rank(self):
+        return len(self.pivots)
+
+    def _forward(self, b):
+        """L^-1 P b for one right-hand side"""
+        r = self.rank
+        y = [Fraction(b[i]) for i in self.perm]
+        for i in range(1, self.shape[0]):
+            y[i] -= sum((self.L[i][j] * y[j] for j in range(min(i, r)) if self.L[i][j]), Fraction(0))
+        return y
+
+    def _back(self, y):
+        """Pivot variables from y[:rank], free variables = 0"""
+        n = self.shape[1]
+        x = [Fraction(0)] * n
+        for i in range(self.rank - 1, -1, -1):
+            c = self.pivots[i]
+            row = self.U[i]
+            total = y[i] - sum((row[j] * x[j] for j in range(c + 1, n) if row[j]), Fraction(0))
+            x[c] = total / row[c]
+        return x
+
+    def solve(self, rhs):
+        """Same as LUFactor.solve, with Fraction solutions"""
+        m, n = self.shape
+        r = self.rank
+        hasil = []
+        for b in _as_columns(rhs, m):
+            y = self._forward(b)
+            if any(y[r:]):
+                hasil.append((True, None))
+                continue
+            if r < n:
+                hasil.append((False, None))
+                continue
+            hasil.append((False, self._back(y)))
+        return hasil
+
+    def particular(self, b):
+        """Same as LUFactor.particular, with Fractions"""
+        y = self._forward(_as_columns(b, self.shape[0])[0])
+        if any(y[self.rank:]):
+            return True, None
+        return False, self._back(y)
+
+    def determinant(self):
+        m, n = self.shape
+        if m != n:
+            raise ValueError("Determinan hanya untuk matriks koefisien persegi")
+        det = Fraction(_perm_sign(self.perm))
+        for i in range(n):
+            det *= self.U[i][i]
+        return det
+
+    def inverse(self):
+        """Rows of A^-1, or None when A is singular"""
+        m, n = self.shape
+        if m != n:
+            raise ValueError("Invers hanya untuk matriks koefisien persegi")
+        if self.rank < n:
+            return None
+        kolom = [self._back(self._forward([int(i == k) for i in range(n)])) for k in range(n)]
+        return [list(row) for row in zip(*kolom)]
+
+    def nullspace(self):
+        """Same as LUFactor.nullspace, with Fractions"""
+        basis = []
+        for f in (c for c in range(self.shape[1]) if c not in self.pivots):
+            x = self._back([-self.U[i][f] for i in range(self.rank)])
+            x[f] = Fraction(1)
+            basis.append(x)
+        return basis
+
+
+def factorize(matrix):
+    """Pivoted LU of a coefficient matrix: exact for rational input, float otherwise"""
+    if bareiss.is_rational_matrix(matrix):
+        return ExactLUFactor(matrix)
+    return LUFactor(matrix)
@@ -0,0 +1,152 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+# Instrumentasi waktu per fase request (parse, konversi, eliminasi, format, ...)
+# dan histogram latensi dalam format teks Prometheus untuk endpoint /metrics.
+
+# Batas bucket histogram (detik)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Batas bucket ukuran matriks (maks jumlah baris/kolom)
+SIZE_BUCKETS = (5, 10, 25, 50, 100, 200)
+
+
+def size_bucket(rows, cols):
+    n = max(rows, cols)
+    for batas in SIZE_BUCKETS:
+        if n <= batas:
+            return f"<={batas}"
+    return f">{SIZE_BUCKETS[-1]}"
+
+
+class PhaseTimer:
+    """Accumulated wall time per named phase, in the order phases first ran"""
+
+    def __init__(self):
+        self.phases = {}
+
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - mulai)
+
+    def merge(self, phases):
+        for name, seconds in phases.items():
+            self.add(name, seconds)
+
+    def total(self):
+        return sum(self.phases.values())
+
+    def server_timing(self):
+        """Value for the Server-Timing response header (durations in ms)"""
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.phases.items())
+
+
+_current = contextvars.ContextVar('phase_timer', default=None)
+
+
+@contextmanager
+def fase(name):
+    """Time a block into the timer of the running timed() call, if any"""
+    timer = _current.get()
+    if timer is None:
+        yield
+        return
+    with timer.phase(name):
+        yield
+
+
+def timed(fn, *args, **kwargs):
+    """
+    Call fn with a fresh PhaseTimer active and return (result, phases).
+    Module-level so it can be sent to a worker process.
+    """
+    timer = PhaseTimer()
+    token = _current.set(timer)
+    try:
+        return fn(*args, **kwargs), timer.phases
+    finally:
+        _current.reset(token)
+
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, batas in enumerate(self.buckets):
+            if value <= batas:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    return ",".join(f'{key}="{_label_value(value)}"' for key, value in labels)
+
+
+class Registry:
+    """Thread-safe set of labelled histograms rendered in Prometheus text format"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help = {}
+        self._series = {}
+
+    def describe(self, name, help_text):
+        self._help[name] = help_text
+
+    def observe(self, name, labels, value):
+        key = (name, tuple(labels.items()))
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                histogram = self._series[key] = Histogram()
+            histogram.observe(value)
+
+    def render(self, extra=()):
+        """
+        Prometheus exposition text; extra is an optional list of
+        (name, type, help, value) metrics added after the histograms, value
+        being a number or a list of (labels dict, number)
+        """
+        lines = []
+        with self._lock:
+            series = sorted(self._series.items(), key=lambda item: item[0])
+            terakhir = None
+            for (name, labels), histogram in series:
+                if name != terakhir:
+                    lines.append(f"# HELP {name} {self._help.get(name, name)}")
+                    lines.append(f"# TYPE {name} histogram")
+                    terakhir = name
+                kumulatif = 0
+                for batas, count in zip(histogram.buckets, histogram.counts):
+                    kumulatif += count
+                    lines.append(f'{name}_bucket{{{_labels(labels + (("le", f"{batas:g}"),))}}} {kumulatif}')
+                lines.append(f'{name}_bucket{{{_labels(labels + (("le", "+Inf"),))}}} {histogram.count}')
+                lines.append(f"{name}_sum{{{_labels(labels)}}} {histogram.sum:.6f}")
+                lines.append(f"{name}_count{{{_labels(labels)}}} {histogram.count}")
+        for name, kind, help_text, value in extra:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if isinstance(value, list):
+                for labels, v in value:
+                    lines.append(f"{name}{{{_labels(tuple(labels.items()))}}} {v}")
+            else:
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,229 @@
+from fractions import Fraction
+from math import isqrt, lcm, log2
+
+import numpy as np
+
+import bareiss
+
+# Mesin eksak multi-modular untuk matriks bilangan bulat (tanpa langkah).
+# RREF dihitung modulo beberapa bilangan prima < 2^31 (NumPy int64, hasil kali
+# dua elemen masih muat di int64), digabung dengan CRT, lalu setiap elemen
+# direkonstruksi menjadi pecahan. Berhenti lebih awal begitu rekonstruksi stabil
+# dan lolos verifikasi eksak terhadap matriks asli.
+
+# Di bawah ukuran ini Bareiss (satu eliminasi bilangan bulat) lebih cepat
+MIN_ROWS = 100
+
+_PRIMES = []
+
+
+def _is_prime(n):
+    """Deterministic Miller-Rabin for n < 3.3e24"""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def prime(k):
+    """k-th word-sized prime, counting down from 2^31"""
+    candidate = _PRIMES[-1] - 2 if _PRIMES else 2**31 - 1
+    while len(_PRIMES) <= k:
+        if _is_prime(candidate):
+            _PRIMES.append(candidate)
+        candidate -= 2
+    return _PRIMES[k]
+
+
+def rref_mod(A, primes):
+    """
+    RREF of an integer matrix (object array of Python ints) over GF(p) for
+    several primes at once: all residue matrices are stacked into one
+    (primes, rows, cols) int64 array and reduced together.
+    Returns a list of (rref as int64 array, pivot columns), one per prime.
+    """
+    P = len(primes)
+    ps = np.array(primes, dtype=np.int64)
+    M = np.stack([(A % p).astype(np.int64) for p in primes])
+    _, m, n = M.shape
+    baris = np.arange(m)
+    r = np.zeros(P, dtype=np.intp)
+    is_pivot = np.zeros((P, n), dtype=bool)
+
+    for c in range(n):
+        # Pivot: baris pertama >= r yang tidak nol modulo p, per prima
+        kandidat = (M[:, :, c] != 0) & (baris[None, :] >= r[:, None])
+        ada = kandidat.any(axis=1)
+        b = np.flatnonzero(ada)
+        if b.size == 0:
+            continue
+        rb = r[b]
+        pb = np.argmax(kandidat[b], axis=1)
+
+        tukar = pb != rb
+        if tukar.any():
+            bt, rt, pt = b[tukar], rb[tukar], pb[tukar]
+            tmp = M[bt, rt].copy()
+            M[bt, rt] = M[bt, pt]
+            M[bt, pt] = tmp
+
+        # Baris pivot dikali invers pivot (hanya kolom >= c yang bisa tidak nol)
+        inv = np.array([pow(int(M[k, i, c]), -1, int(ps[k])) for k, i in zip(b, rb)], dtype=np.int64)
+        pb_mod = ps[b]
+        M[b, rb, c:] = M[b, rb, c:] * inv[:, None] % pb_mod[:, None]
+
+        # Eliminasi rank-1 semua baris lain, untuk semua prima sekaligus
+        sub = M[b, :, c:]
+        col = sub[:, :, 0].copy()
+        col[np.arange(b.size), rb] = 0
+        pivot_rows = sub[np.arange(b.size), rb]
+        M[b, :, c:] = (sub - col[:, :, None] * pivot_rows[:, None, :]) % pb_mod[:, None, None]
+
+        is_pivot[b, c] = True
+        r[b] += 1
+
+    return [(M[k], tuple(np.flatnonzero(is_pivot[k]).tolist())) for k in range(P)]
+
+
+def _rational_reconstruction(u, mod):
+    """Find n/d = u (mod mod) with |n|, d <= sqrt(mod/2), or None"""
+    bound = isqrt(mod // 2)
+    r0, r1 = mod, u % mod
+    t0, t1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+    if t1 == 0 or abs(t1) > bound:
+        return None
+    if t1 < 0:
+        r1, t1 = -r1, -t1
+    return Fraction(r1, t1)
+
+
+def hadamard_bits(matrix):
+    """log2 of the Hadamard bound of the columns, bounds every minor of matrix"""
+    bits = 0.0
+    for j in range(len(matrix[0])):
+        norm2 = sum(row[j] * row[j] for row in matrix)
+        if norm2:
+            bits += log2(norm2) / 2
+    return bits
+
+
+def _verify(A, num, den, pivots):
+    """Exact check that every input row lies in the row space of the candidate RREF"""
+    if not pivots:
+        return not A.any()
+    # Skala dengan KPK penyebut agar pemeriksaan memakai bilangan bulat saja
+    D = lcm(*den.ravel().tolist())
+    N = num * (D // den)
+    return np.array_equal(A[:, list(pivots)].dot(N), A * D)
+
+
+def _reconstruct(residues, modulus, pivots):
+    """Rational reconstruction of every entry, or None while the modulus is too small"""
+    r, n = residues.shape
+    num = np.zeros((r, n), dtype=object)
+    den = np.ones((r, n), dtype=object)
+    pivot_set = set(pivots)
+    for i in range(r):
+        for j in range(n):
+            x = residues[i, j]
+            if j in pivot_set or x == 0:
+                # Kolom pivot pasti 0/1
+                num[i, j] = x
+                continue
+            value = _rational_reconstruction(x, modulus)
+            if value is None:
+                return None
+            num[i, j], den[i, j] = value.numerator, value.denominator
+    return num, den
+
+
+def rref(matrix, max_primes=None):
+    """
+    Multi-modular exact RREF of an integer matrix (rows of ints or an int64 array).
+    Returns (rref rows as Fraction, pivot columns), same as bareiss.rref()
+    """
+    A = np.array(matrix, dtype=object)
+    m, n = A.shape
+    if max_primes is None:
+        # Cukup prima agar modulus > 2 * H^2 (rekonstruksi pasti benar), plus cadangan
+        max_primes = int((2 * hadamard_bits(A) + 2) / 30) + 3
+
+    best_pivots = None
+    residues = None
+    modulus = 1
+    candidate = None
+
+    # Prima diproses per kelompok (1, 2, 4, ...) agar bisa dieliminasi bersama
+    k = 0
+    group = 1
+    done = False
+    while k < max_primes and not done:
+        primes = [prime(i) for i in range(k, min(k + group, max_primes))]
+        k += len(primes)
+        group *= 2
+        for p, (R, pivots) in zip(primes, rref_mod(A, primes)):
+            # Prima "sial" memberi pivot lebih sedikit/lebih ke kanan; mulai ulang jika
+            # ditemukan profil pivot yang lebih baik
+            if best_pivots is not None and pivots != best_pivots:
+                if len(pivots) < len(best_pivots) or (len(pivots) == len(best_pivots) and pivots > best_pivots):
+                    continue
+            R = R[:len(pivots)].astype(object)
+            if pivots != best_pivots:
+                best_pivots = pivots
+                residues = R
+                modulus = p
+                candidate = None
+                next_attempt = 0
+            else:
+                # Kandidat sebelumnya juga cocok modulo prima baru -> stabil, verifikasi eksak
+                if candidate is not None:
+                    num, den = candidate
+                    if not ((num - R * den) % p).any() and _verify(A, num, den, best_pivots):
+                        done = True
+                        break
+                    candidate = None
+                # CRT: x = x + modulus * ((r - x) * modulus^-1 mod p)
+                inv = pow(modulus % p, -1, p)
+                residues = residues + modulus * ((R - residues) * inv % p)
+                modulus *= p
+
+            # Rekonstruksi mahal untuk modulus besar: coba lagi hanya setelah
+            # modulus tumbuh ~25% sejak percobaan yang gagal (dan selalu di prima terakhir)
+            last = k >= max_primes and p == primes[-1]
+            if candidate is None and (modulus.bit_length() >= next_attempt or last):
+                candidate = _reconstruct(residues, modulus, best_pivots)
+                if candidate is None:
+                    next_attempt = modulus.bit_length() * 5 // 4
+
+    if not done and candidate is not None:
+        # Modulus sudah melewati batas Hadamard: cukup verifikasi eksak
+        done = _verify(A, *candidate, best_pivots)
+
+    if not done:
+        # Tidak lolos verifikasi dalam batas prima: pakai Bareiss
+        return bareiss.rref(matrix)
+
+    num, den = candidate
+    result = [[Fraction(int(x), int(d)) for x, d in zip(nrow, drow)] for nrow, drow in zip(num, den)]
+    result += [[Fraction(0)] * n for _ in range(m - len(result))]
+    return result, best_pivots
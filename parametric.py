@@ -0,0 +1,349 @@
+import re
+from fractions import Fraction
+
+import sympy as sp
+
+# Sistem parametrik: elemen matriks augmented boleh berupa polinomial dalam satu
+# parameter, misal "k", "2k - 1" atau "k^2 + 1". Matriks dieliminasi sekali secara
+# bebas-pecahan (Bareiss) atas Q[k]; setiap pembaruan
+#   a_ij <- (a_rc a_ij - a_ic a_rj) / pivot_sebelumnya
+# adalah pembagian polinomial yang eksak. Klasifikasi generik berlaku untuk semua k
+# kecuali akar real pivot dan akar real FPB sisa ruas kanan (baris nol di A). Setiap
+# faktor tak tereduksi f dari polinomial itu diklasifikasi ulang secara eksak atas
+# Q[k]/(f), sebuah lapangan, sehingga semua akar f cukup diperiksa sekali. Akar yang
+# klasifikasinya sama dengan kasus generik bukan nilai kritis dan dibuang.
+#
+# Elemen string diurai dengan pengurai kecil di bawah ini (bukan sympify/eval),
+# karena isinya datang langsung dari request.
+
+# Pangkat terbesar yang diterima pengurai, sekaligus derajat terbesar setiap polinomial
+# (hasil ^, perkalian, dan setiap langkah eliminasi) agar ukurannya tidak meledak
+MAX_PANGKAT = 32
+
+_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d*)?|\.\d+)|([A-Za-z_]\w*)|(\*\*|[-+*/^()]))")
+
+
+def _cek_derajat(derajat, konteks):
+    """ValueError when a polynomial degree is above MAX_PANGKAT"""
+    if derajat > MAX_PANGKAT:
+        raise ValueError(f"Derajat polinomial paling tinggi {MAX_PANGKAT}: {konteks}")
+
+
+class _Pengurai:
+    """Recursive-descent parser for polynomial expressions in one parameter"""
+
+    def __init__(self, teks, simbol):
+        self.teks = teks
+        self.simbol = simbol
+        self.token = []
+        posisi = 0
+        teks = teks.rstrip()
+        while posisi < len(teks):
+            cocok = _TOKEN.match(teks, posisi)
+            if cocok is None:
+                raise ValueError(f"Karakter tidak dikenal dalam '{self.teks}'")
+            angka, nama, operator = cocok.groups()
+            self.token.append(('angka', angka) if angka else ('nama', nama) if nama else ('op', operator))
+            posisi = cocok.end()
+        self.i = 0
+
+    def _poly(self, nilai):
+        return sp.Poly(nilai, self.simbol, domain=sp.QQ)
+
+    def _lihat(self):
+        return self.token[self.i] if self.i < len(self.token) else (None, None)
+
+    def _ambil(self):
+        token = self._lihat()
+        self.i += 1
+        return token
+
+    def urai(self):
+        if not self.token:
+            raise ValueError("Elemen kosong")
+        hasil = self._jumlah()
+        if self.i != len(self.token):
+            raise ValueError(f"Ekspresi tidak valid: '{self.teks}'")
+        return hasil
+
+    def _jumlah(self):
+        hasil = self._suku()
+        while self._lihat() in (('op', '+'), ('op', '-')):
+            _, op = self._ambil()
+            suku = self._suku()
+            hasil = hasil + suku if op == '+' else hasil - suku
+        return hasil
+
+    def _suku(self):
+        hasil = self._tanda()
+        while True:
+            jenis, nilai = self._lihat()
+            if (jenis, nilai) == ('op', '*'):
+                self._ambil()
+                hasil = hasil * self._tanda()
+                _cek_derajat(hasil.degree(), f"'{self.teks}'")
+            elif (jenis, nilai) == ('op', '/'):
+                self._ambil()
+                pembagi = self._tanda()
+                if pembagi.degree() > 0 or pembagi.is_zero:
+                    raise ValueError(f"Hanya boleh dibagi konstanta tak nol: '{self.teks}'")
+                hasil = hasil * (1 / pembagi.LC())
+            elif jenis in ('angka', 'nama') or (jenis, nilai) == ('op', '('):
+                # Perkalian implisit: "2k", "3(k + 1)"
+                hasil = hasil * self._pangkat()
+                _cek_derajat(hasil.degree(), f"'{self.teks}'")
+            else:
+                return hasil
+
+    def _tanda(self):
+        if self._lihat() in (('op', '+'), ('op', '-')):
+            _, op = self._ambil()
+            nilai = self._tanda()
+            return -nilai if op == '-' else nilai
+        return self._pangkat()
+
+    def _pangkat(self):
+        basis = self._atom()
+        if self._lihat() in (('op', '^'), ('op', '**')):
+            self._ambil()
+            jenis, nilai = self._ambil()
+            if jenis != 'angka' or not nilai.isdigit() or int(nilai) > MAX_PANGKAT:
+                raise ValueError(f"Pangkat harus bilangan bulat 0..{MAX_PANGKAT}: '{self.teks}'")
+            # Derajat diperiksa sebelum memangkatkan, misal (k^32)^32
+            _cek_derajat(max(basis.degree(), 0) * int(nilai), f"'{self.teks}'")
+            basis = basis ** int(nilai)
+        return basis
+
+    def _atom(self):
+        jenis, nilai = self._ambil()
+        if jenis == 'angka':
+            return self._poly(sp.Rational(nilai))
+        if jenis == 'nama':
+            if nilai != self.simbol.name:
+                raise ValueError(f"Nama tidak dikenal '{nilai}' (parameter: '{self.simbol.name}')")
+            return self._poly(self.simbol)
+        if (jenis, nilai) == ('op', '('):
+            hasil = self._jumlah()
+            if self._ambil() != ('op', ')'):
+                raise ValueError(f"Kurung tidak seimbang: '{self.teks}'")
+            return hasil
+        raise ValueError(f"Ekspresi tidak valid: '{self.teks}'")
+
+
+def urai_matriks(matrix, parameter='k'):
+    """Augmented matrix of numbers / strings -> rows of Poly over QQ in the parameter"""
+    if not re.fullmatch(r"[A-Za-z_]\w*", parameter or ''):
+        raise ValueError("Nama parameter tidak valid")
+    simbol = sp.Symbol(parameter)
+    rows = [list(row) for row in matrix]
+    if not rows or len(rows[0]) < 2 or any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError("Matriks augmented harus persegi panjang dengan minimal 2 kolom")
+    hasil = []
+    for row in rows:
+        baris = []
+        for x in row:
+            if type(x) is int:
+                nilai = sp.Integer(x)
+            elif type(x) is float:
+                # Desimal dibaca seperti yang ditulis (0.1 -> 1/10)
+                nilai = sp.Rational(repr(x))
+            elif isinstance(x, Fraction):
+                nilai = sp.Rational(x.numerator, x.denominator)
+            elif isinstance(x, str):
+                baris.append(_Pengurai(x, simbol).urai())
+                continue
+            else:
+                raise ValueError("Elemen harus angka atau ekspresi dalam parameter")
+            baris.append(sp.Poly(nilai, simbol, domain=sp.QQ))
+        hasil.append(baris)
+    return simbol, hasil
+
+
+def eliminasi_parametrik(rows):
+    """
+    Fraction-free echelon form over Q[k] (Bareiss). Pivots are searched in the
+    coefficient columns only, the lowest-degree non-zero entry first.
+    Returns (echelon rows, [(row, col)] pivots).
+    """
+    rows = [list(row) for row in rows]
+    m, n = len(rows), len(rows[0])
+    num_vars = n - 1
+    sebelumnya = None
+    pivots = []
+    r = 0
+    for c in range(num_vars):
+        if r >= m:
+            break
+        kandidat = [i for i in range(r, m) if not rows[i][c].is_zero]
+        if not kandidat:
+            continue
+        p = min(kandidat, key=lambda i: (rows[i][c].degree(), i))
+        rows[r], rows[p] = rows[p], rows[r]
+        pivot = rows[r][c]
+        for i in range(r + 1, m):
+            a = rows[i][c]
+            baru = rows[i][:c]
+            for j in range(c, n):
+                nilai = pivot * rows[i][j] - a * rows[r][j]
+                nilai = nilai if sebelumnya is None else nilai.exquo(sebelumnya)
+                _cek_derajat(nilai.degree(), f"eliminasi baris {i + 1}, kolom {j + 1}")
+                baru.append(nilai)
+            rows[i] = baru
+        pivots.append((r, c))
+        sebelumnya = pivot
+        r += 1
+    return rows, pivots
+
+
+def _klasifikasi(rank, num_vars, inkonsisten, pivot_cols):
+    if inkonsisten:
+        jenis = 'tidak ada'
+    elif rank < num_vars:
+        jenis = 'tak hingga'
+    else:
+        jenis = 'unik'
+    return {
+        'jenis': jenis,
+        'rank': rank,
+        'free_variables': [] if inkonsisten else [j + 1 for j in range(num_vars) if j not in pivot_cols],
+    }
+
+
+def klasifikasi_modulo(rows, f):
+    """Classification of the system with k a root of the irreducible f, i.e. over Q[k]/(f)"""
+    M = [[x.rem(f) for x in row] for row in rows]
+    m, n = len(M), len(M[0])
+    num_vars = n - 1
+    pivot_cols = []
+    r = 0
+    for c in range(n):
+        if r >= m:
+            break
+        p = next((i for i in range(r, m) if not M[i][c].is_zero), None)
+        if p is None:
+            continue
+        M[r], M[p] = M[p], M[r]
+        invers = M[r][c].invert(f)
+        M[r] = [(x * invers).rem(f) for x in M[r]]
+        for i in range(r + 1, m):
+            a = M[i][c]
+            if not a.is_zero:
+                M[i] = [(x - a * y).rem(f) for x, y in zip(M[i], M[r])]
+        pivot_cols.append(c)
+        r += 1
+    inkonsisten = num_vars in pivot_cols
+    return _klasifikasi(r - inkonsisten, num_vars, inkonsisten, pivot_cols)
+
+
+def _faktor_kritis(polinomial):
+    """Distinct monic irreducible factors that have at least one real root"""
+    faktor = {}
+    for p in polinomial:
+        if p.degree() < 1:
+            continue
+        for f, _ in p.factor_list()[1]:
+            f = f.monic()
+            if f.count_roots() > 0:
+                faktor.setdefault(tuple(f.all_coeffs()), f)
+    return list(faktor.values())
+
+
+def _teks(nilai):
+    return str(nilai).replace('**', '^')
+
+
+def analisis_parametrik(matrix, parameter='k'):
+    """
+    Eliminate once over Q[parameter] and classify every region of the real line.
+    Returns a dict with the generic classification (and the generic solution as
+    rational functions when it is unique), the critical values and the regions.
+    """
+    simbol, asli = urai_matriks(matrix, parameter)
+    num_vars = len(asli[0]) - 1
+    rows, pivots = eliminasi_parametrik(asli)
+    pivot_cols = [c for _, c in pivots]
+    rank = len(pivots)
+
+    # Sisa ruas kanan pada baris nol A: sistem konsisten hanya di akar FPB-nya
+    sisa = [rows[i][num_vars] for i in range(rank, len(rows)) if not rows[i][num_vars].is_zero]
+    generik = _klasifikasi(rank, num_vars, bool(sisa), pivot_cols)
+
+    generik['solution'] = None
+    if generik['jenis'] == 'unik':
+        x = [None] * num_vars
+        for i, c in reversed(pivots):
+            s = rows[i][num_vars].as_expr() - sum(rows[i][j].as_expr() * x[j] for j in range(c + 1, num_vars))
+            x[c] = sp.factor(sp.cancel(s / rows[i][c].as_expr()))
+        generik['solution'] = [_teks(nilai) for nilai in x]
+
+    calon = [rows[i][c] for i, c in pivots]
+    if sisa:
+        fpb = sisa[0]
+        for q in sisa[1:]:
+            fpb = fpb.gcd(q)
+        calon.append(fpb)
+
+    kritis = []
+    for f in _faktor_kritis(calon):
+        hasil = klasifikasi_modulo(asli, f)
+        if hasil['jenis'] == generik['jenis'] and hasil['rank'] == generik['rank']:
+            continue
+        for akar in f.real_roots():
+            approx = float(akar.evalf())
+            # Akar tanpa bentuk radikal ditampilkan sebagai hampiran; polinomialnya eksak
+            value = f"≈{approx:.6g}" if isinstance(akar, sp.CRootOf) else _teks(akar)
+            kritis.append(dict(hasil, value=value, approx=approx, polynomial=_teks(f.as_expr())))
+    kritis.sort(key=lambda item: item['approx'])
+
+    nama = simbol.name
+    regions = []
+    kiri = '-oo'
+    for item in kritis:
+        regions.append(dict(generik, region=f"({kiri}, {item['value']})"))
+        regions.append(dict(item, region=f"{nama} = {item['value']}"))
+        kiri = item['value']
+    regions.append(dict(generik, region=f"({kiri}, oo)"))
+    for region in regions:
+        region.pop('solution', None)
+        region.pop('value', None)
+        region.pop('approx', None)
+        region.pop('polynomial', None)
+
+    return {
+        'parameter': nama,
+        'generic': generik,
+        'critical_values': kritis,
+        'regions': regions,
+        'echelon': [[_teks(x.as_expr()) for x in row] for row in rows],
+    }
+
+
+_JUDUL = {
+    'unik': "Solusi unik (tunggal)",
+    'tak hingga': "Solusi tak hingga banyak",
+    'tidak ada': "Tidak ada solusi",
+}
+
+
+def _uraian(item):
+    teks = _JUDUL[item['jenis']] + f" (rank {item['rank']})"
+    if item['jenis'] == 'tak hingga':
+        teks += ", variabel bebas: " + ", ".join(f"x{j}" for j in item['free_variables'])
+    return teks + "."
+
+
+def format_parametrik(hasil):
+    """Explanation text in the same register as analisis_solusi"""
+    nama = hasil['parameter']
+    generik = hasil['generic']
+    kritis = hasil['critical_values']
+    if kritis:
+        nilai = ", ".join(item['value'] for item in kritis)
+        baris = [f"Untuk semua {nama} kecuali {nilai}: {_uraian(generik)}"]
+    else:
+        baris = [f"Untuk semua {nama}: {_uraian(generik)}"]
+    if generik['solution'] is not None:
+        baris += [f"x{j+1} = {x}" for j, x in enumerate(generik['solution'])]
+    for item in kritis:
+        baris.append(f"{nama} = {item['value']}: {_uraian(item)}")
+    return "\n".join(baris)
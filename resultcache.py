@@ -0,0 +1,188 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from math import gcd
+
+# Cache hasil /calculate berbasis isi: kunci = hash kanonik dari (elemen matriks,
+# ukuran, operasi, opsi), nilai = payload JSON yang sudah jadi (bytes).
+
+
+def _canon_entry(x):
+    """Tag each entry with its type: 2, 2.0 and "2" are displayed differently"""
+    t = type(x)
+    if t is int:
+        return ['i', str(x)]
+    if t is float:
+        return ['f', x.hex()]
+    if t is str:
+        return ['s', x]
+    return ['r', repr(x)]
+
+
+def _normalize_int_row(row):
+    """Divide an integer row by its content and make the first nonzero positive"""
+    g = gcd(*row)
+    if g == 0:
+        return row
+    first = next(x for x in row if x != 0)
+    if first < 0:
+        g = -g
+    return [x // g for x in row]
+
+
+def cache_key(matrix, operation, normalize_rows=False, **options):
+    """
+    Canonical SHA-256 key for (matrix entries, shape, operation, options).
+    normalize_rows maps row-scaled integer duplicates to the same key; only
+    use it when the cached payload does not depend on row scaling (RREF
+    without steps). It applies only when the whole matrix is integer: with
+    float entries the result goes through a rounding engine and may differ.
+    A NumPy array is keyed by its dtype and raw data.
+    """
+    if hasattr(matrix, 'dtype'):
+        # Array NumPy (input biner): data mentah + dtype, tanpa normalisasi baris
+        rows = [matrix.dtype.str, hashlib.sha256(matrix.tobytes()).hexdigest()]
+        canon = json.dumps([operation, list(matrix.shape), rows, sorted(options.items())],
+                           separators=(',', ':'))
+        return hashlib.sha256(canon.encode('utf-8')).hexdigest()
+    normalize_rows = normalize_rows and all(type(x) is int for row in matrix for x in row)
+    rows = []
+    for row in matrix:
+        if normalize_rows:
+            row = _normalize_int_row(list(row))
+        rows.append([_canon_entry(x) for x in row])
+    shape = [len(matrix), len(matrix[0]) if len(matrix) else 0]
+    canon = json.dumps([operation, shape, rows, sorted(options.items())],
+                       separators=(',', ':'))
+    return hashlib.sha256(canon.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of finished JSON payloads, limited both by number of
+    entries and by total payload bytes
+    """
+
+    def __init__(self, max_entries=256, max_bytes=8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            payload = self._data.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, key, payload):
+        size = len(payload)
+        # Payload yang lebih besar dari seluruh anggaran tidak disimpan
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._data[key] = payload
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._data),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+class FactorCache:
+    """
+    LRU cache of live objects (e.g. LU factorizations) whose entries also
+    expire ttl seconds after they were last stored or used
+    """
+
+    def __init__(self, max_entries=64, ttl=600.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expire(self, now):
+        # Entri terlama ada di depan karena setiap akses memindahkannya ke belakang
+        while self._data:
+            key, (deadline, _) = next(iter(self._data.items()))
+            if deadline > now:
+                break
+            del self._data[key]
+            self.expirations += 1
+
+    def get(self, key):
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data[key] = (now + self.ttl, entry[1])
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            self._data.pop(key, None)
+            self._data[key] = (now + self.ttl, value)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            self._expire(self.clock())
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'entries': len(self._data),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+            }
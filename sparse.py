@@ -0,0 +1,239 @@
+import heapq
+from fractions import Fraction
+
+from eliminasi import format_klasifikasi
+
+# Eliminasi untuk matriks augmented yang sebagian besar nol (model jaringan/rangkaian).
+# Setiap baris disimpan sebagai dict {kolom: nilai} tanpa elemen nol, dan pivot dipilih
+# dengan aturan Markowitz: pasangan (baris, kolom) dengan (r - 1) * (c - 1) terkecil,
+# r/c = jumlah elemen tak nol di baris/kolom aktif, agar fill-in sesedikit mungkin.
+# Input bilangan bulat dihitung eksak (Fraction), selain itu float dengan toleransi 1e-10.
+
+TOL = 1e-10
+# Ambang pivot float: |pivot| >= THRESHOLD * maks |kolom aktif| (stabilitas numerik)
+THRESHOLD = 0.1
+# Jumlah baris/kolom dengan elemen paling sedikit yang diperiksa per pivot
+SEARCH = 4
+
+
+def from_coo(shape, entries):
+    """
+    Build sparse rows from coordinate triples [row, col, value].
+    Duplicate coordinates are summed, zeros are dropped.
+    """
+    m, n = (int(x) for x in shape)
+    if m <= 0 or n <= 0:
+        raise ValueError("Ukuran matriks sparse tidak valid")
+    rows = [{} for _ in range(m)]
+    for entry in entries:
+        i, j, value = entry
+        if type(i) is not int or type(j) is not int or not (0 <= i < m and 0 <= j < n):
+            raise ValueError(f"Indeks di luar ukuran matriks: ({i}, {j})")
+        if type(value) not in (int, float):
+            raise ValueError(f"Nilai tidak valid pada ({i}, {j})")
+        rows[i][j] = rows[i].get(j, 0) + value
+    for row in rows:
+        for j in [j for j, v in row.items() if v == 0]:
+            del row[j]
+    return rows
+
+
+def to_dense(rows, num_cols):
+    return [[row.get(j, 0) for j in range(num_cols)] for row in rows]
+
+
+def is_exact(rows):
+    return all(type(v) is int for row in rows for v in row.values())
+
+
+class _Counts:
+    """
+    Nonzero counts of the active rows and coefficient columns, with lazy
+    min-heaps so the sparsest candidates are found without a full scan
+    """
+
+    def __init__(self, rows, col_rows, num_vars):
+        self.row = [sum(1 for j in row if j < num_vars) for row in rows]
+        self.col_rows = col_rows
+        self.row_heap = [(c, i) for i, c in enumerate(self.row) if c]
+        self.col_heap = [(len(r), j) for j, r in enumerate(col_rows) if r]
+        heapq.heapify(self.row_heap)
+        heapq.heapify(self.col_heap)
+        self.active = set(range(len(rows)))
+
+    def row_changed(self, i, delta):
+        self.row[i] += delta
+        if self.row[i]:
+            heapq.heappush(self.row_heap, (self.row[i], i))
+
+    def col_changed(self, j):
+        if self.col_rows[j]:
+            heapq.heappush(self.col_heap, (len(self.col_rows[j]), j))
+
+    @staticmethod
+    def _smallest(heap, valid):
+        """Pop up to SEARCH current entries, drop stale ones, push the found back"""
+        found = []
+        while heap and len(found) < SEARCH:
+            entry = heapq.heappop(heap)
+            if valid(*entry) and entry not in found:
+                found.append(entry)
+        for entry in found:
+            heapq.heappush(heap, entry)
+        return [k for _, k in found]
+
+    def sparsest_rows(self):
+        return self._smallest(self.row_heap, lambda c, i: i in self.active and self.row[i] == c)
+
+    def sparsest_cols(self):
+        return self._smallest(self.col_heap, lambda c, j: len(self.col_rows[j]) == c)
+
+
+def _choose_pivot(rows, counts, num_vars, exact):
+    """Markowitz search over the sparsest active rows and columns"""
+    col_rows = counts.col_rows
+    pasangan = {(i, j) for i in counts.sparsest_rows() for j in rows[i] if j < num_vars}
+    pasangan.update((i, j) for j in counts.sparsest_cols() for i in col_rows[j])
+
+    best, best_key = None, None
+    col_max = {}
+    for i, j in pasangan:
+        value = rows[i][j]
+        if not exact:
+            if j not in col_max:
+                col_max[j] = max(abs(rows[k][j]) for k in col_rows[j])
+            if abs(value) < THRESHOLD * col_max[j]:
+                continue
+        cost = (counts.row[i] - 1) * (len(col_rows[j]) - 1)
+        # Seri: utamakan pivot yang lebih besar, lalu indeks terkecil (deterministik)
+        key = (cost, -abs(value), i, j)
+        if best_key is None or key < best_key:
+            best, best_key = (i, j), key
+    return best
+
+
+def eliminasi_sparse(rows, num_cols):
+    """
+    Forward elimination with Markowitz pivoting on a sparse augmented matrix.
+    rows is modified in place. Returns (pivots, stats): pivots is the list of
+    (row, col) in elimination order, every later pivot row has zeros in the
+    earlier pivot columns; rows that never got a pivot have zero coefficients.
+    """
+    exact = is_exact(rows)
+    if exact:
+        for row in rows:
+            for j in row:
+                row[j] = Fraction(row[j])
+    num_vars = num_cols - 1
+    nnz_awal = sum(len(row) for row in rows)
+
+    # Baris aktif yang punya elemen tak nol di tiap kolom koefisien
+    col_rows = [set() for _ in range(num_vars)]
+    for i, row in enumerate(rows):
+        for j in row:
+            if j < num_vars:
+                col_rows[j].add(i)
+
+    counts = _Counts(rows, col_rows, num_vars)
+    pivots = []
+    fill_in = 0
+    while True:
+        pivot = _choose_pivot(rows, counts, num_vars, exact)
+        if pivot is None:
+            break
+        p, c = pivot
+        counts.active.discard(p)
+        pivot_row = rows[p]
+        berubah = set()
+        for j in pivot_row:
+            if j < num_vars:
+                col_rows[j].discard(p)
+                berubah.add(j)
+
+        for i in list(col_rows[c]):
+            row = rows[i]
+            faktor = row[c] / pivot_row[c]
+            delta = 0
+            for j, v in pivot_row.items():
+                ada = j in row
+                baru = row[j] - faktor * v if ada else -faktor * v
+                if j == c or baru == 0 or (not exact and abs(baru) < TOL):
+                    if ada:
+                        del row[j]
+                        if j < num_vars:
+                            col_rows[j].discard(i)
+                            delta -= 1
+                else:
+                    row[j] = baru
+                    if not ada:
+                        fill_in += 1
+                        if j < num_vars:
+                            col_rows[j].add(i)
+                            delta += 1
+            counts.row_changed(i, delta)
+        for j in berubah:
+            counts.col_changed(j)
+        pivots.append((p, c))
+
+    stats = {
+        'nnz_before': nnz_awal,
+        'nnz_after': sum(len(row) for row in rows),
+        'fill_in': fill_in,
+        'pivots': len(pivots),
+    }
+    return pivots, stats
+
+
+def klasifikasi_sparse(rows, num_cols):
+    """
+    Classify the sparse system; returns (classification, fill-in stats) with the
+    classification keys of eliminasi.klasifikasi_solusi that apply to an
+    elimination (no condition or residual). rows is modified in place.
+    """
+    exact = is_exact(rows)
+    pivots, stats = eliminasi_sparse(rows, num_cols)
+    num_vars = num_cols - 1
+    pivot_rows = {p for p, _ in pivots}
+    pivot_cols = {c for _, c in pivots}
+    rank = len(pivots)
+    hasil = {
+        'jenis': 'unik',
+        'rank': rank,
+        'num_vars': num_vars,
+        'free_variables': [j + 1 for j in range(num_vars) if j not in pivot_cols],
+        'solution': None,
+        'exact': exact,
+    }
+
+    # Cek inkonsistensi: baris tanpa pivot hanya tersisa konstanta
+    for i, row in enumerate(rows):
+        if i not in pivot_rows and num_vars in row and abs(row[num_vars]) > TOL:
+            hasil.update(jenis='tidak ada', inconsistent_row=i + 1,
+                         inconsistent_value=float(row[num_vars]))
+            return hasil, stats
+
+    if rank < num_vars:
+        hasil['jenis'] = 'tak hingga'
+        return hasil, stats
+
+    # Substitusi mundur dalam urutan pivot terbalik
+    x = [0] * num_vars
+    for p, c in reversed(pivots):
+        row = rows[p]
+        total = row.get(num_vars, 0)
+        for j, v in row.items():
+            if j < num_vars and j != c:
+                total -= v * x[j]
+        x[c] = total / row[c]
+    hasil['solution'] = [float(value) for value in x]
+    return hasil, stats
+
+
+def analisis_sparse(rows, num_cols):
+    """
+    Classify the sparse system with the same wording as /calculate
+    (eliminasi.format_klasifikasi). Returns (explanation, fill-in stats);
+    rows is modified in place.
+    """
+    hasil, stats = klasifikasi_sparse(rows, num_cols)
+    return format_klasifikasi(hasil), stats
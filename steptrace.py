@@ -0,0 +1,144 @@
+from collections import namedtuple
+
+# Jejak langkah eliminasi yang ringkas: matriks awal + daftar operasi baris.
+# Setiap operasi hanya menyimpan baris yang berubah. Baris yang sudah disimpan
+# tidak pernah diubah lagi, jadi keadaan matriks (checkpoint) cukup berupa list
+# referensi baris, dan matriks lengkap di langkah mana pun dibangun ulang saat diminta.
+
+RowOp = namedtuple("RowOp", ["kind", "desc", "target", "source", "row"])
+# kind:
+#   'swap'  - tukar baris target dan source, row = None
+#   'scale' - baris target diganti row (R_i = R_i / pivot)
+#   'axpy'  - baris target diganti row (R_i = R_i - k*R_j), source = j
+#   'set'   - beberapa baris diganti sekaligus, row = {indeks: baris}
+
+
+def apply_op(rows, op):
+    """Apply one RowOp in place to a list of rows"""
+    if op.kind == 'swap':
+        rows[op.target], rows[op.source] = rows[op.source], rows[op.target]
+    elif op.kind == 'set':
+        for i, row in op.row.items():
+            rows[i] = row
+    else:
+        rows[op.target] = op.row
+
+
+def _copy_rows(rows):
+    return [row.copy() for row in rows]
+
+
+def _as_lists(rows):
+    return [list(row) for row in rows]
+
+
+class StepTrace:
+    """
+    Delta-encoded step list: behaves like a sequence of (description, matrix)
+    but only stores the initial matrix and the rows changed by each operation
+    """
+
+    def __init__(self, initial, initial_desc="Matriks Awal:", build=None, checkpoint_every=32):
+        self.initial = _copy_rows(initial)
+        self.initial_desc = initial_desc
+        self.ops = []
+        self.build = build or _as_lists
+        self.checkpoint_every = checkpoint_every
+        self._current = list(self.initial)
+        self._checkpoints = [list(self.initial)]
+
+    @classmethod
+    def collect(cls, initial, ops, **kwargs):
+        """Build a trace from an iterable of RowOp (e.g. an elimination generator)"""
+        trace = cls(initial, **kwargs)
+        for op in ops:
+            trace.record(op)
+        return trace
+
+    # --- perekaman operasi ---
+
+    def record(self, op):
+        """Append a RowOp; its row(s) must not be modified afterwards"""
+        self.ops.append(op)
+        apply_op(self._current, op)
+        if len(self.ops) % self.checkpoint_every == 0:
+            self._checkpoints.append(list(self._current))
+
+    def swap(self, desc, i, j):
+        self.record(RowOp('swap', desc, i, j, None))
+
+    def scale(self, desc, i, row):
+        self.record(RowOp('scale', desc, i, None, row.copy()))
+
+    def axpy(self, desc, i, j, row):
+        self.record(RowOp('axpy', desc, i, j, row.copy()))
+
+    def set(self, desc, changed_rows):
+        self.record(RowOp('set', desc, None, None,
+                           {i: row.copy() for i, row in changed_rows.items()}))
+
+    # --- pembacaan langkah ---
+
+    def _offset(self):
+        return 1 if self.initial_desc is not None else 0
+
+    def __len__(self):
+        return len(self.ops) + self._offset()
+
+    def _rows_after(self, num_ops):
+        base = num_ops // self.checkpoint_every
+        rows = list(self._checkpoints[base])
+        for op in self.ops[base * self.checkpoint_every:num_ops]:
+            apply_op(rows, op)
+        return rows
+
+    def state(self, num_ops):
+        """Rebuild the matrix after the first num_ops operations"""
+        return self.build(self._rows_after(num_ops))
+
+    def rows_between(self, start, stop=None):
+        """
+        Yield (description, rows) for steps start..stop-1 without building
+        matrices: rows is a list of the shared row objects (do not modify).
+        Only the first step of the range is rebuilt from a checkpoint.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        start = max(start, 0)
+        if start >= stop:
+            return
+        offset = self._offset()
+        rows = self._rows_after(start + 1 - offset)
+        yield self.description(start), list(rows)
+        for index in range(start + 1, stop):
+            apply_op(rows, self.ops[index - offset])
+            yield self.description(index), list(rows)
+
+    def description(self, index):
+        index = self._index(index)
+        if self.initial_desc is not None and index == 0:
+            return self.initial_desc
+        return self.ops[index - self._offset()].desc
+
+    def _index(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("step index out of range")
+        return index
+
+    def __getitem__(self, index):
+        index = self._index(index)
+        num_ops = index + 1 - self._offset()
+        return self.description(index), self.state(num_ops)
+
+    def __iter__(self):
+        rows = list(self.initial)
+        if self.initial_desc is not None:
+            yield self.initial_desc, self.build(rows)
+        for op in self.ops:
+            apply_op(rows, op)
+            yield op.desc, self.build(rows)
+
+    def final(self):
+        """Matrix after the last recorded operation"""
+        return self.build(self._current)
@@ -0,0 +1,33 @@
+import os
+import random
+import sys
+from fractions import Fraction
+
+import pytest
+
+# Perhitungan dijalankan langsung di proses test, tanpa pool pekerja
+os.environ.setdefault('WORKER_PROCESSES', '0')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def sympy_rref(matrix):
+    """Reference RREF from SymPy as (rows of Fraction, pivot columns)"""
+    import sympy as sp
+    R, pivots = sp.Matrix(matrix).rref()
+    return [[Fraction(int(x.p), int(x.q)) for x in R.row(i)] for i in range(R.rows)], tuple(pivots)
+
+
+def random_int_matrix(rng, m, n, lo=-6, hi=6):
+    return [[rng.randint(lo, hi) for _ in range(n)] for _ in range(m)]
+
+
+@pytest.fixture
+def rng():
+    return random.Random(1234)
+
+
+@pytest.fixture
+def client():
+    import app
+    app.result_cache.clear()
+    return app.app.test_client()
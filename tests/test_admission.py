@@ -0,0 +1,141 @@
+import io
+import time
+
+import numpy as np
+import pytest
+
+from admission import (AdmissionController, TooExpensive, entry_degree, estimate,
+                       estimate_parametric, estimate_sparse, estimate_upload)
+from conftest import random_int_matrix
+from workerpool import PoolBusy
+
+
+def test_decide_admit_queue_reject(rng):
+    controller = AdmissionController(max_seconds=10.0, queue_seconds=1.0)
+    kecil = estimate(random_int_matrix(rng, 3, 4), 'rref', True, True)
+    assert controller.decide(kecil).action == 'admit'
+
+    sedang = estimate([[1.5] * 60] * 60, 'rref', False, False)
+    assert 1.0 < sedang.seconds < 10.0
+    assert controller.decide(sedang).action == 'queue'
+
+    besar = estimate([[1.5] * 400] * 400, 'rref', False, False)
+    with pytest.raises(TooExpensive) as info:
+        controller.decide(besar)
+    assert info.value.http_status == 413
+    assert controller.stats()['rejected']['cost'] == 1
+
+
+def test_decide_routes_expensive_steps():
+    controller = AdmissionController(max_seconds=10.0, queue_seconds=1.0)
+    perkiraan = estimate([[1.5] * 60] * 40, 'rref', True, False)
+    assert perkiraan.steps_seconds > 10.0 >= perkiraan.final_seconds
+    keputusan = controller.decide(perkiraan)
+    assert not keputusan.with_steps and keputusan.routed
+    # Langkah wajib (streaming / paged): tidak dialihkan, ditolak
+    with pytest.raises(TooExpensive):
+        controller.decide(perkiraan, steps_required=True)
+
+
+def test_decide_rejects_digit_limit():
+    controller = AdmissionController(max_seconds=1e9)
+    with pytest.raises(TooExpensive, match="digit"):
+        controller.decide(estimate([[10 ** 60] * 200] * 200, 'rref', False, True))
+    assert controller.stats()['rejected']['digits'] == 1
+
+
+def test_sparse_estimate_uses_band():
+    m = 10000
+    tri = [[i, i, 4] for i in range(m)] + [[i, i + 1, -1] for i in range(m - 1)] + \
+          [[i + 1, i, -1] for i in range(m - 1)] + [[i, m, 1.0] for i in range(m)]
+    assert estimate_sparse([m, m + 1], tri).seconds < 1.0
+    acak = [[i, (7 * i) % m, 1.5] for i in range(m)]
+    assert estimate_sparse([m, m + 1], acak).seconds > 100.0
+
+
+def test_sparse_estimate_is_cheap_for_huge_shape():
+    mulai = time.perf_counter()
+    perkiraan = estimate_sparse([10 ** 9, 2], [])
+    assert time.perf_counter() - mulai < 0.1
+    with pytest.raises(TooExpensive):
+        AdmissionController(max_seconds=30.0).decide(perkiraan)
+
+
+@pytest.mark.parametrize("teks, derajat", [
+    ("2k + 1", 1), ("k^2 - k", 4), ("(k^2)^3", 6), ("3", 0), ("x", 0), ("k^40", 32),
+])
+def test_entry_degree_bounds(teks, derajat):
+    assert entry_degree(teks, 'k') == derajat
+
+
+def test_parametric_estimate_grows_with_degree():
+    kecil = estimate_parametric([['k', 1, 1], [1, 'k', 1]], 'k')
+    besar = estimate_parametric([['k^8'] * 13] * 12, 'k')
+    assert kecil.seconds < 0.1 < besar.seconds
+
+
+def test_upload_estimate():
+    assert estimate_upload(500, 501).seconds < 1.0
+    assert estimate_upload(20000, 20001).seconds > 100.0
+
+
+def test_calculate_rejects_huge_sparse_shape(client):
+    response = client.post('/calculate', json={'operation': 'rref',
+                                               'sparse': {'shape': [10 ** 9, 2], 'entries': []}})
+    assert response.status_code == 413
+    assert response.get_json()['error'] == 'too_expensive'
+
+
+def test_calculate_rejects_expensive_parametric(client, monkeypatch):
+    import app
+    monkeypatch.setattr(app.admission, 'max_seconds', 0.01)
+    response = client.post('/calculate', json={'operation': 'parametric',
+                                               'matrix': [['k^8'] * 13] * 12})
+    assert response.status_code == 413
+
+
+def test_session_and_batch_are_estimated(client, monkeypatch):
+    import app
+    monkeypatch.setattr(app.admission, 'max_seconds', 0.01)
+    besar = [[2 * i + j + 1 for j in range(61)] for i in range(60)]
+    assert client.post('/session', json={'matrix': besar}).status_code == 413
+    response = client.post('/calculate-batch', json={'operation': 'rref', 'matrices': [[[1, 2, 3]], besar]})
+    hasil = response.get_json()['results']
+    assert hasil[0]['status'] == 'success'
+    assert hasil[1]['error'] == 'too_expensive'
+
+
+def test_upload_size_limit(client, monkeypatch):
+    import app
+    monkeypatch.setattr(app, 'UPLOAD_MAX_BYTES', 64)
+    buffer = io.BytesIO()
+    np.save(buffer, np.ones((4, 5)))
+    response = client.post('/upload', data=buffer.getvalue(), content_type='application/octet-stream')
+    assert response.status_code == 413
+    assert response.get_json()['error'] == 'too_expensive'
+
+
+def test_upload_within_estimate(client):
+    buffer = io.BytesIO()
+    np.save(buffer, np.array([[2.0, 1.0, 3.0], [1.0, 3.0, 4.0]]))
+    response = client.post('/upload', data=buffer.getvalue(), content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert response.get_json()['classification']['jenis'] == 'unik'
+
+
+def test_queue_rejections_counted_once():
+    controller = AdmissionController(max_seconds=10.0, queue_seconds=1.0, slots=1, max_waiting=1,
+                                     queue_timeout=0.05)
+    sedang = estimate([[1.5] * 60] * 60, 'rref', False, False)
+    with controller.slot(controller.decide(sedang)):
+        with pytest.raises(PoolBusy):
+            with controller.slot(controller.decide(sedang)):
+                pass
+        controller.max_waiting = 0
+        with pytest.raises(PoolBusy):
+            with controller.slot(controller.decide(sedang)):
+                pass
+    stats = controller.stats()
+    # Setiap permintaan tepat satu keputusan: yang ditolak dari antrean pindah dari 'queue' ke 'reject'
+    assert stats['decisions'] == {'admit': 0, 'queue': 1, 'reject': 2}
+    assert (stats['rejected']['queue_timeout'], stats['rejected']['queue_full']) == (1, 1)
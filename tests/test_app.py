@@ -0,0 +1,214 @@
+import json
+import re
+
+import pytest
+
+import app
+import metrics
+from conftest import random_int_matrix
+
+
+def _rref_sympy(matrix):
+    R, _ = app.sp.Matrix(matrix).rref()
+    return app.format_matrix(R), app.analisis_rref(R)
+
+
+@pytest.mark.parametrize("matrix", [
+    [['a', 1, 2], [1, 'b', 3]],
+    [['sqrt(2)', 1, 1], [1, 1, 2]],
+    [[1, 2, '1/3'], [0.5, 1, 2]],
+])
+def test_rref_symbolic_and_mixed_input(client, matrix):
+    response = client.post('/calculate', json={'matrix': matrix, 'operation': 'rref', 'steps': False})
+    data = response.get_json()
+    assert data['status'] == 'success'
+    assert (data['final_matrix'], data['explanation']) == _rref_sympy(matrix)
+
+
+def test_rref_float_matches_sympy(rng):
+    for _ in range(200):
+        m, n = rng.randint(1, 5), rng.randint(2, 6)
+        A = [[x if rng.random() < 0.4 else x + rng.choice([0.0, 0.25, 0.1, 1e-7]) for x in row]
+             for row in random_int_matrix(rng, m, n)]
+        if m > 1 and rng.random() < 0.3:
+            A[-1] = [2 * x for x in A[0]]
+        R, pivots = app.rref_float(A)
+        expected, expected_pivots = app.sp.Matrix(A).rref()
+        assert pivots == expected_pivots
+        assert app.format_matrix(R) == app.format_matrix(expected)
+
+
+def _calculate(client, matrix, operation):
+    import app
+    app.result_cache.clear()
+    return client.post('/calculate', json={'matrix': matrix, 'operation': operation, 'steps': False}).get_json()
+
+
+@pytest.mark.parametrize("operation", ['rref', 'ref', 'ref-leading-one', 'gauss-jordan'])
+def test_batch_matches_calculate(client, rng, operation):
+    matrices = [
+        [[1.5, 2, 3], [4, 5, 6.5]],
+        [[1.5, 2.0, 3.0], [4.0, 5.0, 6.5]],
+        [[0.0, 2.0, 1.0], [3.0, 0.0, 0.0]],
+        [[0.0, 9.0, 3.0, -4.0]],
+        [[2.0, 4.0, 6.0], [1.0, 2.0, 3.0], [0.5, 0.0, 1.25]],
+        [[1e200, 1.0, 2.0], [3.0, 1e200, 1.0]],
+    ]
+    for _ in range(30):
+        m, n = rng.randint(1, 5), rng.randint(2, 6)
+        matrices.append([[rng.choice([0.0, 1.0, float(rng.randint(-4, 4)), round(rng.uniform(-9, 9), 2)])
+                          for _ in range(n)] for _ in range(m)])
+    response = client.post('/calculate-batch', json={'matrices': matrices, 'operation': operation})
+    for matrix, hasil in zip(matrices, response.get_json()['results']):
+        assert hasil == _calculate(client, matrix, operation)
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def _sse(response):
+    events = []
+    for blok in response.get_data(as_text=True).strip().split('\n\n'):
+        nama, data = blok.split('\n')
+        assert nama.startswith('event: ') and data.startswith('data: ')
+        events.append(json.loads(data[len('data: '):]))
+        assert events[-1]['event'] == nama[len('event: '):]
+    return events
+
+
+@pytest.mark.parametrize("mode, parse", [('ndjson', _ndjson), ('sse', _sse)])
+@pytest.mark.parametrize("operation", ['rref', 'ref', 'ref-leading-one', 'gauss-jordan'])
+@pytest.mark.parametrize("matrix", [[[2, 1, 3], [1, 3, 4]], [[1.5, 2, 3], [4, 5, 6.5]], [[0, 1, 2], [0, 2, 4]]])
+def test_stream_matches_calculate(client, mode, parse, operation, matrix):
+    response = client.post('/calculate', json={'matrix': matrix, 'operation': operation, 'stream': mode})
+    assert response.mimetype == app.STREAM_MIMETYPES[mode]
+    events = parse(response)
+    # start, langkah berurutan, lalu result sebagai event terakhir
+    assert [e['event'] for e in events] == ['start'] + ['step'] * (len(events) - 2) + ['result']
+    assert [e['index'] for e in events[1:-1]] == list(range(len(events) - 2))
+    assert (events[0]['rows'], events[0]['cols']) == (len(matrix), len(matrix[0]))
+
+    expected = client.post('/calculate', json={'matrix': matrix, 'operation': operation}).get_json()
+    assert [[e['description'], e['matrix']] for e in events[1:-1]] == expected['steps']
+    assert events[-1]['status'] == 'success'
+    assert (events[-1]['final_matrix'], events[-1]['explanation']) == (expected['final_matrix'],
+                                                                       expected['explanation'])
+
+
+def test_stream_accept_header(client):
+    response = client.post('/calculate', json={'matrix': [[2, 1, 3], [1, 3, 4]], 'operation': 'rref'},
+                           headers={'Accept': 'application/x-ndjson'})
+    assert response.mimetype == 'application/x-ndjson'
+    assert _ndjson(response)[-1]['event'] == 'result'
+
+
+@pytest.mark.parametrize("mode, parse", [('ndjson', _ndjson), ('sse', _sse)])
+def test_stream_error_events(client, mode, parse):
+    # Input yang tidak bisa diparse: error sebelum event start
+    events = parse(client.post('/calculate', json={'matrix': [['1+', 2, 3]], 'operation': 'rref',
+                                                   'stream': mode}))
+    assert [e['event'] for e in events] == ['error']
+    assert events[0]['status'] == 'error' and 'could not parse' in events[0]['message']
+
+    # Pivot 0.0 (Float SymPy tidak sama dengan 0): error setelah langkah pertama, tanpa result
+    events = parse(client.post('/calculate', json={'matrix': [[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]],
+                                                   'operation': 'gauss-jordan', 'stream': mode}))
+    assert [e['event'] for e in events] == ['start', 'step', 'error']
+    assert events[-1]['status'] == 'error'
+
+
+PAGED = [[2, 1, -1, 8], [-3, -1, 2, -11], [-2, 1, 2, -3]]
+
+
+def _paged(client, matrix=PAGED, operation='gauss-jordan'):
+    app.step_store.clear()
+    data = client.post('/calculate', json={'matrix': matrix, 'operation': operation, 'paged': True}).get_json()
+    assert data['status'] == 'success' and data['steps'] == []
+    return data
+
+
+def test_paged_steps_match_calculate(client):
+    data = _paged(client)
+    expected = client.post('/calculate', json={'matrix': PAGED, 'operation': 'gauss-jordan'}).get_json()
+    assert data['step_count'] == len(expected['steps']) > 5
+    assert data['final_matrix'] == expected['final_matrix']
+
+    halaman = []
+    for offset in range(0, data['step_count'], 4):
+        page = client.get(f"/steps/{data['result_id']}?offset={offset}&limit=4").get_json()
+        assert (page['offset'], page['limit'], page['step_count']) == (offset, 4, data['step_count'])
+        halaman += page['steps']
+    assert halaman == expected['steps']
+
+
+def test_paged_steps_boundaries(client):
+    data = _paged(client)
+    url, n = f"/steps/{data['result_id']}", data['step_count']
+
+    first = client.get(url).get_json()
+    assert (first['offset'], first['limit'], len(first['steps'])) == (0, 20, min(n, 20))
+    last = client.get(f"{url}?offset={n - 1}&limit=3").get_json()
+    assert len(last['steps']) == 1
+    beyond = client.get(f"{url}?offset={n + 5}").get_json()
+    assert (beyond['status'], beyond['steps'], beyond['step_count']) == ('success', [], n)
+    # offset negatif dan limit di luar batas dijepit
+    clamped = client.get(f"{url}?offset=-3&limit=100000").get_json()
+    assert (clamped['offset'], clamped['limit']) == (0, app.STEPS_PAGE_MAX)
+    assert client.get(f"{url}?limit=-1").get_json()['steps'] == []
+
+
+def test_paged_steps_unknown_and_expired(client, monkeypatch):
+    missing = client.get('/steps/tidak-ada').get_json()
+    assert missing['status'] == 'error' and 'kedaluwarsa' in missing['message']
+
+    data = _paged(client)
+    assert client.get(f"/steps/{data['result_id']}").get_json()['status'] == 'success'
+    sekarang = app.step_store.clock()
+    monkeypatch.setattr(app.step_store, 'clock', lambda: sekarang + app.step_store.ttl + 1)
+    assert client.get(f"/steps/{data['result_id']}").get_json()['status'] == 'error'
+
+
+def test_format_steps_slices():
+    trace = app.gauss_jordan_steps([[1.5, 2, 3], [4, 5, 6.5], [1, 0, 2]])
+    semua = app.format_steps(trace)
+    assert len(semua) == len(trace)
+    for start, stop in [(0, 1), (2, 5), (len(semua) - 1, None), (len(semua), None)]:
+        assert app.format_steps(trace, start, stop) == semua[start:stop]
+
+
+def _metric(text, series):
+    """Value of one series line of Prometheus text, 0 when absent"""
+    for line in text.splitlines():
+        if line.startswith(series + ' '):
+            return float(line[len(series) + 1:])
+    return 0.0
+
+
+def test_server_timing_and_metrics(client):
+    matrix = [[2, 1, 3], [1, 3, 4]]
+    labels = f'operation="rref",size="{metrics.size_bucket(2, 3)}"'
+    count = f'matrix_calculate_duration_seconds_count{{{labels}}}'
+    sebelum = _metric(client.get('/metrics').get_data(as_text=True), count)
+
+    tanpa = client.post('/calculate', json={'matrix': matrix, 'operation': 'rref'})
+    assert 'Server-Timing' not in tanpa.headers
+    app.result_cache.clear()
+    response = client.post('/calculate', json={'matrix': matrix, 'operation': 'rref', 'timing': True})
+    header = response.headers['Server-Timing']
+    entries = header.split(', ')
+    assert all(re.fullmatch(r'[a-z]+;dur=\d+\.\d{3}', entry) for entry in entries), header
+    names = [entry.split(';')[0] for entry in entries]
+    assert {'parse', 'admission', 'eliminate', 'format', 'serialize'} <= set(names)
+
+    metrics_response = client.get('/metrics')
+    assert metrics_response.mimetype == 'text/plain'
+    text = metrics_response.get_data(as_text=True)
+    assert _metric(text, count) == sebelum + 2
+    assert '# TYPE matrix_calculate_duration_seconds histogram' in text
+    assert _metric(text, f'matrix_calculate_duration_seconds_bucket{{{labels},le="+Inf"}}') == sebelum + 2
+    for phase in ('parse', 'eliminate'):
+        assert _metric(text, f'matrix_calculate_phase_seconds_count{{phase="{phase}",{labels}}}') >= 1
+    for name in ('matrix_result_cache_hits_total', 'matrix_pool_busy_workers', 'matrix_app_import_seconds'):
+        assert f'# TYPE {name} ' in text
+    assert 'matrix_admission_decisions_total{decision="admit"}' in text
@@ -0,0 +1,103 @@
+from fractions import Fraction
+
+import pytest
+
+import bareiss
+from conftest import random_int_matrix, sympy_rref
+
+
+def test_rref_matches_sympy(rng):
+    for _ in range(60):
+        m, n = rng.randint(1, 6), rng.randint(2, 7)
+        A = random_int_matrix(rng, m, n)
+        if m > 1 and rng.random() < 0.3:
+            A[-1] = [2 * x for x in A[0]]
+        assert bareiss.rref(A) == sympy_rref(A)
+
+
+def test_steps_end_in_rref(rng):
+    for _ in range(20):
+        A = random_int_matrix(rng, rng.randint(1, 5), rng.randint(2, 6))
+        steps = bareiss.gauss_jordan_steps(A)
+        assert steps.final() == bareiss.rref(A)[0]
+
+
+def test_step_descriptions():
+    steps = bareiss.gauss_jordan_steps([[2, 4, 6], [1, 3, 5]])
+    descriptions = [steps.description(i) for i in range(len(steps))]
+    assert descriptions == [
+        "Matriks Awal:",
+        "R1 = R1/2:",
+        "R2 = R2 - 1*R1:",
+        "R1 = R1 - 2*R2:",
+    ]
+    assert steps.final() == [[1, 0, -1], [0, 1, 2]]
+
+
+def test_ref_leading_one():
+    steps, final = bareiss.ref_steps([[0, 2, 4], [3, 3, 3]], leading_one=True)
+    assert final == [[1, 1, 1], [0, 1, 2]]
+    # ref_steps tidak punya langkah "Matriks Awal"
+    assert steps.description(0) == "Tukar baris 1 dan 2:"
+
+
+@pytest.mark.parametrize('matrix, expected', [
+    ([[1, 2], [3, 4]], True),
+    ([[1, 2.0]], False),
+    ([[True, 1]], False),
+    ([[1, 2], [3]], False),
+    ([], False),
+])
+def test_is_integer_matrix(matrix, expected):
+    assert bareiss.is_integer_matrix(matrix) is expected
+
+
+def test_rref_returns_fractions():
+    R, pivots = bareiss.rref([[3, 1, 1], [1, 2, 0]])
+    assert pivots == (0, 1)
+    assert R == [[1, 0, Fraction(2, 5)], [0, 1, Fraction(-1, 5)]]
+
+
+@pytest.mark.parametrize('matrix, expected', [
+    ([[1, Fraction(1, 3)], [2, 4]], True),
+    ([["2/5", "-3"], [1, "7/2"]], True),
+    ([["0.5", 1]], False),
+    ([["k", 1]], False),
+    ([[Fraction(1, 2), 1.5]], False),
+    ([["1/0", 1]], False),
+])
+def test_is_rational_matrix(matrix, expected):
+    assert bareiss.is_rational_matrix(matrix) is expected
+
+
+def _random_rational_matrix(rng, m, n):
+    """Mix of ints, Fractions and fraction strings"""
+    kinds = [
+        lambda: rng.randint(-6, 6),
+        lambda: Fraction(rng.randint(-9, 9), rng.randint(1, 7)),
+        lambda: f"{rng.randint(-9, 9)}/{rng.randint(1, 7)}",
+    ]
+    return [[rng.choice(kinds)() for _ in range(n)] for _ in range(m)]
+
+
+def test_rational_rref_matches_sympy(rng):
+    for _ in range(40):
+        m, n = rng.randint(1, 5), rng.randint(2, 6)
+        A = _random_rational_matrix(rng, m, n)
+        if m > 1 and rng.random() < 0.3:
+            A[-1] = [2 * Fraction(x) for x in A[0]]
+        assert bareiss.rref(A) == sympy_rref([[str(x) for x in row] for row in A])
+        assert bareiss.gauss_jordan_steps(A).final() == bareiss.rref(A)[0]
+
+
+def test_rational_calculate_matches_sympy_output(rng):
+    import app
+    for _ in range(10):
+        A = _random_rational_matrix(rng, 3, 4)
+        # app.sp menandai SymPy sebagai termuat, format_matrix baru mengenali Matrix setelah itu
+        R = app.sp.Matrix([[str(x) for x in row] for row in A]).rref()[0]
+        result = app.hitung(A, 'rref')
+        assert result['final_matrix'] == app.format_matrix(R)
+        assert result['explanation'] == app.analisis_rref(R)
+        sympy_steps = app.gauss_jordan_steps(app.sp.Matrix([[str(x) for x in row] for row in A]))
+        assert result['steps'] == app.format_steps(sympy_steps)
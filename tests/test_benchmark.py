@@ -0,0 +1,25 @@
+import benchmark
+
+
+def _case(seconds, repeat=3, **extra):
+    return {'engine': 'numpy', 'kind': 'dense', 'size': 10, 'seconds': seconds,
+            'peak_bytes': 1000, 'steps': 5, 'response_bytes': 100, 'repeat': repeat, **extra}
+
+
+def test_compare_flags_slower_median():
+    regressions = benchmark.compare([_case(0.5)], {'results': [_case(0.1)]})
+    assert regressions and regressions[0][0] == 'numpy/dense/10'
+
+
+def test_compare_ignores_single_runs():
+    assert benchmark.compare([_case(0.5)], {'results': [_case(0.1, repeat=1)]}) == []
+    assert benchmark.compare([_case(0.5, repeat=1)], {'results': [_case(0.1)]}) == []
+
+
+def test_compare_still_checks_steps_of_single_runs():
+    assert benchmark.compare([_case(0.1, repeat=1, steps=6)], {'results': [_case(0.1)]})
+
+
+def test_measure_reports_median():
+    case = benchmark.measure('web-final', benchmark.workload('integer', 3), repeat=3)
+    assert case['repeat'] == 3 and case['steps'] == 0
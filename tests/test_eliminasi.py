@@ -0,0 +1,164 @@
+import numpy as np
+import pytest
+
+import blocked
+import eliminasi
+
+KASUS = [
+    ([[1, 1, 2], [1, 1, 3]], 'Tidak Ada Solusi.\nTerjadi inkonsistensi pada baris 2 (0 = 1.00).'),
+    ([[1, 0, 1], [0, 1, 1], [1, 1, 5]], 'Tidak Ada Solusi.\nTerjadi inkonsistensi pada baris 3 (0 = 1.00).'),
+    ([[1, 2, 3], [2, 4, 6]], 'Solusi Tak Hingga Banyak.\nJumlah variabel (2) > Rank matriks (1).'),
+    ([[2, 1, 3], [1, 3, 4]], 'Solusi Unik (Tunggal).\nx1 = 1.00\nx2 = 1.00'),
+]
+
+
+@pytest.mark.parametrize("matrix, teks", KASUS)
+def test_analisis_solusi_messages(matrix, teks):
+    assert eliminasi.analisis_solusi(np.array(matrix, dtype=float)) == teks
+
+
+def test_classification_is_scale_aware():
+    A = np.array([[1.0, 2.0, 3.0], [3.0, 4.0, 5.0]]) * 1e-12
+    k = eliminasi.klasifikasi_solusi(A)
+    assert (k['jenis'], k['rank']) == ('unik', 2)
+    assert np.allclose(k['solution'], [-1.0, 2.0])
+
+
+def test_condition_and_residual_only_in_dict():
+    k = eliminasi.klasifikasi_solusi([[1, 1, 2], [1, 1, 3]])
+    assert k['residual'] > 0.1 and k['condition'] > 1e15
+    teks = eliminasi.format_klasifikasi(k)
+    assert 'kondisi' not in teks and 'residu' not in teks
+
+
+@pytest.mark.parametrize("matrix, teks", KASUS)
+def test_blocked_matches_svd(tmp_path, matrix, teks):
+    path = tmp_path / 'sistem.npy'
+    np.save(path, np.array(matrix, dtype=float))
+    k = blocked.klasifikasi_file(str(path), workdir=str(tmp_path))
+    # Eliminasi blok tidak menormalkan pivot, jadi konstanta 0 = c bisa berbeda skala
+    assert eliminasi.format_klasifikasi(k).split(' (0 =')[0] == teks.split(' (0 =')[0]
+
+
+@pytest.mark.parametrize("matrix, teks", KASUS)
+def test_klasifikasi_rref_matches_svd(matrix, teks):
+    rref_matrix, _ = eliminasi.eliminasi_gauss(np.array(matrix, dtype=float), make_one=True, jordan=True)
+    assert eliminasi.format_klasifikasi(eliminasi.klasifikasi_rref(rref_matrix)) == teks
+
+
+def test_klasifikasi_rref_free_variables():
+    rref_matrix, _ = eliminasi.eliminasi_gauss(np.array([[1.0, 2.0, 0.0, 3.0], [0.0, 0.0, 1.0, 4.0]]),
+                                               make_one=True, jordan=True)
+    k = eliminasi.klasifikasi_rref(rref_matrix)
+    assert (k['jenis'], k['rank'], k['free_variables']) == ('tak hingga', 2, [2])
+
+
+def _eliminasi_gauss_lama(matrix, make_one=False, jordan=False):
+    """Salinan eliminasi_gauss Test.py sebelum vektorisasi, sebagai acuan"""
+    mat = np.copy(matrix).astype(np.float64)
+    num_rows, num_cols = mat.shape
+    pivot_row = 0
+    langkah_langkah = [("Matriks Awal:", mat.copy())]
+
+    for j in range(num_cols):
+        if pivot_row >= num_rows:
+            break
+
+        max_row = max(range(pivot_row, num_rows), key=lambda i: abs(mat[i, j]))
+        if abs(mat[max_row, j]) < 1e-10:
+            continue
+
+        if max_row != pivot_row:
+            mat[[pivot_row, max_row]] = mat[[max_row, pivot_row]]
+            langkah_langkah.append((f"Tukar baris {pivot_row+1} dan {max_row+1}:", mat.copy()))
+
+        if make_one:
+            pivot_val = mat[pivot_row, j]
+            if abs(pivot_val - 1.0) > 1e-10:
+                mat[pivot_row] = mat[pivot_row] / pivot_val
+                langkah_langkah.append((f"R{pivot_row+1} = R{pivot_row+1}/{pivot_val:.2f}:", mat.copy()))
+
+        rows_to_eliminate = range(num_rows) if jordan else range(pivot_row + 1, num_rows)
+        for i in rows_to_eliminate:
+            if i != pivot_row and abs(mat[i, j]) > 1e-10:
+                faktor = mat[i, j] / mat[pivot_row, j]
+                mat[i] = mat[i] - faktor * mat[pivot_row]
+                langkah_langkah.append((f"R{i+1} = R{i+1} - ({faktor:.2f})*R{pivot_row+1}:", mat.copy()))
+
+        pivot_row += 1
+
+    mat[np.abs(mat) < 1e-10] = 0
+    if jordan:
+        hasil = "Hasil Akhir (Eliminasi Gauss-Jordan):"
+    elif make_one:
+        hasil = "Hasil Akhir (Eliminasi Gauss dengan Satu Utama):"
+    else:
+        hasil = "Hasil Akhir (Eliminasi Gauss/OBE):"
+    langkah_langkah.append((hasil, mat.copy()))
+    return mat, langkah_langkah
+
+
+def _analisis_solusi_lama(matrix):
+    """Salinan analisis_solusi Test.py sebelum klasifikasi SVD, sebagai acuan"""
+    rref_matrix, _ = _eliminasi_gauss_lama(matrix, make_one=True, jordan=True)
+    num_rows, num_cols = rref_matrix.shape
+    num_vars = num_cols - 1
+
+    for i in range(num_rows):
+        row = rref_matrix[i, :]
+        if np.all(np.abs(row[:num_vars]) < 1e-10) and abs(row[-1]) > 1e-10:
+            return f"Tidak Ada Solusi.\nTerjadi inkonsistensi pada baris {i+1} (0 = {row[-1]:.2f})."
+
+    rank = sum(1 for i in range(num_rows) if not np.all(np.abs(rref_matrix[i, :]) < 1e-10))
+    if rank < num_vars:
+        return f"Solusi Tak Hingga Banyak.\nJumlah variabel ({num_vars}) > Rank matriks ({rank})."
+
+    solusi = []
+    for i in range(rank):
+        pivot_col = next((j for j in range(num_vars) if abs(rref_matrix[i, j]) > 1e-10), -1)
+        if pivot_col != -1:
+            solusi.append(f"x{pivot_col+1} = {rref_matrix[i, -1]:.2f}")
+    return "Solusi Unik (Tunggal).\n" + "\n".join(solusi)
+
+
+def _matriks_acak(rng, m, n):
+    """Bilangan bulat kecil dan pecahan desimal, kadang dengan baris kelipatan"""
+    desimal = rng.random() < 0.5
+    A = np.array([[round(rng.uniform(-9, 9), 2) if desimal and rng.random() < 0.5 else rng.randint(-6, 6)
+                   for _ in range(n)] for _ in range(m)], dtype=float)
+    if m > 1 and rng.random() < 0.3:
+        A[-1] = 2 * A[0]
+    return A
+
+
+@pytest.mark.parametrize("matrix, teks", [
+    ([[2, 1, 4], [1, 3, 2]], 'Solusi Unik (Tunggal).\nx1 = 2.00\nx2 = 0.00'),
+    ([[8, 0, -7], [0, 8, 1]], 'Solusi Unik (Tunggal).\nx1 = -0.88\nx2 = 0.12'),
+])
+def test_solution_rounding(matrix, teks):
+    assert eliminasi.analisis_solusi(np.array(matrix, dtype=float)) == teks
+
+
+def test_analisis_solusi_matches_old_implementation(rng):
+    for _ in range(1000):
+        A = _matriks_acak(rng, rng.randint(1, 5), rng.randint(2, 6))
+        assert eliminasi.analisis_solusi(A) == _analisis_solusi_lama(A), A.tolist()
+
+
+@pytest.mark.parametrize("make_one, jordan", [(False, False), (True, False), (True, True)])
+def test_eliminasi_gauss_matches_old_loop(make_one, jordan):
+    gen = np.random.default_rng(2024)
+    for _ in range(500):
+        m, n = gen.integers(1, 7), gen.integers(2, 8)
+        A = np.where(gen.random((m, n)) < 0.5, gen.integers(-6, 7, (m, n)), np.round(gen.uniform(-9, 9, (m, n)), 2))
+        A[gen.random((m, n)) < 0.15] = 0
+        if m > 1 and gen.random() < 0.3:
+            A[-1] = 3 * A[0]
+        if gen.random() < 0.1:
+            A *= 1e-10
+        mat, langkah = eliminasi.eliminasi_gauss(A, make_one=make_one, jordan=jordan)
+        mat_lama, langkah_lama = _eliminasi_gauss_lama(A, make_one=make_one, jordan=jordan)
+        assert mat.tobytes() == mat_lama.tobytes()
+        langkah = list(langkah)
+        assert [desc for desc, _ in langkah] == [desc for desc, _ in langkah_lama]
+        assert all(np.asarray(M).tobytes() == M_lama.tobytes() for (_, M), (_, M_lama) in zip(langkah, langkah_lama))
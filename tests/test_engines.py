@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import engines
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dijalankan di proses baru: sys.modules proses test sudah berisi NumPy dan SymPy
+SKRIP = """
+import json, sys
+import app, engines
+hasil = {'after_import': sorted(m for m in ('numpy', 'sympy', 'mpmath', *engines.stats()) if m in sys.modules)}
+app.lu.TOL
+hasil['after_lookup'] = {name: s['loaded'] for name, s in engines.stats().items()}
+hasil['sympy_imported'] = 'sympy' in sys.modules
+print(json.dumps(hasil))
+"""
+
+
+def test_import_app_loads_no_engine():
+    env = {**os.environ, 'WORKER_PROCESSES': '0', 'ENGINE_WARMUP': ''}
+    keluaran = subprocess.run([sys.executable, '-c', SKRIP], cwd=ROOT, env=env,
+                              capture_output=True, text=True, check=True).stdout
+    hasil = json.loads(keluaran.splitlines()[-1])
+    assert hasil['after_import'] == []
+    # Atribut mesin pertama yang dipakai memuat mesin itu dan dependensinya saja
+    assert {name for name, loaded in hasil['after_lookup'].items() if loaded} == {'lu', 'numpy'}
+    assert not hasil['sympy_imported']
+
+
+@pytest.fixture
+def mesin_uji(monkeypatch):
+    """A throwaway engine on a stdlib module, removed from the registry afterwards"""
+    sys.modules.pop('colorsys', None)
+    dipanaskan = []
+    monkeypatch.setitem(engines._engines, 'uji', None)
+    engines.register('uji', 'colorsys', requires=('numpy',), warmup=dipanaskan.append, description="uji")
+    return dipanaskan
+
+
+def test_lazy_lookup_loads_engine(mesin_uji):
+    modul = engines.lazy('uji')
+    assert not engines.loaded('uji') and 'colorsys' not in sys.modules
+    assert modul.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert engines.loaded('uji') and engines.loaded('numpy')
+    stats = engines.stats()['uji']
+    assert stats['loaded'] and stats['import_seconds'] >= 0 and stats['warmup_seconds'] is None
+    assert engines.load('uji') is sys.modules['colorsys']
+
+    # Pemanasan berjalan sekali, dari warm() dan bukan dari pemuatan
+    assert mesin_uji == []
+    engines.warm(['uji'])
+    engines.warm(['uji'])
+    assert mesin_uji == [sys.modules['colorsys']]
+    assert engines.stats()['uji']['warmup_seconds'] >= 0
@@ -0,0 +1,47 @@
+from fractions import Fraction
+from math import lcm
+
+import sympy as sp
+
+import hybrid
+from conftest import random_int_matrix
+
+
+def _sympy_solution(matrix):
+    M = sp.Matrix(matrix)
+    x = M[:, :-1].LUsolve(M[:, -1])
+    return [Fraction(int(v.p), int(v.q)) for v in x]
+
+
+def test_to_integer_rows_reads_decimals_exactly():
+    assert hybrid.to_integer_rows([[0.1, 2, 0.25]]) == [[2, 40, 5]]
+
+
+def test_solve_matches_sympy(rng):
+    for _ in range(30):
+        n = rng.randint(1, 8)
+        A = random_int_matrix(rng, n, n + 1, -20, 20)
+        if sp.Matrix(A)[:, :-1].det() == 0:
+            continue
+        assert hybrid.solve(A) == _sympy_solution(A)
+
+
+def test_solve_ill_conditioned_hilbert():
+    n = 8
+    H = [[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)]
+    d = lcm(*(x.denominator for row in H for x in row))
+    A = [[int(x * d) for x in row] + [int(d * sum(row))] for row in H]
+    assert hybrid.solve(A) == [1] * n
+
+
+def test_solve_returns_none_without_unique_solution():
+    assert hybrid.solve([[1, 2, 3], [2, 4, 6]]) is None
+    assert hybrid.solve([[1, 1, 2], [1, 1, 3]]) is None
+    assert hybrid.solve([[1, 2, 3]]) is None
+
+
+def test_calculate_hybrid(client):
+    data = client.post('/calculate', json={'matrix': [[3, 0, 1], [0, 3, 2]], 'operation': 'hybrid'}).get_json()
+    assert data['status'] == 'success'
+    assert data['engine'] == 'hybrid'
+    assert data['explanation'] == 'Solusi unik (tunggal).\nx_1 = 1/3\nx_2 = 2/3'
@@ -0,0 +1,78 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import lu
+from incremental import IncrementalSolver
+from workerpool import JobTimeout
+
+
+def test_rank_one_updates_stay_exact():
+    solver = IncrementalSolver([[2, 1, 3], [1, 3, 4]])
+    assert solver.set_cell(1, 2, 5) is False
+    assert solver.solve() == (False, [Fraction(4, 5), Fraction(7, 5)])
+    assert solver.set_row(0, [1, 1, 2]) is False
+    assert solver.solve() == (False, [Fraction(1, 2), Fraction(3, 2)])
+    assert (solver.updates, solver.refactors) == (2, 1)
+
+
+def test_float_updates_match_direct_solve(rng):
+    A = np.array([[4.0, 1, 0, 1], [1, 5, 2, 2], [0, 2, 6, 3]])
+    solver = IncrementalSolver(A.tolist())
+    for _ in range(10):
+        i, j = rng.randrange(3), rng.randrange(4)
+        A[i, j] = A[i, j] + rng.uniform(-1, 1) + 0.5
+        solver.set_cell(i, j, float(A[i, j]))
+        inkonsisten, x = solver.solve()
+        assert not inkonsisten and np.allclose(x, np.linalg.solve(A[:, :-1], A[:, -1]))
+
+
+def test_refactor_uses_given_factorize():
+    dipanggil = []
+
+    def factorize(A):
+        dipanggil.append(A)
+        return lu.factorize(A)
+
+    solver = IncrementalSolver([[1, 2, 3], [2, 4, 6]])
+    # Sistem singular: setiap perubahan koefisien memfaktorkan ulang
+    assert solver.set_cell(1, 1, 5, factorize) is True
+    assert dipanggil == [[[1, 2], [2, 5]]]
+
+
+def test_failed_refactor_undoes_the_edit():
+    solver = IncrementalSolver([[1, 2, 3], [2, 4, 6]])
+
+    def gagal(A):
+        raise JobTimeout("batas waktu")
+
+    with pytest.raises(JobTimeout):
+        solver.set_cell(1, 1, 5, gagal)
+    assert solver.matrix() == [[1, 2, 3], [2, 4, 6]]
+    assert solver.solve() == (False, None)
+    assert solver.set_cell(1, 1, 5) is True
+    assert solver.solve() == (False, [3, 0])
+
+
+def test_session_edit_refactors_in_pool(client, monkeypatch):
+    import app
+    sesi = client.post('/session', json={'matrix': [[1, 2, 3], [2, 4, 6]]}).get_json()
+    lewat_pool = []
+    run = app.pool.run
+    monkeypatch.setattr(app.pool, 'run', lambda fn, *args: lewat_pool.append(fn) or run(fn, *args))
+    data = client.post(f"/session/{sesi['session']}/edit", json={'row': 1, 'col': 1, 'value': 5}).get_json()
+    assert data['refactored'] is True and data['solution'] == ['3', '0']
+    assert lewat_pool == [lu.factorize]
+
+
+def test_session_edit_timeout(client, monkeypatch):
+    import app
+    sesi = client.post('/session', json={'matrix': [[1, 2, 3], [2, 4, 6]]}).get_json()
+
+    def timeout(fn, *args):
+        raise JobTimeout("batas waktu")
+
+    monkeypatch.setattr(app.pool, 'run', timeout)
+    response = client.post(f"/session/{sesi['session']}/edit", json={'row': 1, 'col': 1, 'value': 5})
+    assert response.status_code == 504
@@ -0,0 +1,72 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import lu
+from conftest import random_int_matrix
+
+
+def _fractions(M):
+    return [[Fraction(int(x.p), int(x.q)) for x in M.row(i)] for i in range(M.rows)]
+
+
+def test_factorize_picks_engine():
+    assert isinstance(lu.factorize([[1, 2], ["1/3", 4]]), lu.ExactLUFactor)
+    assert isinstance(lu.factorize([[1.5, 2], [3, 4]]), lu.LUFactor)
+
+
+def test_exact_matches_sympy(rng):
+    for _ in range(30):
+        n = rng.randint(1, 5)
+        A = random_int_matrix(rng, n, n, -4, 4)
+        if n > 1 and rng.random() < 0.3:
+            A[-1] = [x - y for x, y in zip(A[0], A[1 % n])]
+        factor = lu.factorize(A)
+        M = sp.Matrix(A)
+        assert factor.determinant() == M.det()
+        assert factor.rank == M.rank()
+        if M.det() != 0:
+            assert factor.inverse() == _fractions(M.inv())
+        else:
+            assert factor.inverse() is None
+        for v in factor.nullspace():
+            assert all(x == 0 for x in M * sp.Matrix(v))
+        assert len(factor.nullspace()) == n - M.rank()
+
+
+def test_exact_solve_many_rhs():
+    factor = lu.factorize([[2, 1], [1, 3]])
+    (inc1, x1), (inc2, x2) = factor.solve([[3, 4], [1, 0]])
+    assert not inc1 and x1 == [1, 1]
+    assert not inc2 and x2 == [Fraction(3, 5), Fraction(-1, 5)]
+
+
+def test_exact_inconsistent_and_particular():
+    factor = lu.factorize([[1, 1], [2, 2]])
+    assert factor.solve([1, 3]) == [(True, None)]
+    assert factor.solve([1, 2]) == [(False, None)]
+    assert factor.particular([1, 2]) == (False, [1, 0])
+
+
+def test_float_matches_numpy(rng):
+    for _ in range(20):
+        n = rng.randint(1, 6)
+        A = np.array(random_int_matrix(rng, n, n), dtype=float) + 0.5 * np.eye(n)
+        factor = lu.LUFactor(A)
+        if abs(np.linalg.det(A)) < 1e-6:
+            continue
+        assert factor.determinant() == pytest.approx(np.linalg.det(A))
+        assert np.allclose(factor.inverse(), np.linalg.inv(A))
+        b = np.arange(n, dtype=float)
+        (inconsistent, x), = factor.solve(b.tolist())
+        assert not inconsistent and np.allclose(x, np.linalg.solve(A, b))
+
+
+def test_non_square_rejected():
+    factor = lu.factorize([[1, 2, 3], [4, 5, 6]])
+    with pytest.raises(ValueError):
+        factor.determinant()
+    with pytest.raises(ValueError):
+        factor.inverse()
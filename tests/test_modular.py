@@ -0,0 +1,31 @@
+import bareiss
+import modular
+from conftest import random_int_matrix, sympy_rref
+
+
+def test_primes_are_distinct_primes():
+    primes = [modular.prime(i) for i in range(8)]
+    assert len(set(primes)) == 8
+    assert all(p < 2 ** 31 and modular._is_prime(p) for p in primes)
+    assert not modular._is_prime(2 ** 31 - 3)
+
+
+def test_rref_matches_sympy(rng):
+    for _ in range(40):
+        m, n = rng.randint(1, 6), rng.randint(2, 7)
+        A = random_int_matrix(rng, m, n)
+        if m > 2 and rng.random() < 0.4:
+            A[-1] = [x + 3 * y for x, y in zip(A[0], A[1])]
+        assert modular.rref(A) == sympy_rref(A)
+
+
+def test_rref_large_entries(rng):
+    A = random_int_matrix(rng, 12, 13, -10 ** 12, 10 ** 12)
+    A[5] = [2 * x - y for x, y in zip(A[0], A[3])]
+    assert modular.rref(A) == bareiss.rref(A)
+
+
+def test_zero_matrix():
+    R, pivots = modular.rref([[0, 0, 0], [0, 0, 0]])
+    assert pivots == ()
+    assert all(x == 0 for row in R for x in row)
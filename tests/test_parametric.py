@@ -0,0 +1,81 @@
+import pytest
+import sympy as sp
+
+import parametric
+
+
+def _jenis_sympy(matrix, k):
+    """Classification of the system at one parameter value, from SymPy ranks"""
+    k_simbol = sp.Symbol('k')
+    M = sp.Matrix([[sp.sympify(x).subs(k_simbol, k) if isinstance(x, str) else x for x in row]
+                   for row in matrix])
+    rank_a, rank_ab = M[:, :-1].rank(), M.rank()
+    if rank_a < rank_ab:
+        return 'tidak ada'
+    return 'unik' if rank_a == M.cols - 1 else 'tak hingga'
+
+
+KASUS = [
+    [[1, 1, 1], [1, 'k', 2]],
+    [[1, 'k', 1], ['k', 4, 'k+1']],
+    [[1, 1, 1, 1], [1, 'k', 1, 'k'], [1, 1, 'k', 'k*k']],
+    [['k-1', 0, 2], [0, 'k-1', 'k-1']],
+]
+
+
+@pytest.mark.parametrize("matrix", KASUS)
+def test_regions_match_substitution(matrix):
+    hasil = parametric.analisis_parametrik(matrix)
+    for item in hasil['critical_values']:
+        assert item['jenis'] == _jenis_sympy(matrix, sp.Rational(item['value']))
+    # Nilai di luar titik kritis mengikuti klasifikasi generik
+    kritis = {sp.Rational(item['value']) for item in hasil['critical_values']}
+    for k in range(-4, 5):
+        if k not in kritis:
+            assert _jenis_sympy(matrix, k) == hasil['generic']['jenis']
+
+
+def test_explanation_and_solution():
+    hasil = parametric.analisis_parametrik([[1, 1, 1], [1, 'k', 2]])
+    assert hasil['generic']['solution'] == ['(k - 2)/(k - 1)', '1/(k - 1)']
+    assert parametric.format_parametrik(hasil).splitlines() == [
+        "Untuk semua k kecuali 1: Solusi unik (tunggal) (rank 2).",
+        "x1 = (k - 2)/(k - 1)",
+        "x2 = 1/(k - 1)",
+        "k = 1: Tidak ada solusi (rank 1).",
+    ]
+
+
+def test_irrational_critical_values():
+    hasil = parametric.analisis_parametrik([[1, 0, 1], [0, 'k^2 - 2', 1]])
+    assert [item['value'] for item in hasil['critical_values']] == ['-sqrt(2)', 'sqrt(2)']
+
+
+@pytest.mark.parametrize("teks, expected", [
+    ("2k + 1", "2*k + 1"),
+    ("3(k + 1)", "3*k + 3"),
+    ("k^2 - k/2", "k**2 - k/2"),
+    ("-(k - 1)**3", "-(k - 1)**3"),
+    ("0.5k", "k/2"),
+])
+def test_parser_matches_sympy(teks, expected):
+    _, ((poly, _),) = parametric.urai_matriks([[teks, 0]])
+    assert sp.expand(poly.as_expr() - sp.sympify(expected)) == 0
+
+
+@pytest.mark.parametrize("matrix", [
+    [['k^33', 1]],
+    [['(k^8)^5', 1]],
+    [['k^20 * k^20', 1]],
+    [['k^20 k^20', 1]],
+    [['k^20', 1, 2], [1, 'k^20', 3]],
+])
+def test_degree_is_capped(matrix):
+    with pytest.raises(ValueError, match=str(parametric.MAX_PANGKAT)):
+        parametric.analisis_parametrik(matrix)
+
+
+@pytest.mark.parametrize("teks", ["k + x", "1 / k", "(k + 1", "k ^ -1", "__import__('os')"])
+def test_parser_rejects(teks):
+    with pytest.raises(ValueError):
+        parametric.analisis_parametrik([[teks, 1]])
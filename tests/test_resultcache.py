@@ -0,0 +1,76 @@
+from resultcache import FactorCache, ResultCache, cache_key
+
+
+def test_cache_key_distinguishes_entry_types():
+    assert cache_key([[2, 1]], 'rref') != cache_key([[2.0, 1]], 'rref')
+    assert cache_key([[2, 1]], 'rref') != cache_key([["2", 1]], 'rref')
+    assert cache_key([[2, 1]], 'rref', steps=True) != cache_key([[2, 1]], 'rref', steps=False)
+
+
+def test_normalize_rows_on_integer_matrix():
+    A = [[1, 2, 3], [3, 4, 5]]
+    B = [[-2, -4, -6], [3, 4, 5]]
+    assert cache_key(A, 'rref', normalize_rows=True) == cache_key(B, 'rref', normalize_rows=True)
+    assert cache_key(A, 'rref') != cache_key(B, 'rref')
+
+
+def test_normalize_rows_skipped_when_matrix_has_floats():
+    A = [[1, 2, 0.1], [3, 4, 5]]
+    B = [[1, 2, 0.1], [6, 8, 10]]
+    assert cache_key(A, 'rref', normalize_rows=True) != cache_key(B, 'rref', normalize_rows=True)
+
+
+def test_result_cache_lru_eviction():
+    cache = ResultCache(max_entries=2, max_bytes=1024)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'
+    cache.put('c', b'3')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1' and cache.get('c') == b'3'
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (3, 1, 1)
+
+
+def test_result_cache_byte_budget():
+    cache = ResultCache(max_entries=10, max_bytes=10)
+    cache.put('big', b'x' * 11)
+    assert cache.get('big') is None
+    cache.put('a', b'x' * 6)
+    cache.put('b', b'x' * 6)
+    assert cache.get('a') is None
+    assert cache.stats()['bytes'] == 6
+
+
+def test_factor_cache_ttl():
+    now = [0.0]
+    cache = FactorCache(max_entries=4, ttl=10.0, clock=lambda: now[0])
+    cache.put('a', object())
+    now[0] = 8.0
+    assert cache.get('a') is not None
+    # Akses memperpanjang umur entri
+    now[0] = 15.0
+    assert cache.get('a') is not None
+    now[0] = 26.0
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_factor_cache_lru_eviction():
+    cache = FactorCache(max_entries=2, ttl=60.0)
+    for key in 'abc':
+        cache.put(key, key)
+    assert cache.get('a') is None
+    assert cache.get('c') == 'c'
+    assert cache.stats()['evictions'] == 1
+
+
+def test_calculate_uses_cache(client):
+    import app
+    body = {'matrix': [[1, 2, 3], [4, 5, 6]], 'operation': 'rref', 'steps': False}
+    first = client.post('/calculate', json=body)
+    hits = app.result_cache.hits
+    second = client.post('/calculate', json=body)
+    assert first.status_code == second.status_code == 200
+    assert first.get_json() == second.get_json()
+    assert app.result_cache.hits == hits + 1
@@ -0,0 +1,50 @@
+import pytest
+
+import eliminasi
+import sparse
+
+
+def test_from_coo_sums_duplicates_and_drops_zeros():
+    rows = sparse.from_coo([2, 3], [[0, 0, 2], [0, 0, -2], [0, 2, 6], [1, 1, 4], [1, 1, 1]])
+    assert rows == [{2: 6}, {1: 5}]
+
+
+@pytest.mark.parametrize("shape, entries", [
+    ([0, 3], []),
+    ([2, 3], [[2, 0, 1]]),
+    ([2, 3], [[0, -1, 1]]),
+    ([2, 3], [[0, 0, "1"]]),
+])
+def test_from_coo_rejects_invalid_input(shape, entries):
+    with pytest.raises(ValueError):
+        sparse.from_coo(shape, entries)
+
+
+@pytest.mark.parametrize("matrix", [
+    [[2, 1, 3], [1, 3, 4]],
+    [[1, 2, 3], [2, 4, 6]],
+    [[1, 1, 2], [1, 1, 3]],
+    [[0, 0, 1, 2], [1, 0, 0, 3], [0, 2, 0, 4]],
+    [[0.5, 1.0, 2.0], [1.0, 0.0, 1.0]],
+])
+def test_explanation_matches_dense_classification(matrix):
+    entries = [[i, j, v] for i, row in enumerate(matrix) for j, v in enumerate(row) if v]
+    rows = sparse.from_coo([len(matrix), len(matrix[0])], entries)
+    teks, stats = sparse.analisis_sparse(rows, len(matrix[0]))
+    assert teks == eliminasi.analisis_solusi(matrix)
+    assert stats['nnz_before'] == len(entries)
+
+
+def test_exact_solution_for_integer_input():
+    rows = sparse.from_coo([2, 3], [[0, 0, 3], [0, 2, 1], [1, 1, 3], [1, 2, 2]])
+    hasil, _ = sparse.klasifikasi_sparse(rows, 3)
+    assert hasil['exact'] and hasil['solution'] == [1 / 3, 2 / 3]
+
+
+def test_calculate_sparse(client):
+    body = {'operation': 'rref',
+            'sparse': {'shape': [2, 3], 'entries': [[0, 0, 2], [0, 2, 6], [1, 1, 4], [1, 2, 2]]}}
+    data = client.post('/calculate', json=body).get_json()
+    assert data['status'] == 'success'
+    assert data['explanation'] == 'Solusi Unik (Tunggal).\nx1 = 3.00\nx2 = 0.50'
+    assert data['classification']['rank'] == 2
@@ -0,0 +1,52 @@
+import pytest
+
+import bareiss
+from conftest import random_int_matrix
+from steptrace import StepTrace
+
+
+def _trace(rng, checkpoint_every=3):
+    A = random_int_matrix(rng, 5, 6)
+    return StepTrace.collect(A, bareiss.gauss_jordan_ops(A), checkpoint_every=checkpoint_every)
+
+
+def test_indexing_matches_iteration(rng):
+    trace = _trace(rng)
+    steps = list(trace)
+    assert len(steps) == len(trace)
+    for i, step in enumerate(steps):
+        assert trace[i] == step
+    assert trace[-1][1] == trace.final()
+
+
+def test_rows_between_matches_iteration(rng):
+    trace = _trace(rng)
+    steps = list(trace)
+    for start, stop in [(0, None), (1, 4), (3, 7), (len(trace) - 2, len(trace) + 5)]:
+        got = [(desc, [list(row) for row in rows]) for desc, rows in trace.rows_between(start, stop)]
+        assert got == steps[start:stop]
+    assert list(trace.rows_between(5, 5)) == []
+
+
+def test_state_independent_of_checkpoints(rng):
+    A = random_int_matrix(rng, 4, 5)
+    sparse = StepTrace.collect(A, bareiss.gauss_jordan_ops(A), checkpoint_every=1000)
+    dense = StepTrace.collect(A, bareiss.gauss_jordan_ops(A), checkpoint_every=1)
+    for k in range(len(sparse.ops) + 1):
+        assert sparse.state(k) == dense.state(k)
+
+
+def test_initial_matrix_is_copied():
+    A = [[1, 2], [3, 4]]
+    trace = StepTrace(A)
+    A[0][0] = 99
+    assert trace[0] == ("Matriks Awal:", [[1, 2], [3, 4]])
+
+
+def test_without_initial_description():
+    trace = StepTrace([[0, 1], [1, 0]], initial_desc=None)
+    trace.swap("R1 <-> R2", 0, 1)
+    assert len(trace) == 1
+    assert trace[0] == ("R1 <-> R2", [[1, 0], [0, 1]])
+    with pytest.raises(IndexError):
+        trace[1]
@@ -0,0 +1,149 @@
+import json
+import struct
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+import wire
+
+
+def _blok(data):
+    """(kind, rows, cols, values) of one encoded block"""
+    _, kind, r, c = struct.unpack_from('<4sBxxxII', data)
+    return chr(kind), r, c, data[16:]
+
+
+def _pesan(data):
+    """(meta, blocks) of one MTXR message"""
+    magic, total, meta_len, count = struct.unpack_from('<4sIII', data)
+    assert magic == b'MTXR' and total == len(data)
+    meta = json.loads(data[16:16 + meta_len])
+    blocks, offset = [], 16 + meta_len
+    for _ in range(count):
+        _, kind, r, c = struct.unpack_from('<4sBxxxII', data, offset)
+        size = 16 + {ord('f'): 8, ord('i'): 8, ord('r'): 16}.get(kind, 0) * r * c
+        if kind == ord('t'):
+            size = 24 + struct.unpack_from('<I', data, offset + 16)[0]
+        size += -size % 8
+        blocks.append(data[offset:offset + size])
+        offset += size
+    return meta, blocks
+
+
+@pytest.mark.parametrize("matrix, dtype", [
+    ([[1.5, -2.0, 3.25], [0.0, 1e-300, -7.0]], np.float64),
+    ([[1, -2, 3], [2 ** 62, 0, -(2 ** 63)]], np.int64),
+])
+def test_round_trip(matrix, dtype):
+    A = wire.decode_matrix(bytes(wire.encode_matrix(matrix)))
+    assert A.dtype == dtype
+    assert A.tolist() == matrix
+
+
+def test_float_array_round_trip():
+    A = np.arange(12, dtype=float).reshape(3, 4) / 7
+    assert np.array_equal(wire.decode_matrix(bytes(wire.encode_matrix(A))), A)
+
+
+def test_exact_kinds():
+    assert _blok(wire.encode_matrix([[Fraction(1, 3), 2]]))[0] == 'r'
+    kind, r, c, data = _blok(wire.encode_matrix([[2 ** 70, Fraction(-1, 2 ** 65)]]))
+    assert (kind, r, c) == ('t', 1, 2)
+    length = struct.unpack_from('<I', data)[0]
+    assert data[8:8 + length].decode() == f"{2 ** 70}\n-1/{2 ** 65}"
+
+
+@pytest.mark.parametrize("data", [
+    b'short',
+    b'XXXX' + bytes(12),
+    bytes(wire.encode_matrix([[Fraction(1, 2)]])),
+    bytes(wire.encode_matrix([[1.0, 2.0]]))[:-8],
+])
+def test_decode_rejects_invalid_blocks(data):
+    with pytest.raises(ValueError):
+        wire.decode_matrix(data)
+
+
+def test_message_references_blocks():
+    message = wire.encode_message({'final_matrix': wire.encode_matrix([[1, 2]]), 'steps': [
+        ['a', wire.encode_matrix([[0.5, 1.0]])]]})
+    meta, blocks = _pesan(message)
+    assert meta == {'final_matrix': {'$block': 0}, 'steps': [['a', {'$block': 1}]]}
+    assert wire.decode_matrix(blocks[0]).tolist() == [[1, 2]]
+    assert wire.decode_matrix(blocks[1]).tolist() == [[0.5, 1.0]]
+
+
+def _post_biner(client, matrix, query, accept=None):
+    headers = {'Accept': accept} if accept else {}
+    return client.post('/calculate?' + query, data=bytes(wire.encode_matrix(matrix)),
+                       content_type=wire.MIMETYPE, headers=headers)
+
+
+@pytest.mark.parametrize("matrix, operation", [
+    ([[2.0, 1.0, 3.0], [1.0, 3.0, 4.0]], 'classify'),
+    ([[2.0, 1.0, 3.0], [1.0, 3.0, 4.0]], 'hybrid'),
+    ([[2.0, 1.0, 3.0], [1.0, 3.0, 4.0]], 'inverse'),
+    ([[2.5, 1.0, 3.0], [1.0, 3.0, 4.0]], 'rref'),
+    ([[2, 1, 3], [1, 3, 4]], 'rref'),
+])
+def test_binary_input_matches_json(client, matrix, operation):
+    biner = _post_biner(client, np.array(matrix), f'operation={operation}&steps=0').get_json()
+    teks = client.post('/calculate', json={'matrix': matrix, 'operation': operation, 'steps': False}).get_json()
+    assert biner['status'] == 'success'
+    assert biner == teks
+
+
+def test_large_int64_input_uses_modular_array(client, monkeypatch):
+    import app
+    import modular
+    terlihat = []
+    asli = modular.rref
+    monkeypatch.setattr(modular, 'rref', lambda matrix, *a: terlihat.append(type(matrix)) or asli(matrix, *a))
+    M = np.random.default_rng(0).integers(-5, 5, (modular.MIN_ROWS + 2, modular.MIN_ROWS + 3))
+    biner = _post_biner(client, M, 'operation=rref&steps=0').get_json()
+    app.result_cache.clear()
+    teks = client.post('/calculate', json={'matrix': M.tolist(), 'operation': 'rref', 'steps': False}).get_json()
+    assert biner == teks
+    assert terlihat[0] is np.ndarray
+
+
+def test_routed_note_in_binary_payload(client, monkeypatch):
+    import app
+    monkeypatch.setattr(app.admission, 'max_step_bytes', 1)
+    response = _post_biner(client, [[1, 2, 3], [4, 5, 6]], 'operation=rref', accept=wire.MIMETYPE)
+    assert response.headers['X-Admission'] == 'admit; routed'
+    meta, _ = _pesan(response.get_data())
+    assert meta['admission']['routed'].endswith('dihitung tanpa langkah')
+    assert meta['steps'] == []
+
+
+def _stream(data):
+    """Messages of a binary stream, split on the length in each header"""
+    messages, offset = [], 0
+    while offset < len(data):
+        total = struct.unpack_from('<4sI', data, offset)[1]
+        messages.append(_pesan(data[offset:offset + total]))
+        offset += total
+    return messages
+
+
+@pytest.mark.parametrize("matrix", [[[2, 1, 3], [1, 3, 4]], [[1.5, 2, 3], [4, 5, 6.5]]])
+def test_binary_stream_matches_binary_payload(client, matrix):
+    response = client.post('/calculate', json={'matrix': matrix, 'operation': 'gauss-jordan', 'stream': 'binary'})
+    assert response.mimetype == wire.STREAM_MIMETYPE
+    events = _stream(response.get_data())
+    assert [meta['event'] for meta, _ in events] == ['start'] + ['step'] * (len(events) - 2) + ['result']
+
+    meta, blocks = _pesan(client.post('/calculate', json={'matrix': matrix, 'operation': 'gauss-jordan'},
+                                      headers={'Accept': wire.MIMETYPE}).get_data())
+    steps = [(desc, blocks[ref['$block']]) for desc, ref in meta['steps']]
+    assert [(m['description'], b[m['matrix']['$block']]) for m, b in events[1:-1]] == steps
+    hasil, blok_hasil = events[-1]
+    assert blok_hasil[hasil['final_matrix']['$block']] == blocks[meta['final_matrix']['$block']]
+
+
+def test_binary_stream_error_event(client):
+    response = client.post('/calculate', json={'matrix': [['1+', 2, 3]], 'operation': 'rref', 'stream': 'binary'})
+    (meta, blocks), = _stream(response.get_data())
+    assert (meta['event'], meta['status'], blocks) == ('error', 'error', [])
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from workerpool import JobTimeout, PoolBusy, WorkerPool
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(processes=1, timeout=1.0, queue_timeout=0.1)
+    yield pool
+    pool.shutdown()
+
+
+def test_run_in_worker(pool):
+    assert pool.run(pow, 2, 10) == 1024
+    with pytest.raises(ZeroDivisionError):
+        pool.run(divmod, 1, 0)
+    # Pekerja tetap dipakai setelah exception biasa
+    assert pool.run(abs, -3) == 3
+
+
+def test_timeout_kills_and_replaces_worker(pool):
+    pool.run(abs, 0)
+    with pytest.raises(JobTimeout) as info:
+        pool.run(time.sleep, 10)
+    assert info.value.http_status == 504
+    assert pool.timeouts == 1
+    assert pool.run(abs, -1) == 1
+
+
+def test_inline_pool_runs_in_process():
+    pool = WorkerPool(processes=0)
+    assert pool.run(lambda: 42) == 42
+
+
+def test_busy_error_code():
+    assert PoolBusy.http_status == 503 and PoolBusy.code == 'busy'
+
+
+def test_calculate_timeout_gives_504(client, monkeypatch):
+    import app
+    # Batas waktu jauh di bawah waktu impor SymPy di pekerja baru
+    lambat = WorkerPool(processes=1, timeout=0.001)
+    monkeypatch.setattr(app, 'pool', lambat)
+    try:
+        response = client.post('/calculate', json={'matrix': [[1.5, 2, 3], [4, 5, 6]], 'operation': 'rref'})
+    finally:
+        lambat.shutdown()
+    assert response.status_code == 504
+    assert response.get_json()['error'] == 'timeout'
@@ -0,0 +1,107 @@
+import json
+import struct
+from fractions import Fraction
+
+import engines
+
+# NumPy dimuat saat pertama kali matriks dikodekan/didekodekan
+np = engines.lazy('numpy')
+
+# Format biner ringkas untuk matriks dan hasil (alternatif JSON + string berformat).
+#
+# Blok matriks: header 16 byte '<4sB3xII' = magic b'MTX1', jenis, baris, kolom,
+# lalu data little-endian, panjang blok selalu kelipatan 8 (padding nol):
+#   'f' float64, 'i' int64, 'r' int64 pembilang lalu int64 penyebut,
+#   't' teks (bilangan yang tidak muat int64): uint32 panjang byte, 4 byte nol,
+#       lalu elemen UTF-8 ("p" atau "p/q") dipisah '\n'.
+#
+# Pesan: header 16 byte '<4sIII' = magic b'MTXR', panjang total, panjang meta, jumlah blok,
+# lalu meta JSON (diberi spasi sampai kelipatan 8) dan blok-bloknya. Di meta, setiap
+# matriks diganti {"$block": k}. Stream biner adalah pesan-pesan yang disambung.
+
+MIMETYPE = 'application/x-matrix'
+STREAM_MIMETYPE = 'application/x-matrix-stream'
+
+_BLOCK = struct.Struct('<4sBxxxII')
+_MESSAGE = struct.Struct('<4sIII')
+_INT64_MIN, _INT64_MAX = -2**63, 2**63 - 1
+
+
+class Block(bytes):
+    """An encoded matrix block; json.dumps in encode_message turns it into a reference"""
+
+
+def _pad(data):
+    return data + b'\0' * (-len(data) % 8)
+
+
+def _value(x):
+    """int / Fraction for exact values (Python or SymPy), float otherwise"""
+    if type(x) is int or isinstance(x, Fraction):
+        return x
+    if getattr(x, 'is_Rational', False):
+        return Fraction(int(x.p), int(x.q))
+    if isinstance(x, np.integer):
+        return int(x)
+    return float(x)
+
+
+def encode_matrix(matrix):
+    """Encode a matrix (list of rows, SymPy Matrix or NumPy array) as one block"""
+    if isinstance(matrix, np.ndarray) and matrix.dtype.kind == 'f':
+        r, c = matrix.shape
+        return Block(_BLOCK.pack(b'MTX1', ord('f'), r, c) + matrix.astype('<f8').tobytes())
+    rows = matrix.tolist() if hasattr(matrix, 'tolist') else matrix
+    r, c = len(rows), len(rows[0]) if rows else 0
+    values = [_value(x) for row in rows for x in row]
+
+    if any(type(v) is float for v in values):
+        kind, data = 'f', np.array([float(v) for v in values], dtype='<f8').tobytes()
+    else:
+        nums = [v.numerator for v in values]
+        dens = [v.denominator for v in values]
+        if not all(_INT64_MIN <= v <= _INT64_MAX for v in nums + dens):
+            text = "\n".join(str(v) for v in values).encode('utf-8')
+            kind, data = 't', struct.pack('<I4x', len(text)) + text
+        elif all(d == 1 for d in dens):
+            kind, data = 'i', np.array(nums, dtype='<i8').tobytes()
+        else:
+            kind, data = 'r', np.array(nums, dtype='<i8').tobytes() + np.array(dens, dtype='<i8').tobytes()
+    return Block(_pad(_BLOCK.pack(b'MTX1', ord(kind), r, c) + data))
+
+
+def decode_matrix(buffer):
+    """
+    Decode one 'f' or 'i' block (an input matrix) into a NumPy array that
+    shares memory with buffer
+    """
+    if len(buffer) < _BLOCK.size:
+        raise ValueError("Data matriks biner terlalu pendek")
+    magic, kind, r, c = _BLOCK.unpack_from(buffer)
+    if magic != b'MTX1':
+        raise ValueError("Bukan matriks biner (magic MTX1)")
+    dtypes = {ord('f'): '<f8', ord('i'): '<i8'}
+    if kind not in dtypes:
+        raise ValueError("Input biner harus berjenis 'f' (float64) atau 'i' (int64)")
+    if r == 0 or c == 0 or len(buffer) < _BLOCK.size + r * c * 8:
+        raise ValueError(f"Ukuran data tidak sesuai dengan {r} x {c}")
+    return np.frombuffer(buffer, dtype=dtypes[kind], count=r * c, offset=_BLOCK.size).reshape(r, c)
+
+
+def encode_message(obj):
+    """
+    One message: obj as JSON metadata, with every Block value (from
+    encode_matrix) stored after it as raw data
+    """
+    blocks = []
+
+    def referensi(value):
+        if isinstance(value, Block):
+            blocks.append(value)
+            return {'$block': len(blocks) - 1}
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    meta = json.dumps(obj, default=referensi, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    meta += b' ' * (-len(meta) % 8)
+    total = _MESSAGE.size + len(meta) + sum(len(b) for b in blocks)
+    return b''.join([_MESSAGE.pack(b'MTXR', total, len(meta), len(blocks)), meta, *blocks])
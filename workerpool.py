@@ -0,0 +1,261 @@
+import inspect
+import multiprocessing
+import threading
+import time
+
+# Pool proses terbatas untuk perhitungan berat (SymPy memegang GIL, jadi satu input
+# besar di thread Flask ikut menahan semua request lain). Setiap pekerja adalah proses
+# berumur panjang yang menerima (fungsi, args, kwargs) lewat Pipe. Pekerja yang melewati
+# batas waktu atau dibatalkan (klien memutus stream) dimatikan dan diganti proses baru.
+
+
+class PoolError(Exception):
+    """Base class for errors reported with a machine-readable code"""
+
+    code = 'pool'
+    http_status = 500
+
+
+class JobTimeout(PoolError):
+    code = 'timeout'
+    http_status = 504
+
+
+class PoolBusy(PoolError):
+    code = 'busy'
+    http_status = 503
+
+
+def _worker_main(conn, initializer=None, initargs=()):
+    """Loop in the child process: run jobs until the pipe is closed"""
+    if initializer is not None:
+        # Pemanasan (misal impor mesin) sebelum pekerjaan pertama
+        initializer(*initargs)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        fn, args, kwargs = job
+        try:
+            result = fn(*args, **kwargs)
+            if inspect.isgenerator(result):
+                # Generator (misal langkah streaming) dikirim satu item per pesan
+                for item in result:
+                    conn.send(('item', item))
+                conn.send(('end', None))
+            else:
+                conn.send(('ok', result))
+        except Exception as e:
+            try:
+                conn.send(('error', e))
+            except Exception:
+                # Exception yang tidak bisa di-pickle
+                conn.send(('error', RuntimeError(str(e))))
+
+
+class _Worker:
+    def __init__(self, ctx, initializer=None, initargs=()):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child, initializer, initargs), daemon=True)
+        self.process.start()
+        child.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """
+    Bounded pool of worker processes with a wall-clock timeout per job.
+    processes=0 runs every job inline in the calling thread (no isolation,
+    no timeout), useful for development and debugging. initializer(*initargs)
+    runs once in every new worker before its first job.
+    """
+
+    def __init__(self, processes=2, timeout=30.0, queue_timeout=5.0, start_method='spawn',
+                 initializer=None, initargs=()):
+        self.processes = processes
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.initializer = initializer
+        self.initargs = initargs
+        self._ctx = multiprocessing.get_context(start_method)
+        self._slots = threading.BoundedSemaphore(max(processes, 1))
+        self._idle = []
+        self._lock = threading.Lock()
+        self._started = 0
+        self._busy = 0
+        self._waiting = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.busy_seconds = 0.0
+
+    # --- pengelolaan pekerja ---
+
+    def _acquire(self):
+        mulai = time.monotonic()
+        with self._lock:
+            self._waiting += 1
+            self.submitted += 1
+        ok = self._slots.acquire(timeout=self.queue_timeout)
+        with self._lock:
+            self._waiting -= 1
+            self.wait_seconds += time.monotonic() - mulai
+            if not ok:
+                self.rejected += 1
+                raise PoolBusy(f"Semua {self.processes} proses pekerja sedang sibuk, coba lagi nanti")
+            self._busy += 1
+            worker = self._idle.pop() if self._idle else None
+        if worker is None or not worker.process.is_alive():
+            if worker is not None:
+                worker.kill()
+            worker = self._spawn()
+        return worker, time.monotonic()
+
+    def _spawn(self):
+        worker = _Worker(self._ctx, self.initializer, self.initargs)
+        with self._lock:
+            self._started += 1
+        return worker
+
+    def _release(self, worker, mulai, keep=True):
+        if not keep:
+            worker.kill()
+            if self.initializer is not None:
+                # Pengganti langsung dibuat agar pemanasannya tidak jatuh ke request berikutnya
+                worker = self._spawn()
+                keep = True
+        with self._lock:
+            self._busy -= 1
+            self.busy_seconds += time.monotonic() - mulai
+            if keep:
+                self._idle.append(worker)
+        self._slots.release()
+
+    def prestart(self):
+        """Start the missing worker processes now instead of on the first jobs"""
+        if self.processes <= 0:
+            return
+        with self._lock:
+            kurang = self.processes - len(self._idle) - self._busy
+        for _ in range(kurang):
+            worker = self._spawn()
+            with self._lock:
+                self._idle.append(worker)
+
+    def _receive(self, worker, deadline):
+        if not worker.conn.poll(max(deadline - time.monotonic(), 0)):
+            raise JobTimeout(f"Perhitungan melebihi batas waktu {self.timeout:g} detik")
+        try:
+            return worker.conn.recv()
+        except EOFError:
+            raise PoolError("Proses pekerja berhenti tak terduga")
+
+    # --- menjalankan pekerjaan ---
+
+    def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) in a worker and return its result"""
+        if self.processes <= 0:
+            return fn(*args, **kwargs)
+        worker, mulai = self._acquire()
+        keep = False
+        try:
+            worker.conn.send((fn, args, kwargs))
+            kind, value = self._receive(worker, mulai + self.timeout)
+            keep = True
+            if kind == 'error':
+                with self._lock:
+                    self.failed += 1
+                raise value
+            with self._lock:
+                self.completed += 1
+            return value
+        except PoolError as e:
+            self._count_failure(e)
+            raise
+        finally:
+            self._release(worker, mulai, keep)
+
+    def stream(self, fn, *args, **kwargs):
+        """
+        Run a generator function in a worker and yield its items as they
+        arrive; the whole stream shares one timeout. Closing this generator
+        early (client disconnected) kills the worker.
+        """
+        if self.processes <= 0:
+            yield from fn(*args, **kwargs)
+            return
+        worker, mulai = self._acquire()
+        keep = False
+        try:
+            worker.conn.send((fn, args, kwargs))
+            while True:
+                kind, value = self._receive(worker, mulai + self.timeout)
+                if kind == 'item':
+                    yield value
+                    continue
+                keep = True
+                if kind == 'error':
+                    with self._lock:
+                        self.failed += 1
+                    raise value
+                with self._lock:
+                    self.completed += 1
+                return
+        except PoolError as e:
+            self._count_failure(e)
+            raise
+        except GeneratorExit:
+            with self._lock:
+                self.cancelled += 1
+            raise
+        finally:
+            self._release(worker, mulai, keep)
+
+    def _count_failure(self, e):
+        with self._lock:
+            if isinstance(e, JobTimeout):
+                self.timeouts += 1
+            else:
+                self.failed += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'processes': self.processes,
+                'started': self._started,
+                'busy': self._busy,
+                'idle': len(self._idle),
+                'waiting': self._waiting,
+                'timeout': self.timeout,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'failed': self.failed,
+                'timeouts': self.timeouts,
+                'cancelled': self.cancelled,
+                'rejected': self.rejected,
+                'wait_seconds': round(self.wait_seconds, 6),
+                'busy_seconds': round(self.busy_seconds, 6),
+            }
+
+    def shutdown(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(1)
+            if worker.process.is_alive():
+                worker.kill()